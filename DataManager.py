@@ -3,8 +3,20 @@ from EventStateManager import EventBus
 from database import SQLiteManager
 
 
+# Marker paths by marker code, shared by all data point columns
+marker_path_cache = {}
+
+
+def get_marker_path(marker):
+    if marker not in marker_path_cache:
+        marker_style = MarkerStyle(marker)
+        marker_path_cache[marker] = marker_style.get_path().transformed(marker_style.get_transform())
+    return marker_path_cache[marker]
+
+
 class DataManager:
     _instance = None
+    IMPORT_CHUNK_ROWS = 100000  # Rows per chunk when streaming a CSV import
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -182,6 +194,7 @@ class DataManager:
                 'update': 'Off',
                 'last_update_check': '',
                 'last_vacuum': 0,
+                'compact_series_storage': False,  # Store local chart series as packed blobs
                 'version': '',
             }
 
@@ -239,6 +252,7 @@ class DataManager:
             self.event_bus = EventBus()
             self.file_manager = FileManager(self)
             self.sqlite_manager = SQLiteManager(self)
+            self.agg_engine = AggregationEngine(self)
 
             # Control variables
             self.initialized = True  # Set this attribute after initializing
@@ -293,6 +307,7 @@ class DataManager:
             # Add the new consolidated row to df
             new_df_row = pd.DataFrame([new_row])
             self.df_raw = pd.concat([self.df_raw, new_df_row], ignore_index=True)
+            self.agg_engine.append_rows(self.df_raw, new_df_row)
 
         # Update plot_column dict
         for user_col, sys_col in zip(data['user_col'], data['sys_col']):
@@ -301,17 +316,17 @@ class DataManager:
                 # If new column
                 self.plot_columns[user_col] = self.event_bus.emit('get_data_point_column', {'sys_col': sys_col, 'user_col': user_col})
 
-        # Update agg dfs for all involved columns
+        # Update agg dfs for all involved columns, only patching the new entry into existing plots
         plot_column_keys_except_floor = [v for k, v in column_map.items() if k not in ['d', 'm']]
         for user_col in plot_column_keys_except_floor:
-            self.plot_columns[user_col].refresh_view()
+            self.plot_columns[user_col].update_view([new_row['d']])
 
         # # Refresh minute column if needed
         if is_minute_chart:
             minute_col_name = column_map['m']
             if minute_col_name not in self.plot_columns.keys():
                 self.plot_columns[minute_col_name] = self.event_bus.emit('get_data_point_column', {'sys_col': 'm', 'user_col': minute_col_name})
-            self.plot_columns[minute_col_name].refresh_view()
+            self.plot_columns[minute_col_name].update_view([new_row['d']])
 
         # Refresh chart and save (only once)
         self.event_bus.emit('update_legend')
@@ -477,6 +492,48 @@ class DataManager:
 
         return value_str
 
+    def _complete_partial_dates(self, values):
+        # Vectorized _complete_partial_date, values the fast paths can't decide exactly go through the scalar version
+        values = values.astype(str).str.strip()
+        result = values.copy()
+
+        # Full dates have two separators, only values with fewer can be partial
+        candidates = values[values.str.count(r'[-/.]') <= 1]
+        if candidates.empty:
+            return result
+
+        # Year-only format
+        years = candidates.str.fullmatch(r'[0-9]{4}')
+        year_values = candidates[years].astype(int)
+        year_values = year_values[year_values.between(pd.Timestamp.min.year, pd.Timestamp.max.year)]
+        result[year_values.index] = year_values.astype(str) + '-12-31'
+
+        # YYYY/MM and MM/YYYY, kept clear of the first and last valid years where month ends can overflow
+        for pattern, year_group, month_group in [(r'([0-9]{4})[-/.]([0-9]{1,2})', 0, 1), (r'([0-9]{1,3})[-/.]([0-9]{4})', 1, 0)]:
+            parts = candidates.str.extract(f'^{pattern}$').dropna()
+            year = parts[year_group].astype(int)
+            month = parts[month_group].astype(int)
+            valid = month.between(1, 12) & year.between(pd.Timestamp.min.year + 1, pd.Timestamp.max.year - 1)
+            month_starts = pd.to_datetime(pd.DataFrame({'year': year[valid], 'month': month[valid], 'day': 1}))
+            result[month_starts.index] = (month_starts + pd.offsets.MonthEnd(1)).dt.strftime('%Y-%m-%d')
+            candidates = candidates.drop(month_starts.index)
+
+        # Everything else that could be partial, each distinct value once
+        residual = candidates.drop(year_values.index, errors='ignore')
+        residual = residual[(residual.str.count(r'[-/.]') == 1) | (residual.str.len() == 4)]
+        if not residual.empty:
+            result[residual.index] = residual.map({value: self._complete_partial_date(value) for value in residual.unique()})
+
+        return result
+
+    def _clean_import_values(self, values):
+        # Numeric values, anything unparseable or negative becomes NaN
+        if values.dtype == 'object':  # Only for string columns
+            values = values.astype(str).str.strip()
+
+        values = pd.to_numeric(values, errors='coerce')
+        return values.mask(values < 0)
+
     def _validate_column_map(self, df):
         column_map = {} if not isinstance(self.chart_data['column_map'], dict) else self.chart_data['column_map']
         chart_type = self.event_bus.emit("get_chart_data", ['type', 'Daily'])
@@ -513,6 +570,23 @@ class DataManager:
 
             return df
 
+    def iter_data_file_chunks(self, file_path, usecols=None):
+        # Yields (df, fraction of file read), CSV files are streamed in chunks, Excel and ODS are read at once
+        if Path(file_path).suffix in ['.xlsx', '.xls', '.ods']:
+            try:
+                yield pd.read_excel(file_path, usecols=usecols), 1.0
+                return
+            except Exception:
+                pass
+
+        file_size = max(os.path.getsize(file_path), 1)
+        try:
+            with open(file_path, 'rb') as handle:
+                for chunk in pd.read_csv(handle, usecols=usecols, chunksize=self.IMPORT_CHUNK_ROWS):
+                    yield chunk, min(handle.tell() / file_size, 1.0)
+        except Exception:
+            raise Warning('Failed to read data file.')
+
     def column_mapped_raw_data_import(self, file_path):
         # Read data sample
         df = self.get_df_from_data_file(file_path, row_limit=20)
@@ -530,70 +604,81 @@ class DataManager:
                 print('Column map rejected.')
                 return False
 
-        # df approved, read all data
-        df = self.get_df_from_data_file(file_path, row_limit=None)
+        # df approved, only read columns that survive the import
+        column_map = self.event_bus.emit("get_chart_data", ['column_map', {}])
+        user_cols = set(column_map.values())
+        keep_col = lambda col: col in user_cols or col in ['m', 'c', 'i', 'd'] or bool(re.match(r'^o\d+$', str(col)))
 
+        date_format = self.event_bus.emit("get_chart_data", ['date_format', None])
+        chunks = []
+        self.event_bus.emit('raw_data_import_progress', 0.0)
+        try:
+            for df, progress in self.iter_data_file_chunks(file_path, usecols=keep_col):
+                # Later chunks are parsed with the date format inferred from the first dates, as in a single read
+                df, date_format = self._clean_raw_data_chunk(df, column_map, date_format)
+                chunks.append(df)
+                self.event_bus.emit('raw_data_import_progress', progress)
+        finally:
+            self.event_bus.emit('raw_data_import_progress', 1.0)  # Also closes progress if the import failed
+
+        if not chunks:
+            raise Warning('Failed to read data file.')
+        df = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+        # Add to column map as well
+        if 'm' not in column_map.keys():
+            self.event_bus.emit("update_chart_data", [['column_map', 'm'], 'minutes'])
+
+        # Remove rows where all values are NaN
+        df = df.dropna(how='all').reset_index(drop=True)
+
+        # Store imported raw data (also clears any previous data points)
+        self.df_raw = df
+
+        return True
+
+    def _clean_raw_data_chunk(self, df, column_map, date_format):
         # Rename user column names to system column names
-        column_map = self.event_bus.emit("get_chart_data", ['column_map', {}])
         df = df.rename(columns=dict(zip(column_map.values(), column_map.keys())))
 
         # Add missing columns if any
         if 'm' not in df.columns:
             df['m'] = 1
-            # Add to column map as well
-            if 'm' not in column_map.keys():
-                self.event_bus.emit("update_chart_data", [['column_map', 'm'], 'minutes'])
 
         # Drop all non-system columns
         o_cols = [col for col in df.columns if re.match(r'^o\d+$', col)]
         standard_cols = [col for col in df.columns if col in ['m', 'c', 'i', 'd']]
         data_cols = standard_cols + o_cols
-        df = df[data_cols]
-
-        # Clean columns misc
-        for col in [c for c in df.columns if c.startswith('o')]:
-
-            # Strip whitespace before numeric conversion
-            if df[col].dtype == 'object':  # Only for string columns
-                df[col] = df[col].astype(str).str.strip()
-
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-            df[col] = df[col].apply(lambda x: np.nan if x < 0 else x)
+        df = df[data_cols].copy()
 
-        # Clean standard columns
-        for col in ['c', 'i', 'm']:
+        # Clean value columns
+        for col in ['c', 'i', 'm'] + o_cols:
             if col in df.columns:
-                # Strip whitespace before numeric conversion
-                if df[col].dtype == 'object':  # Only for string columns
-                    df[col] = df[col].astype(str).str.strip()
-
-                df.loc[:, col] = pd.to_numeric(df[col], errors='coerce')
-                df.loc[:, col] = df[col].apply(lambda x: np.nan if x < 0 else x)
+                df[col] = self._clean_import_values(df[col])
 
         # Convert 'd' column to datetime if not already in datetime format
-        date_format = self.event_bus.emit("get_chart_data", ['date_format', None])
         if not pd.api.types.is_datetime64_any_dtype(df['d']):
 
             # If dates are incomplete
-            df['d'] = df['d'].astype(str).apply(self._complete_partial_date)
+            dates = self._complete_partial_dates(df['d'])
+
+            # Infer the format from the first date, like pd.to_datetime does for the whole column
+            if date_format is None:
+                non_null = dates[~dates.isin(['', 'now', 'today', 'nan', 'NaN', 'NAN', 'NaT', 'nat', 'NAT'])]
+                if not non_null.empty:
+                    date_format = guess_datetime_format(non_null.iloc[0]) or 'mixed'
 
             # Replace any invalid dates with NaN, then drop them
             try:
-                df.loc[:, 'd'] = pd.to_datetime(df['d'], format=date_format, errors='coerce')
+                df['d'] = pd.to_datetime(dates, format=date_format, errors='coerce')
             except ValueError:
-                df['d'] = pd.to_datetime(df['d'], errors='coerce').dt.date
+                df['d'] = pd.to_datetime(dates, errors='coerce').dt.date
             df = df.dropna(subset=['d'])
 
         df['d'] = pd.to_datetime(df['d'])
         df['d'] = df['d'].dt.tz_localize(None)  # Remove timezone info
 
-        # Remove rows where all values are NaN
-        df = df.dropna(how='all').reset_index(drop=True)
-
-        # Store imported raw data (also clears any previous data points)
-        self.df_raw = df
-
-        return True
+        return df, date_format
 
     def default_chart_assessment(self):
         recent_charts = self.event_bus.emit("get_user_preference", ['recent_charts', []])
@@ -818,6 +903,264 @@ class DataManager:
         return start_date
 
 
+class AggregationEngine:
+    # Shared calendar aggregation for all data point columns. df_raw is parsed once
+    # into a typed frame, snap bins are computed once per chart, and every column is
+    # aggregated in the same vectorized pass. Results are cached until df_raw, the
+    # chart type or the chart date mapping is replaced. Appended rows only update
+    # the calendar buckets they fall in, or add buckets at either end.
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+
+        # Parsed raw data
+        self.raw_source = None
+        self.raw_is_minute = None
+        self.df_values = None
+        self.df_values_sorted = None
+        self.sys_cols = []
+
+        # Snap bins
+        self.bins_source = None
+        self.bin_edges = None
+
+        # Aggregated frames for all columns, keyed by (calendar unit, agg type)
+        self.agg_cache = {}
+
+    def invalidate(self):
+        self.raw_source = None
+        self.agg_cache = {}
+
+    def get_column(self, sys_col, calendar_unit, agg_type, date_to_x):
+        self._ensure_values()
+        self._ensure_bins(date_to_x)
+
+        # Necessary when adding new column and previous data already exist
+        if sys_col not in self.sys_cols and sys_col != 'm':
+            self._add_zero_column(sys_col)
+
+        key = (calendar_unit[0], agg_type)
+        if key not in self.agg_cache:
+            self.agg_cache[key] = self._aggregate_all(calendar_unit[0], agg_type)
+
+        return self._slice_column(self.agg_cache[key], sys_col)
+
+    def append_rows(self, df_raw, df_new):
+        # Patch the cache after df_new was appended to the previous df_raw
+        prev_raw = self.raw_source
+        is_minute = 'Minute' in self.data_manager.chart_data['type']
+        can_patch = (prev_raw is not None and prev_raw.size > 0 and self.df_values is not None
+                     and is_minute == self.raw_is_minute
+                     and len(prev_raw) + len(df_new) == len(df_raw)
+                     and set(df_new.columns) <= set(prev_raw.columns))
+        if not can_patch:
+            self.invalidate()
+            return
+
+        prev_min, prev_max = self.df_values['d'].min(), self.df_values['d'].max()
+        new_values = self._parse_values(df_new.reindex(columns=prev_raw.columns), is_minute)
+        for col in self.sys_cols:
+            if col not in new_values.columns:
+                new_values[col] = 0.0
+                new_values[col + '_total'] = 0.0
+
+        self.raw_source = df_raw
+        self.df_values = pd.concat([self.df_values, new_values[self.df_values.columns]], ignore_index=True)
+        self.df_values_sorted = None
+
+        for key in list(self.agg_cache.keys()):
+            if not self._patch_cached(key, new_values, prev_min, prev_max):
+                del self.agg_cache[key]
+
+    def get_chart_dates(self, dates, calendar_unit, agg_type):
+        # Chart dates that the given raw dates end up on after aggregation and snapping
+        dates = pd.to_datetime(pd.Series(dates))
+        if agg_type != 'raw':
+            dates = dates.dt.to_period(calendar_unit[0]).dt.end_time.dt.normalize()
+        return [pd.Timestamp(date) for date in self._snap(dates.to_numpy(dtype='datetime64[ns]')) if not np.isnat(date)]
+
+    def _ensure_values(self):
+        df_raw = self.data_manager.df_raw
+        is_minute = 'Minute' in self.data_manager.chart_data['type']
+        if df_raw is self.raw_source and is_minute == self.raw_is_minute:
+            return
+
+        self.raw_source = df_raw
+        self.raw_is_minute = is_minute
+        self.agg_cache = {}
+        self.df_values_sorted = None
+
+        # If rows x columns is zero (no data whatsoever)
+        if df_raw is None or df_raw.size == 0:
+            self.sys_cols = []
+            self.df_values = pd.DataFrame({'d': pd.Series(dtype='datetime64[ns]'),
+                                           'm': pd.Series(dtype='float64'),
+                                           'm_floor': pd.Series(dtype='float64'),
+                                           'm_total': pd.Series(dtype='float64')})
+            return
+
+        self.sys_cols = [col for col in df_raw.columns if col not in ['d', 'm']]
+        self.df_values = self._parse_values(df_raw, is_minute)
+
+    def _parse_values(self, df_raw, is_minute):
+        minutes = df_raw['m'].astype('float64').to_numpy() if 'm' in df_raw.columns else np.ones(len(df_raw))
+        values = {'d': pd.to_datetime(df_raw['d']).to_numpy(dtype='datetime64[ns]'), 'm': minutes}
+
+        # Counts are stored as frequencies on minute charts, totals are kept as is
+        for col in [c for c in df_raw.columns if c not in ['d', 'm']]:
+            counts = df_raw[col].astype('float64').to_numpy()
+            values[col] = counts / minutes if is_minute else counts
+            values[col + '_total'] = counts
+
+        # Floor column
+        values['m_floor'] = 1 / minutes if is_minute else minutes
+        values['m_total'] = minutes
+
+        return pd.DataFrame(values)
+
+    def _add_zero_column(self, sys_col):
+        self.sys_cols.append(sys_col)
+        self.agg_cache = {}
+        self.df_values[sys_col] = 0.0
+        self.df_values[sys_col + '_total'] = 0.0
+        self.df_values_sorted = None
+
+    def _ensure_bins(self, date_to_x):
+        if date_to_x is self.bins_source:
+            return
+
+        self.bins_source = date_to_x
+        self.agg_cache = {}
+        date_keys = np.array(sorted(date_to_x.keys()), dtype='datetime64[ns]')
+        self.bin_edges = date_keys.view('int64')
+
+    def _aggregate_all(self, calendar_unit, agg_type):
+        df = self.df_values
+
+        if agg_type != 'raw' and not df.empty:
+            # Sort once for all calendar groupings, raw order is kept for the raw view
+            if self.df_values_sorted is None:
+                self.df_values_sorted = df.sort_values('d', kind='stable').set_index('d')
+                self.df_values_sorted['point_count'] = 1
+
+            df = self.df_values_sorted
+            agg_dict = {col: 'sum' if col.endswith('_total') or col == 'point_count' else agg_type for col in df.columns}
+            df = df.resample(calendar_unit).agg(agg_dict).reset_index()
+            df['period'] = df['d']
+        elif agg_type != 'raw':
+            df = df.assign(point_count=pd.Series(dtype='int64'), period=df['d'])
+
+        # Snap dates to the left edge of their chart bin, dropping dates outside the chart
+        snapped = self._snap(df['d'].to_numpy(dtype='datetime64[ns]'))
+        in_range = ~np.isnat(snapped)
+
+        df = df.loc[in_range].copy()
+        df['d'] = snapped[in_range]
+
+        return df.reset_index(drop=True)
+
+    def _snap(self, dates):
+        bin_idx = np.searchsorted(self.bin_edges, dates.view('int64'), side='right') - 1
+        in_range = (bin_idx >= 0) & (bin_idx < len(self.bin_edges) - 1)
+        snapped = np.full(len(dates), np.datetime64('NaT'), dtype='datetime64[ns]')
+        snapped[in_range] = self.bin_edges[bin_idx[in_range]].view('datetime64[ns]')
+        return snapped
+
+    def _patch_cached(self, key, new_values, prev_min, prev_max):
+        calendar_unit, agg_type = key
+        df = self.agg_cache[key]
+
+        if agg_type == 'raw':
+            snapped = self._snap(new_values['d'].to_numpy(dtype='datetime64[ns]'))
+            in_range = ~np.isnat(snapped)
+            df_new = new_values.loc[in_range].copy()
+            df_new['d'] = snapped[in_range]
+            self.agg_cache[key] = pd.concat([df, df_new], ignore_index=True)
+            return True
+
+        dates = new_values['d']
+        if dates.isna().any() or (dates != dates.dt.normalize()).any():
+            return False
+        periods = dates.dt.to_period(calendar_unit)
+        prev_min_period, prev_max_period = prev_min.to_period(calendar_unit), prev_max.to_period(calendar_unit)
+
+        # Recompute only the buckets inside the previous range that received new rows
+        all_dates = self.df_values['d']
+        total_cols = [col for col in self.df_values.columns if col.endswith('_total')]
+        value_cols = [col for col in self.df_values.columns if col != 'd' and col not in total_cols]
+        col_pos = df.columns.get_indexer(total_cols + value_cols + ['point_count'])
+        inside = (periods >= prev_min_period) & (periods <= prev_max_period)
+        for period in periods[inside].unique():
+            row_pos = np.flatnonzero(df['period'].to_numpy() == period.end_time.normalize().to_datetime64())
+            if len(row_pos) == 0:
+                continue  # Bucket is outside the chart
+
+            bucket = self.df_values.loc[(all_dates >= period.start_time) & (all_dates <= period.end_time)]
+            agg_row = np.concatenate([bucket[total_cols].sum().to_numpy(),
+                                      getattr(bucket[value_cols], agg_type)().to_numpy(),
+                                      [len(bucket)]])
+            df.iloc[row_pos[0], col_pos] = agg_row
+
+        # Buckets before or after the previous range only hold new rows, they are added with the empty buckets in between
+        if not inside.all():
+            leading = self._aggregate_new_buckets(new_values.loc[(periods < prev_min_period).to_numpy()], df, key,
+                                                  periods.min(), prev_min_period - 1)
+            trailing = self._aggregate_new_buckets(new_values.loc[(periods > prev_max_period).to_numpy()], df, key,
+                                                   prev_max_period + 1, periods.max())
+            self.agg_cache[key] = pd.concat([leading, df, trailing], ignore_index=True)
+
+        return True
+
+    def _aggregate_new_buckets(self, new_values, df, key, first_period, last_period):
+        # Aggregate rows into every bucket from first_period to last_period, shaped like the cached frame df
+        calendar_unit, agg_type = key
+        if first_period > last_period:
+            return df.iloc[:0]
+
+        labels = pd.period_range(first_period, last_period).end_time.normalize().to_numpy(dtype='datetime64[ns]')
+        snapped = self._snap(labels)
+        in_range = ~np.isnat(snapped)
+        if not in_range.any():
+            return df.iloc[:0]
+
+        total_cols = [col for col in self.df_values.columns if col.endswith('_total')]
+        value_cols = [col for col in self.df_values.columns if col != 'd' and col not in total_cols]
+
+        # Empty buckets get what resample gives them, zero sums and counts, no value unless summed
+        empty_value = 0.0 if agg_type == 'sum' else np.nan
+        values = np.full((len(labels), len(total_cols) + len(value_cols) + 1), empty_value)
+        values[:, :len(total_cols)] = 0.0
+        values[:, -1] = 0.0
+
+        row_labels = new_values['d'].dt.to_period(calendar_unit).dt.end_time.dt.normalize().to_numpy(dtype='datetime64[ns]')
+        for label in np.unique(row_labels):
+            bucket = new_values.loc[row_labels == label]
+            values[np.searchsorted(labels, label)] = np.concatenate([bucket[total_cols].sum().to_numpy(),
+                                                                     getattr(bucket[value_cols], agg_type)().to_numpy(),
+                                                                     [len(bucket)]])
+
+        df_new = pd.DataFrame(values[in_range], columns=total_cols + value_cols + ['point_count'])
+        df_new['d'] = snapped[in_range]
+        df_new['period'] = labels[in_range]
+
+        return df_new[df.columns].astype(df.dtypes.to_dict())
+
+    def _slice_column(self, df, sys_col):
+        if sys_col == 'm':
+            columns = {'d': df['d'], 'm': df['m_floor'], 'm_total': df['m_total']}
+        else:
+            columns = {'d': df['d'], 'm': df['m'], sys_col: df[sys_col], sys_col + '_total': df[sys_col + '_total']}
+        if 'point_count' in df.columns:
+            columns['point_count'] = df['point_count']
+
+        df_col = pd.DataFrame(columns).dropna().reset_index(drop=True)
+
+        # Add zero counts mask
+        df_col['not_zero_counts'] = ~(df_col[sys_col].isna() | (df_col[sys_col] == 0))
+
+        return df_col
+
+
 class DataPointColumn:
     def __init__(self, ax, date_to_x, x_to_day_count, sys_col, user_col, view_settings=None):
         # Classes
@@ -875,49 +1218,14 @@ class DataPointColumn:
         self.is_highlighting = False
         self.column_line_objects = []
         self.column_marker_objects = []
+        self.column_marker_groups = []  # Marker code of each scatter in column_marker_objects
         self.trend_sets = []
 
     def agg_data_column(self):
-        # Copy latest raw df from data manager
-        self.df_raw = self.data_manager.df_raw.copy()
-
-        # # If rows x columns is zero (no data whatsoever)
-        if self.df_raw.size == 0:
-            columns = ['d', 'm', self.sys_col] if self.sys_col != 'm' else ['d', 'm']
-            self.df_raw = pd.DataFrame(columns=columns)
-        else:
-            # Necessary when adding new column and previous data already exist
-            if self.sys_col not in self.df_raw.columns:
-                self.df_raw[self.sys_col] = 0
-
-        # Ensure consistent datetime conversion
-        self.df_raw['d'] = pd.to_datetime(self.df_raw['d'])
-
-        # Ensure 'm' column exists
-        if 'm' not in self.df_raw.columns:
-            self.df_raw['m'] = 1
-
-        # Filter columns based on sys_col
-        col_filter = ["m", "d", self.sys_col] if self.sys_col != 'm' else ['d', 'm']
-        self.df_raw = self.df_raw[col_filter]
-
-        # Initialize aggregated dataframe
-        df_agg = self.df_raw.copy()
-
-        # Convert sys_col to float to allow division for frequency calculation
-        df_agg[self.sys_col] = df_agg[self.sys_col].astype('float64')
-
+        # Calendar aggregation is shared between all columns and cached by the engine
         agg_type = self.view_settings['agg_type']
         calendar_unit = self.view_settings['calendar_group']
-
-        # Calculate frequency values
-        df_agg[self.sys_col + '_total'] = df_agg[self.sys_col]  # Add separate total count column
-        chart_type = self.data_manager.event_bus.emit("get_chart_data", ['type', 'Daily'])
-        if 'Minute' in chart_type:
-            self._calculate_frequency(df_agg)
-
-        # Perform calendar aggregation
-        df_agg = self._aggregate_by_calendar(df_agg, calendar_unit, agg_type)
+        df_agg = self.data_manager.agg_engine.get_column(self.sys_col, calendar_unit, agg_type, self.date_to_x)
 
         # Handle zero counts if not floor column
         if self.sys_col != 'm':
@@ -927,48 +1235,16 @@ class DataPointColumn:
         df_agg = self._apply_styling(df_agg)
 
         # Add x values
-        df_agg.loc[:, 'x'] = pd.to_datetime(df_agg['d']).map(self.date_to_x)
+        df_agg.loc[:, 'x'] = df_agg['d'].map(self.date_to_x)
 
         return df_agg
 
-    def _calculate_frequency(self, df):
-        if self.sys_col != 'm':
-            df.loc[:, self.sys_col] = (df[self.sys_col] / df['m'])
-        else:
-            df.loc[:, self.sys_col] = (1 / df['m'])
-
     def _handle_zero_counts(self, df):
         m = df['m'] if 'Minute' in self.data_manager.chart_data['type'] else 1
         if self.data_manager.event_bus.emit("get_chart_data", ['place_below_floor', True]):
             df.loc[:, self.sys_col] = np.where(df[self.sys_col] == 0, (1 / m) * 0.8, df[self.sys_col])
         else:
-            df.loc[:, self.sys_col] = df[self.sys_col].apply(lambda x: np.nan if x == 0 else x)
-
-    def _aggregate_by_calendar(self, df, calendar_unit, agg_type):
-        df = df.copy()  # Eliminates SettingWithCopyWarning
-
-        if agg_type != 'raw':
-            df['d'] = pd.to_datetime(df['d'])
-            df['point_count'] = 1
-            df = df.set_index('d')
-            agg_dict = {col: 'sum' if '_total' in col or col == 'point_count' else agg_type for col in df.columns}
-            df = df.resample(calendar_unit[0]).agg(agg_dict).reset_index()
-
-        # Snap dates and clean up
-        date_keys = sorted(list(self.date_to_x.keys()))
-        bins = pd.cut(df['d'], bins=date_keys, right=False, labels=date_keys[:-1])
-        df['d'] = bins
-        df.dropna(subset=['d'], inplace=True)
-        df = df.dropna()
-        df.reset_index(drop=True, inplace=True)
-
-        df['d'] = df['d'].astype(str)  # Get out of categorical type
-        df['d'] = pd.to_datetime(df['d'])  # Now convert to datetime
-
-        # Add zero counts mask
-        df['not_zero_counts'] = ~(df[self.sys_col].isna() | (df[self.sys_col] == 0))
-
-        return df
+            df.loc[:, self.sys_col] = df[self.sys_col].where(df[self.sys_col] != 0, np.nan)
 
     def _apply_styling(self, df):
         y_style = self.style_type_map[self.sys_col[0]]
@@ -1084,50 +1360,82 @@ class DataPointColumn:
         return metrics
 
     def plot(self):
-        x = self.df_agg['x']
-        y = self.df_agg[self.sys_col]
         self.load_styles()
 
-        # Plot line by line without markers
-        df_agg_median = self.df_agg.copy().groupby('x').first().reset_index()
-        for i in range(len(df_agg_median) - 1):
-            corr_points = self.ax.plot(df_agg_median['x'][i:i + 2],
-                                       df_agg_median[self.sys_col][i:i + 2],
-                                       linestyle=df_agg_median.loc[i, 'line_styles'],
-                                       color=df_agg_median.loc[i, 'line_colors'],
-                                       linewidth=df_agg_median.loc[i, 'line_width'])
-            self.column_line_objects.append(corr_points[0])
+        # Plot all line segments as one collection, styled segment by segment
+        segments, line_styles, line_colors, line_widths = self._get_line_segments()
+        corr_lines = LineCollection(segments,
+                                    linestyles=line_styles,
+                                    colors=line_colors,
+                                    linewidths=line_widths,
+                                    zorder=2)
+        self.ax.add_collection(corr_lines)
+        self.column_line_objects.append(corr_lines)
 
         # Add chart markers
-        corr_scatter = self.ax.scatter(
-            x,
-            y,
-            zorder=3,
-            facecolors=self.df_agg['face_colors'],
-            edgecolors=self.df_agg['edge_colors'],
-            marker='o',  # Placeholder, revising this with MarkerStyle
-            s=self.df_agg['marker_sizes']
-        )
+        self._plot_markers()
+
+    def _plot_markers(self):
+        marker_groups = list(self.df_agg.groupby('markers', sort=False))
+
+        # Same distinct markers as plotted, move and restyle the existing scatters in place
+        if self.column_marker_objects and [marker for marker, _ in marker_groups] == self.column_marker_groups:
+            for corr_scatter, (marker, df_marker) in zip(self.column_marker_objects, marker_groups):
+                corr_scatter.set_offsets(np.column_stack([df_marker['x'], df_marker[self.sys_col]]))
+                corr_scatter.set_sizes(df_marker['marker_sizes'].to_numpy(dtype=float))
+                corr_scatter.set_facecolors(df_marker['face_colors'].tolist())
+                corr_scatter.set_edgecolors(df_marker['edge_colors'].tolist())
+            return
+
+        for marker in self.column_marker_objects:
+            marker.remove()
+        self.column_marker_objects = []
+        self.column_marker_groups = [marker for marker, _ in marker_groups]
+
+        # One scatter per distinct marker, all sharing the cached marker path
+        for marker, df_marker in marker_groups:
+            corr_scatter = self.ax.scatter(
+                df_marker['x'],
+                df_marker[self.sys_col],
+                zorder=3,
+                facecolors=df_marker['face_colors'],
+                edgecolors=df_marker['edge_colors'],
+                marker='o',  # Placeholder, revising this with the cached marker path
+                s=df_marker['marker_sizes']
+            )
+            corr_scatter.set_paths([get_marker_path(marker)])
+            corr_scatter.set_visible(self.view_settings.get('data', True))
+            self.column_marker_objects.append(corr_scatter)
+
+    def _get_line_segments(self):
+        # One segment between each pair of adjacent x positions, styled by its first point
+        df_agg_median = self.df_agg.groupby('x').first().reset_index()
+        xy = df_agg_median[['x', self.sys_col]].to_numpy(dtype=float)
+        segments = np.stack([xy[:-1], xy[1:]], axis=1)
 
-        # Selectively set marker styles
-        corr_scatter.set_paths([MarkerStyle(marker).get_path().transformed(MarkerStyle(marker).get_transform()) for marker in self.df_agg['markers']])
-        self.column_marker_objects.append(corr_scatter)
+        styles = df_agg_median.iloc[:-1]
+        line_styles = styles['line_styles'].tolist()
+        line_widths = styles['line_width'].to_numpy(dtype=float)
+
+        # Collections do not accept the empty NoLine style, hide those segments instead
+        no_line = np.array([style in ['', 'None', ' '] for style in line_styles], dtype=bool)
+        line_styles = ['-' if hidden else style for style, hidden in zip(line_styles, no_line)]
+        line_widths = np.where(no_line, 0, line_widths)
+
+        return segments, line_styles, styles['line_colors'].tolist(), line_widths
 
     def update_style(self):
-        # Update line styles
-        df_agg_median = self.df_agg.copy().groupby('x').first().reset_index()
-        for i, line in enumerate(self.column_line_objects):
-            if i < len(df_agg_median) - 1:  # Check to prevent index errors
-                line.set_linestyle(df_agg_median.loc[i, 'line_styles'])
-                line.set_color(df_agg_median.loc[i, 'line_colors'])
-                line.set_linewidth(df_agg_median.loc[i, 'line_width'])
-
-        # Update markers
-        scatter = self.column_marker_objects[0]
-        scatter.set_facecolors(self.df_agg['face_colors'])
-        scatter.set_edgecolors(self.df_agg['edge_colors'])
-        scatter.set_sizes(self.df_agg['marker_sizes'])
-        scatter.set_paths([MarkerStyle(m).get_path().transformed(MarkerStyle(m).get_transform()) for m in self.df_agg['markers']])
+        # Update line segments and styles
+        segments, line_styles, line_colors, line_widths = self._get_line_segments()
+        for line_collection in self.column_line_objects:
+            line_collection.set_segments(segments)
+            if len(segments) > 0:
+                line_collection.set_linestyle(line_styles)
+                line_collection.set_color(line_colors)
+                line_collection.set_linewidth(line_widths)
+
+        # Update markers, scatters are only rebuilt if the distinct markers changed
+        self._plot_markers()
 
     def load_styles(self):
         chart_data = self.data_manager.chart_data
@@ -1184,28 +1492,69 @@ class DataPointColumn:
             trend_type = self.trend_type_map[self.sys_col[0]]
             for trend in self.data_manager.chart_data[trend_type]:
                 if 'user_col' in trend.keys() and trend['user_col'] == self.user_col:
-                    result = self.plot_cel_trend(
-                        date1=datetime.strptime(trend['date1'], self.data_manager.standard_date_string),
-                        date2=datetime.strptime(trend['date2'], self.data_manager.standard_date_string),
-                        fit_method=trend['fit_method'],
-                        forecast=trend['forward_projection'],
-                        bounce_envelope=trend['bounce_envelope'],
-                        trend_data=trend,
-                    )
+                    result = self._replot_cel_trend(trend)
                     if result:
-                        trend_elements, trend_data = result
-                        self.save_trend(trend_elements, trend_data)
-
-                        # Make the cel label draggable
-                        self.event_bus.emit('make_draggable', data={
-                            'objects': trend_elements['cel_label'],
-                            'save_obj': trend_data,
-                            'save_event': 'save_cel_label_pos'
-                        })
+                        self.save_trend(*result)
                 else:
                     # Necessary index alignment when selectively deleting
                     self.save_trend(None, None)
 
+    def _replot_cel_trend(self, trend):
+        result = self.plot_cel_trend(
+            date1=datetime.strptime(trend['date1'], self.data_manager.standard_date_string),
+            date2=datetime.strptime(trend['date2'], self.data_manager.standard_date_string),
+            fit_method=trend['fit_method'],
+            forecast=trend['forward_projection'],
+            bounce_envelope=trend['bounce_envelope'],
+            trend_data=trend,
+        )
+        if result:
+            trend_elements, trend_data = result
+
+            # Make the cel label draggable
+            self.event_bus.emit('make_draggable', data={
+                'objects': trend_elements['cel_label'],
+                'save_obj': trend_data,
+                'save_event': 'save_cel_label_pos'
+            })
+
+        return result
+
+    def _refit_cel_trends(self, new_dates):
+        if self.sys_col[0] not in self.trend_type_map:
+            return
+
+        trend_list = self.data_manager.chart_data[self.trend_type_map[self.sys_col[0]]]
+        if len(trend_list) != len(self.trend_sets):
+            # Indexes are out of alignment, replot all trends
+            while self.trend_sets:
+                self.remove_trend(0, delete_from_json=False)
+            self.replot_cel_trends()
+            return
+
+        # Only refit trends spanning the chart dates that received new data
+        chart_dates = self.data_manager.agg_engine.get_chart_dates(new_dates, self.view_settings['calendar_group'], self.view_settings['agg_type'])
+        for idx, trend in enumerate(trend_list):
+            if trend.get('user_col') != self.user_col:
+                continue
+            date1 = datetime.strptime(trend['date1'], self.data_manager.standard_date_string)
+            date2 = datetime.strptime(trend['date2'], self.data_manager.standard_date_string)
+            start_date, end_date = min(date1, date2), max(date1, date2)
+            if not any(start_date <= date <= end_date for date in chart_dates):
+                continue
+
+            trend_elements = self.trend_sets[idx][0]
+            if isinstance(trend_elements, dict):
+                for element in trend_elements.values():
+                    if element is not None:
+                        try:
+                            element.remove()
+                        except ValueError as e:
+                            print(e)
+
+            result = self._replot_cel_trend(trend)
+            self.trend_sets[idx] = result if result else (None, None)
+
     def plot_cel_trend(self, date1, date2, fit_method, forecast, bounce_envelope, trend_data=None):
         result = self._get_celeration_trend(date1, date2,
                                             fit_method=fit_method,
@@ -1331,9 +1680,9 @@ class DataPointColumn:
             # Get offset coordinates
             offsets = marker.get_offsets()
 
-            # Instead of using mean size, get the individual sizes from the data frame
+            # Instead of using mean size, get the individual sizes of this marker group
             # This ensures we respect the configured sizes for each point
-            marker_sizes = self.df_agg['marker_sizes'].values
+            marker_sizes = marker.get_sizes()
 
             # Create superimposed yellow squares with individual sizes
             highlight_marker = self.ax.scatter(
@@ -1363,7 +1712,7 @@ class DataPointColumn:
                 highlight_marker.remove()
 
             self.highlight_objects = []
-            self.ax.figure.canvas.draw()
+            self.event_bus.emit('refresh_chart')
 
         self.is_highlighting = False
 
@@ -1414,6 +1763,20 @@ class DataPointColumn:
         self.replot_cel_trends()
         self.sync_visibility()
 
+    def update_view(self, new_dates):
+        # Columns that have not been plotted yet need a full plot
+        if not self.column_line_objects:
+            self.refresh_view()
+            return
+
+        # Re-aggregate and move existing plot elements instead of replotting
+        self.df_agg = self.agg_data_column()
+        self.load_styles()
+        self.update_style()
+
+        self._refit_cel_trends(new_dates)
+        self.sync_visibility()
+
     def delete(self):
         # Remove all line objects
         for line in self.column_line_objects:
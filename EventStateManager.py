@@ -10,6 +10,7 @@ class EventBus:
     debug_emit = False
     debug_refresh = False
     debug_all = False
+    profile_events = False  # Record call count and latency per event, see dump_event_report
 
     def __new__(cls):
         if cls._instance is None:
@@ -18,6 +19,7 @@ class EventBus:
             cls._instance = super(EventBus, cls).__new__(cls)
             cls._instance.subscribers = {}
             cls._instance.event_triggers = {}
+            cls._instance.event_stats = {}
             if cls.debug_all or cls.debug_init:
                 print("[DEBUG] EventBus instance initialized with empty subscribers and triggers")
         return cls._instance
@@ -32,11 +34,12 @@ class EventBus:
         if event not in self.subscribers:
             if self.debug_all or self.debug_subscribe:
                 print(f"[DEBUG] Creating new subscriber list for event: {event}")
-            self.subscribers[event] = []
+            self.subscribers[event] = ()
         else:
             print(f"Event '{event}' already registered.")
 
-        self.subscribers[event].append((callback, has_data))
+        # Subscribers are stored as tuples so emit can iterate them without copying or checks
+        self.subscribers[event] = self.subscribers[event] + ((callback, has_data),)
 
         if self.debug_all or self.debug_subscribe:
             print(f"[DEBUG] Current subscribers for {event}: {len(self.subscribers[event])}")
@@ -49,17 +52,29 @@ class EventBus:
             print(f"[DEBUG] Current triggers: {self.event_triggers}")
 
     def emit(self, event, data=None):
+        if self.profile_events:
+            start = time.perf_counter()
+            try:
+                return self._dispatch(event, data)
+            finally:
+                self._record_event(event, time.perf_counter() - start)
+
+        return self._dispatch(event, data)
+
+    def _dispatch(self, event, data):
         result = None
+        debug = self.debug_all or self.debug_emit
         if self.debug_refresh and event == 'refresh_chart':
             print(f"[DEBUG] Emitting event: {event}")
 
-        if event in self.subscribers:
-            if self.debug_all or self.debug_emit:
+        subscribers = self.subscribers.get(event)
+        if subscribers is not None:
+            if debug:
                 print(f"[DEBUG] Subscribers found: {event in self.subscribers}")
                 print(f"[DEBUG] Trigger found: {event in self.event_triggers}")
-                print(f"[DEBUG] Processing {len(self.subscribers[event])} subscribers")
-            for callback, has_data in self.subscribers[event]:
-                if self.debug_all or self.debug_emit:
+                print(f"[DEBUG] Processing {len(subscribers)} subscribers")
+            for callback, has_data in subscribers:
+                if debug:
                     print(f"[DEBUG] Executing callback: {callback.__name__}")
                 if has_data:
                     result = callback(data)
@@ -68,17 +83,47 @@ class EventBus:
         else:
             print(f'Subscribe event {event} not found.')
 
-        if event in self.event_triggers:
-            target_event = self.event_triggers[event]
-            if self.debug_all or self.debug_emit:
+        target_event = self.event_triggers.get(event)
+        if target_event is not None:
+            if debug:
                 print(f"[DEBUG] Triggering chained event: {target_event}")
             self.emit(target_event)
-        else:
-            if self.debug_trigger:
-                print(f'{event} does not tigger additional events.')
+        elif self.debug_trigger:
+            print(f'{event} does not tigger additional events.')
 
         return result
 
+    def _record_event(self, event, elapsed):
+        # Stats are [call count, cumulative seconds, max seconds], latency includes nested emits
+        stats = self.event_stats.get(event)
+        if stats is None:
+            self.event_stats[event] = [1, elapsed, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+
+    def reset_event_stats(self):
+        self.event_stats = {}
+
+    def get_event_report(self, sort_by='total', limit=None):
+        # Events ranked by cumulative latency (or 'count' / 'max'), as (event, count, total_ms, mean_ms, max_ms)
+        sort_index = {'count': 1, 'total': 2, 'max': 4}[sort_by]
+        rows = [(event, count, total * 1000, total * 1000 / count, max_time * 1000)
+                for event, (count, total, max_time) in self.event_stats.items()]
+        rows.sort(key=lambda row: row[sort_index], reverse=True)
+
+        return rows[:limit] if limit else rows
+
+    def dump_event_report(self, sort_by='total', limit=20):
+        rows = self.get_event_report(sort_by, limit)
+        print(f"[EVENT PROFILE] {'event':<32}{'calls':>8}{'total ms':>12}{'mean ms':>10}{'max ms':>10}")
+        for event, count, total_ms, mean_ms, max_ms in rows:
+            print(f"[EVENT PROFILE] {event:<32}{count:>8}{total_ms:>12.2f}{mean_ms:>10.3f}{max_ms:>10.2f}")
+
+        return rows
+
 
 class StateRegistry:
     _instance = None
@@ -96,15 +141,21 @@ class StateRegistry:
         self.event_bus = EventBus()
         self.data_manager = data_manager
 
+        # Bumped whenever update_chart_data changes a value that is saved as chart metadata.
+        # Direct writes to chart_data bypass it, so it can prove a change but never the absence of one.
+        self.chart_data_generation = 0
+
         # Event bus subscriptions
         self.event_bus.subscribe("update_user_preference", self.update_user_pref, has_data=True)
         self.event_bus.subscribe("update_chart_data", self.update_chart_data, has_data=True)
         self.event_bus.subscribe("get_user_preference", self.get_user_pref, has_data=True)
         self.event_bus.subscribe("get_chart_data", self.get_chart_data, has_data=True)
+        self.event_bus.subscribe("get_chart_data_generation", self.get_chart_data_generation)
 
     def _get_caller_info(self):
         # Get information about who is calling a state method
         # Go back three frames: current -> get_user_pref -> emit -> original caller
+        # Only called when a debug flag is set, frame inspection is too slow for every access
         frame = inspect.currentframe().f_back.f_back.f_back
         file_name = frame.f_code.co_filename.split('/')[-1]
         line_num = frame.f_lineno
@@ -112,15 +163,24 @@ class StateRegistry:
 
         return f"[Caller: {file_name}:{line_num} in {func_name}()]"
 
+    def _should_log_access(self, key_exists):
+        # Always log if debug_state_access is True, otherwise log only fallbacks if debug_state_access_fallback is True
+        return self.debug_state_access or (self.debug_state_access_fallback and not key_exists)
+
+    def _log_access(self, caller_info, label, keys, value_repr, key_exists):
+        fallback_note = "" if key_exists else " (FALLBACK USED)"
+        print(f"[STATE ACCESS] {caller_info} Reading {label} '{'.'.join(str(k) for k in keys)}' = {value_repr}{fallback_note}")
+
     def update_user_pref(self, data):
         keys, value = data
-        caller_info = self._get_caller_info()
 
         # Convert single key to list for consistent handling
         if not isinstance(keys, list):
             keys = [keys]
 
         if self.debug_state_changes:
+            caller_info = self._get_caller_info()
+
             # Navigate to get the old value
             old_value = self.data_manager.user_preferences
             for i, key in enumerate(keys[:-1]):
@@ -148,13 +208,14 @@ class StateRegistry:
 
     def update_chart_data(self, data):
         keys, value = data
-        caller_info = self._get_caller_info()
 
         # Convert single key to list for consistent handling
         if not isinstance(keys, list):
             keys = [keys]
 
         if self.debug_state_changes:
+            caller_info = self._get_caller_info()
+
             # Navigate to get the old value
             old_value = self.data_manager.chart_data
             for i, key in enumerate(keys[:-1]):
@@ -186,11 +247,31 @@ class StateRegistry:
                 current[key] = {}
             current = current[key]
 
+        if keys[0] not in ('raw_data', 'owner') and (
+                keys[-1] not in current or not self._is_same_value(current[keys[-1]], value)):
+            self.chart_data_generation += 1
+
         current[keys[-1]] = value
 
+    def _is_same_value(self, old_value, new_value):
+        # Plain equality decides most updates, serializing only where it can't: values that don't compare
+        # (arrays), differing types and unequal containers, since tuples and lists that store identically are no change
+        try:
+            if old_value == new_value:
+                return True
+        except (ValueError, TypeError):
+            pass
+        else:
+            if type(old_value) is type(new_value) and not isinstance(old_value, (list, tuple, dict)):
+                return False
+
+        return json.dumps(old_value, default=str) == json.dumps(new_value, default=str)
+
+    def get_chart_data_generation(self):
+        return self.chart_data_generation
+
     def get_user_pref(self, data):
         keys, fallback = data
-        caller_info = self._get_caller_info()
 
         # Convert single key to list for consistent handling
         if not isinstance(keys, list):
@@ -208,31 +289,14 @@ class StateRegistry:
                 value = fallback
                 break
 
-        # Determine if we should log based on flags and conditions
-        should_log = False
-        log_message = ""
-
-        # Case 1: Always log if debug_state_access is True
-        if self.debug_state_access:
-            should_log = True
-            if key_exists:
-                log_message = f"[STATE ACCESS] {caller_info} Reading user preference '{'.'.join(str(k) for k in keys)}' = {value}"
-            else:
-                log_message = f"[STATE ACCESS] {caller_info} Reading user preference '{'.'.join(str(k) for k in keys)}' = {value} (FALLBACK USED)"
-
-        # Case 2: Log only fallbacks if debug_state_access_fallback is True and a fallback is used
-        elif self.debug_state_access_fallback and not key_exists:
-            should_log = True
-            log_message = f"[STATE ACCESS] {caller_info} Reading user preference '{'.'.join(str(k) for k in keys)}' = {value} (FALLBACK USED)"
-
-        if should_log:
-            print(log_message)
+        # Caller info and value repr are only built when logging
+        if self._should_log_access(key_exists):
+            self._log_access(self._get_caller_info(), 'user preference', keys, value, key_exists)
 
         return value
 
     def get_chart_data(self, data):
         keys, fallback = data
-        caller_info = self._get_caller_info()
 
         # Convert single key to list for consistent handling
         if not isinstance(keys, list):
@@ -250,28 +314,11 @@ class StateRegistry:
                 value = fallback
                 break
 
-        value_repr = str(value)
-        if len(value_repr) > 100:
-            value_repr = value_repr[:97] + "..."
-
-        # Determine if we should log based on flags and conditions
-        should_log = False
-        log_message = ""
-
-        # Case 1: Always log if debug_state_access is True
-        if self.debug_state_access:
-            should_log = True
-            if key_exists:
-                log_message = f"[STATE ACCESS] {caller_info} Reading chart data '{'.'.join(str(k) for k in keys)}' = {value_repr}"
-            else:
-                log_message = f"[STATE ACCESS] {caller_info} Reading chart data '{'.'.join(str(k) for k in keys)}' = {value_repr} (FALLBACK USED)"
-
-        # Case 2: Log only fallbacks if debug_state_access_fallback is True and a fallback is used
-        elif self.debug_state_access_fallback and not key_exists:
-            should_log = True
-            log_message = f"[STATE ACCESS] {caller_info} Reading chart data '{'.'.join(str(k) for k in keys)}' = {value_repr} (FALLBACK USED)"
-
-        if should_log:
-            print(log_message)
+        # Caller info and value repr are only built when logging
+        if self._should_log_access(key_exists):
+            value_repr = str(value)
+            if len(value_repr) > 100:
+                value_repr = value_repr[:97] + "..."
+            self._log_access(self._get_caller_info(), 'chart data', keys, value_repr, key_exists)
 
         return value
@@ -4,6 +4,34 @@ from EventStateManager import EventBus
 import scc
 
 
+class ThumbnailEncodeSignals(QObject):
+    # Delivers encoded thumbnails from worker threads back to the figure manager
+    thumbnail_encoded = Signal(int, str, object)
+
+
+class ThumbnailEncodeTask(QRunnable):
+    # Scales a cropped copy of the canvas and encodes it to PNG off the UI thread
+    def __init__(self, signals, token, chart_id, rgba, size):
+        super().__init__()
+        self.signals = signals
+        self.token = token
+        self.chart_id = chart_id
+        self.rgba = rgba
+        self.size = size
+
+    def run(self):
+        try:
+            png = FigureManager.encode_thumbnail(self.rgba, self.size)
+        except Exception as e:
+            print(f"Error encoding thumbnail: {e}")
+            png = None
+
+        try:
+            self.signals.thumbnail_encoded.emit(self.token, self.chart_id, png)
+        except RuntimeError:
+            pass  # Figure manager deleted before the thumbnail finished
+
+
 class FigureManager(QWidget):
     def __init__(self, parent=None):
         super(FigureManager, self).__init__(parent)
@@ -11,11 +39,28 @@ class FigureManager(QWidget):
         self.data_manager = DataManager()
         self.event_bus = EventBus()
 
+        # Refresh counters, draw_idle already merges all refresh_chart requests within one event loop turn into one draw
+        self.refresh_pending = False
+        self.refresh_requests = 0
+        self.refresh_draws = 0
+
+        # Thumbnails are rebuilt only when the saved state changed, and encoded on a worker thread
+        self.thumbnail_state = None  # (chart_id, metadata_hash, data_hash) of the latest thumbnail
+        self.thumbnail_png = None  # PNG of thumbnail_state, None while encoding
+        self.thumbnail_tokens = {}  # chart_id -> token of the latest encode, older results are dropped
+        self.next_thumbnail_token = 0
+        self.clean_frame = False  # Canvas buffer holds a full draw without transient artists, blits clear it
+        self.pending_thumbnail = None  # (token, chart_id, size) waiting for the next clean draw
+        self.thumbnail_pool = QThreadPool(self)  # Own pool, so flushing does not wait on other thumbnail tasks
+        self.thumbnail_signals = ThumbnailEncodeSignals(self)
+        self.thumbnail_signals.thumbnail_encoded.connect(self._on_thumbnail_encoded)
+
         # Event subscriptions
         self.event_bus.subscribe('new_chart', self.new_chart, has_data=True)
         self.event_bus.subscribe('get_data_point_column', self.get_data_point_column, has_data=True)
         self.event_bus.subscribe('refresh_chart', self.refresh)
         self.event_bus.subscribe('get_thumbnail', self.get_thumbnail, has_data=True)
+        self.event_bus.subscribe('flush_thumbnails', self.flush_thumbnails)
 
         # Managers
         self.phase_manager = PhaseManager(self)
@@ -42,6 +87,7 @@ class FigureManager(QWidget):
         # Ensure the figure and layout are correctly initialized
         self.figure = plt.figure()
         self.canvas = FigureCanvas(self.figure)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.layout = QVBoxLayout()  # Properly initialize the layout
         self.setLayout(self.layout)  # Set the layout for this widget
         self.layout.addWidget(self.canvas)  # Add the canvas to the layout
@@ -67,6 +113,10 @@ class FigureManager(QWidget):
         self.hover_manager = Hover(self)
 
     def init_state(self, start_date=None):
+        # Frames of the previous chart must not become thumbnails of the next one
+        self.clean_frame = False
+        self._drop_pending_thumbnail()
+
         # Close any previously created figure
         if hasattr(self, 'figure') and self.figure:
             plt.close(self.figure)
@@ -127,6 +177,7 @@ class FigureManager(QWidget):
 
         # Create a new canvas and add it to the layout
         self.canvas = FigureCanvas(self.figure)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.layout.addWidget(self.canvas)
 
         fig_width, fig_height = self.figure.get_size_inches()
@@ -366,7 +417,15 @@ class FigureManager(QWidget):
         self.event_bus.emit('refresh_chart')
 
     def refresh(self):
-        self.canvas.draw_idle()
+        self.refresh_requests += 1
+        self.refresh_pending = True
+        if self.canvas is not None:
+            self.canvas.draw_idle()
+
+    def get_refresh_stats(self):
+        return {'requests': self.refresh_requests,
+                'draws': self.refresh_draws,
+                'dropped': self.refresh_requests - self.refresh_draws - int(self.refresh_pending)}
 
     def new_chart(self, start_date):
         self.init_state(start_date=start_date)
@@ -455,30 +514,145 @@ class FigureManager(QWidget):
 
     def get_thumbnail(self, data):
         """
-        Generate a thumbnail of the current chart figure
+        Get a thumbnail of the current chart figure
 
         Parameters:
-        data (dict): Contains size parameter (width, height) in pixels
+        data (dict): Contains size (max width, height) in pixels, and optionally the chart_id
+                     and metadata_hash of the chart being saved
 
         Returns:
-        bytes: PNG image data of the thumbnail
+        bytes: PNG image data of the thumbnail. None if it is being encoded in the background,
+               in which case update_chart_thumbnail is emitted when it is ready.
         """
         try:
-            # Save to BytesIO buffer
-            buffer = io.BytesIO()
-
-            # Similar to fig_save_image but save to buffer
-            bbox = self.figure.axes[0].get_window_extent().transformed(self.figure.dpi_scale_trans.inverted())
-            self.figure.savefig(buffer, format='png', dpi=100, bbox_inches=bbox)
-
-            # Return the binary data
-            buffer.seek(0)
-            return buffer.getvalue()
+            size = data.get('size', (480, 400))
+            chart_id = data.get('chart_id')
+
+            # Without a chart to update later, encode the last clean frame synchronously
+            if chart_id is None:
+                if self.refresh_pending or not self.clean_frame:
+                    return None
+                return self.encode_thumbnail(self._copy_axes_region(), size)
+
+            state = (chart_id, data.get('metadata_hash'), self._get_data_hash())
+            if state == self.thumbnail_state:
+                return self.thumbnail_png  # Unchanged, None if the encode is still running
+
+            token = self.next_thumbnail_token
+            self.next_thumbnail_token += 1
+            self.thumbnail_tokens[chart_id] = token
+            self.thumbnail_state = state
+            self.thumbnail_png = None
+
+            if self.refresh_pending or not self.clean_frame:
+                # The frame on screen is outdated or has transient artists, wait for the next clean draw
+                self._drop_pending_thumbnail()
+                self.pending_thumbnail = (token, chart_id, size)
+                if not self.refresh_pending and not self._has_transient_artists():
+                    self.canvas.draw_idle()
+            else:
+                self._start_thumbnail(token, chart_id, self._copy_axes_region(), size)
+            return None
 
         except Exception as e:
             print(f"Error generating thumbnail: {e}")
             return None
 
+    def _get_data_hash(self):
+        df_raw = self.data_manager.df_raw
+        if df_raw is None or df_raw.empty:
+            return None
+        return hashlib.md5(pd.util.hash_pandas_object(df_raw, index=False).values.tobytes()).hexdigest()
+
+    def _has_transient_artists(self):
+        # Highlights, the phase preview and dragged objects are not part of the saved chart
+        if self.phase_manager.temp_phase_line is not None:
+            return True
+        if self.drag_manager.active_drag_id is not None or self.drag_fan_manager.pressed:
+            return True
+        return any(column.is_highlighting for column in self.data_manager.plot_columns.values())
+
+    def _on_draw(self, event):
+        if self.refresh_pending:
+            self.refresh_pending = False
+            self.refresh_draws += 1
+            if self.event_bus.debug_refresh:
+                print(f"[DEBUG] Drawing chart, {self.get_refresh_stats()['dropped']} redundant refreshes dropped so far")
+
+        # Only mark the buffer, the axes region is copied when a thumbnail asks for it
+        self.clean_frame = not self._has_transient_artists()
+        if self.clean_frame and self.pending_thumbnail is not None:
+            token, chart_id, size = self.pending_thumbnail
+            self.pending_thumbnail = None
+            self._start_thumbnail(token, chart_id, self._copy_axes_region(), size)
+
+    def _copy_axes_region(self):
+        rgba = np.asarray(self.canvas.buffer_rgba())
+        height = rgba.shape[0]
+        x0, y0, x1, y1 = self.figure.axes[0].get_window_extent().extents
+
+        # Display coordinates start at the bottom, buffer rows at the top
+        rows = slice(max(int(np.floor(height - y1)), 0), min(int(np.ceil(height - y0)), height))
+        cols = slice(max(int(np.floor(x0)), 0), min(int(np.ceil(x1)), rgba.shape[1]))
+        return rgba[rows, cols].copy()
+
+    def _start_thumbnail(self, token, chart_id, rgba, size):
+        # The copy is never written to, so the task can own it
+        self.thumbnail_pool.start(ThumbnailEncodeTask(self.thumbnail_signals, token, chart_id, rgba, size))
+
+    def _drop_pending_thumbnail(self):
+        # Forget a thumbnail that never got a clean frame, the chart keeps its stored one
+        if self.pending_thumbnail is None:
+            return
+        token, chart_id, size = self.pending_thumbnail
+        self.pending_thumbnail = None
+        if self.thumbnail_tokens.get(chart_id) == token:
+            del self.thumbnail_tokens[chart_id]
+            if self.thumbnail_state is not None and self.thumbnail_state[0] == chart_id:
+                self.thumbnail_state = None
+
+    @staticmethod
+    def encode_thumbnail(rgba, size):
+        # Downsample to fit size and encode as PNG, safe to run off the UI thread
+        height, width = rgba.shape[:2]
+        image = QImage(rgba.data, width, height, rgba.strides[0], QImage.Format.Format_RGBA8888)
+        if width > size[0] or height > size[1]:
+            image = image.scaled(size[0], size[1], Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        else:
+            image = image.copy()
+
+        png = QByteArray()
+        buffer = QBuffer(png)
+        buffer.open(QBuffer.OpenModeFlag.WriteOnly)
+        image.save(buffer, 'PNG')
+        buffer.close()
+        return png.data()
+
+    def _on_thumbnail_encoded(self, token, chart_id, png):
+        if self.thumbnail_tokens.get(chart_id) != token:
+            return  # A later save of this chart started a newer thumbnail
+        del self.thumbnail_tokens[chart_id]
+
+        if png is None:
+            self.thumbnail_state = None
+            return
+
+        if self.thumbnail_state is not None and self.thumbnail_state[0] == chart_id:
+            self.thumbnail_png = png
+
+        self.event_bus.emit('update_chart_thumbnail', {'chart_id': chart_id, 'thumbnail': png})
+
+    def flush_thumbnails(self):
+        # Encode a thumbnail still waiting for its draw, then wait for the encodes and store them, used before closing
+        if self.pending_thumbnail is not None and not self._has_transient_artists():
+            self.canvas.draw()
+        self._drop_pending_thumbnail()
+
+        if self.thumbnail_tokens:
+            self.thumbnail_pool.waitForDone(5000)
+            QApplication.sendPostedEvents()
+
 
 class PhaseManager:
     def __init__(self, figure_manager):
@@ -1277,6 +1451,7 @@ class DragManager:
             return
 
         # Restore background
+        self.figure_manager.clean_frame = False
         self.figure_manager.canvas.restore_region(self.drag_background)
 
         # Draw the dragged objects
@@ -2006,6 +2181,7 @@ class Hover:
         self.crosshair_annotation.set_text(data_label)
 
         # Draw process
+        self.figure_manager.clean_frame = False
         self.figure_manager.canvas.restore_region(self.crosshair_background)
 
         # Draw annotation and lines
@@ -2127,6 +2303,7 @@ class Hover:
         self.crosshair_annotation.set_text(date_label)
 
         # Restore the saved background
+        self.figure_manager.clean_frame = False
         self.figure_manager.canvas.restore_region(self.crosshair_background)
 
         # Redraw the crosshair and annotation
@@ -2395,6 +2572,7 @@ class DraggableFanManager:
             return
 
         # Restore background
+        self.figure_manager.clean_frame = False
         self.figure_manager.canvas.restore_region(self.drag_background)
 
         # Draw all fan elements
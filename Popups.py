@@ -2081,7 +2081,40 @@ class SpreadsheetDialog(QDialog):
         return NumericDelegate(self)
 
 
+class BrowserThumbnailSignals(QObject):
+    # Delivers finished thumbnails from worker threads to the chart browser on the UI thread
+    thumbnail_ready = Signal(int, object)
+
+
+class ThumbnailTask(QRunnable):
+    # Decodes, frames, badges and scales one chart thumbnail off the UI thread
+    def __init__(self, signals, token, thumbnail_data, badge, target_size):
+        super().__init__()
+        self.signals = signals
+        self.token = token
+        self.thumbnail_data = thumbnail_data
+        self.badge = badge
+        self.target_size = target_size
+
+    def run(self):
+        try:
+            image = ChartBrowserDialog.compose_thumbnail(self.thumbnail_data, self.badge, self.target_size)
+        except Exception as e:
+            print(f"Error processing thumbnail: {e}")
+            image = None
+
+        try:
+            self.signals.thumbnail_ready.emit(self.token, image)
+        except RuntimeError:
+            pass  # Browser closed before the thumbnail finished
+
+
 class ChartBrowserDialog(QDialog):
+    # Composed thumbnails shared across browser instances, keyed by (chart_id, last_modified, thumbnail version, badge)
+    thumbnail_cache = {}
+    thumbnail_versions = {}  # chart_id -> bumped when a thumbnail is stored after its chart was saved
+    THUMBNAIL_CACHE_SIZE = 400
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.data_manager = DataManager()
@@ -2101,6 +2134,17 @@ class ChartBrowserDialog(QDialog):
         self.plus_button = None
         self.location_layout = None  # Store reference to the button layout
 
+        # Thumbnails are loaded for visible items only, see _update_visible_thumbnails
+        self.thumbnail_requests = {}  # location -> {chart_id: request}
+        self.thumbnail_tokens = {}  # token -> (location, chart_id, request) for tasks in flight
+        self.next_thumbnail_token = 0
+        self.thumbnail_signals = BrowserThumbnailSignals(self)
+        self.thumbnail_signals.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self.thumbnail_timer = QTimer(self)
+        self.thumbnail_timer.setSingleShot(True)
+        self.thumbnail_timer.setInterval(30)
+        self.thumbnail_timer.timeout.connect(self._update_visible_thumbnails)
+
         # Setup UI and load data
         self.setWindowTitle("Chart Browser")
         self.setMinimumSize(800, 600)
@@ -2307,6 +2351,7 @@ class ChartBrowserDialog(QDialog):
         grid.itemSelectionChanged.connect(self.on_selection_changed)
         grid.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         grid.customContextMenuRequested.connect(self.show_chart_context_menu)
+        grid.verticalScrollBar().valueChanged.connect(self._schedule_thumbnail_update)
 
     def _create_bottom_bar(self, main_layout):
         """Create the bottom bar with location buttons and action buttons"""
@@ -2746,6 +2791,7 @@ class ChartBrowserDialog(QDialog):
         # Save preference
         self.event_bus.emit("update_user_preference", ['last_open_tab', location])
         self.on_selection_changed()
+        self._schedule_thumbnail_update()
 
     def on_location_button_clicked(self):
         """Handle location button clicks"""
@@ -2775,51 +2821,38 @@ class ChartBrowserDialog(QDialog):
             if not grid:
                 return
 
-            chart_ids = self.event_bus.emit('get_chart_ids_for_location', location)
+            # Display fields and permissions for the whole location in one query, thumbnails load when visible
+            chart_items = self.event_bus.emit('get_chart_browser_items', location)
+            self.thumbnail_requests[location] = {}
 
-            for chart_id in chart_ids:
+            for chart_info in chart_items:
                 try:
-                    self._create_chart_item(grid, chart_id, location)
+                    self._create_chart_item(grid, chart_info, location)
                 except Exception as e:
-                    print(f"Error creating chart item for {chart_id}: {e}")
+                    print(f"Error creating chart item for {chart_info['chart_id']}: {e}")
+
+            self._schedule_thumbnail_update()
 
         except Exception as e:
             print(f"Error loading charts for location {location}: {e}")
 
-    def _create_chart_item(self, grid, chart_id, location):
+    def _create_chart_item(self, grid, chart_info, location):
         """Create a chart item for the grid"""
-        # Get chart metadata
-        chart_data = self.event_bus.emit('get_chart_metadata', chart_id)
-        if not chart_data:
-            return
-
-        metadata = chart_data['metadata']
-        thumbnail_data = chart_data['thumbnail']
+        chart_id = chart_info['chart_id']
+        permissions = chart_info['permissions']
 
         # Create list item
         item = QListWidgetItem()
 
         # Set item text and data
-        self._configure_chart_item_text(item, chart_id, metadata)
-        self._configure_chart_item_icon(item, chart_id, location, thumbnail_data)
+        self._configure_chart_item_text(item, chart_id, chart_info['metadata'])
+        self._configure_chart_item_icon(item, chart_id, location, chart_info, permissions)
 
         # Set tooltip based on ownership
-        permissions = self.event_bus.emit('get_chart_permissions', chart_id)
-        is_owner = permissions.get('is_owner', False)
-
-        if is_owner:
+        if permissions['is_owner']:
             item.setToolTip("Double left click to open.\nRight click for options.")
-        elif location != 'local':
-            # Get owner information from database for non-owned charts
-            owner_result = self.data_manager.sqlite_manager._execute_with_retry(
-                f"SELECT owner FROM {self.data_manager.sqlite_manager.TABLE_CHART_METADATA} WHERE chart_id = ?",
-                (chart_id,),
-                fetch='one'
-            )
-
-            if owner_result and owner_result[0]:
-                owner_name = owner_result[0]
-                item.setToolTip(f"{owner_name}'s chart")
+        elif location != 'local' and chart_info['owner']:
+            item.setToolTip(f"{chart_info['owner']}'s chart")
 
         item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
         grid.addItem(item)
@@ -2840,83 +2873,155 @@ class ChartBrowserDialog(QDialog):
             credit_text = " ".join(str(line) for line in credit_lines)
             item.setData(Qt.ItemDataRole.UserRole + 1, credit_text)
 
-    def _configure_chart_item_icon(self, item, chart_id, location, thumbnail_data):
-        """Configure chart item icon with permission indicators"""
-        if not thumbnail_data:
+    def _configure_chart_item_icon(self, item, chart_id, location, chart_info, permissions):
+        """Set a cached thumbnail icon, or queue the thumbnail for loading once the item is visible"""
+        if not chart_info['has_thumbnail']:
             item.setIcon(QIcon.fromTheme("image-missing"))
             return
 
-        try:
-            original_pixmap = QPixmap()
-            if not original_pixmap.loadFromData(thumbnail_data) or original_pixmap.isNull():
-                item.setIcon(QIcon.fromTheme("image-missing"))
-                return
+        # Shared locations get a permission indicator, local charts only a frame
+        badge = None if location == 'local' else (permissions.get('is_owner', False),
+                                                  permissions.get('has_write_access', False))
+        cache_key = (chart_id, chart_info['last_modified'], self.thumbnail_versions.get(chart_id, 0), badge)
 
-            # Add permission indicator for shared locations
-            if location != 'local':
-                final_pixmap = self._add_permission_indicator(original_pixmap, chart_id)
-            else:
-                final_pixmap = self._add_frame_to_pixmap(original_pixmap)
+        pixmap = self._get_cached_thumbnail(cache_key)
+        if pixmap is not None:
+            item.setIcon(QIcon(pixmap))
+            return
 
-            item.setIcon(QIcon(final_pixmap))
+        self.thumbnail_requests[location][chart_id] = {'item': item, 'badge': badge, 'cache_key': cache_key}
+
+    def _get_cached_thumbnail(self, cache_key):
+        """Get a composed thumbnail from the LRU cache, marking it most recently used"""
+        pixmap = self.thumbnail_cache.pop(cache_key, None)
+        if pixmap is not None:
+            self.thumbnail_cache[cache_key] = pixmap
+        return pixmap
+
+    @classmethod
+    def invalidate_thumbnail(cls, chart_id):
+        """Drop cached thumbnails of a chart whose stored thumbnail changed without a new last_modified"""
+        # Bumping the version also keeps thumbnails still being composed from the old data out of the cache
+        cls.thumbnail_versions[chart_id] = cls.thumbnail_versions.get(chart_id, 0) + 1
+        for cache_key in [key for key in cls.thumbnail_cache if key[0] == chart_id]:
+            del cls.thumbnail_cache[cache_key]
+
+    def _cache_thumbnail(self, cache_key, pixmap):
+        """Add a composed thumbnail to the LRU cache, evicting the least recently used ones"""
+        self.thumbnail_cache.pop(cache_key, None)
+        self.thumbnail_cache[cache_key] = pixmap
+        while len(self.thumbnail_cache) > self.THUMBNAIL_CACHE_SIZE:
+            del self.thumbnail_cache[next(iter(self.thumbnail_cache))]
+
+    def _schedule_thumbnail_update(self, *args):
+        """Coalesce scroll, resize, filter and tab changes into one visible thumbnail update"""
+        self.thumbnail_timer.start()
+
+    def _update_visible_thumbnails(self):
+        """Fetch and start decoding thumbnails of items in or one page below the viewport"""
+        location = self.current_location
+        grid = self.location_grids.get(location)
+        requests = self.thumbnail_requests.get(location)
+        if not grid or not requests or not grid.isVisible():
+            return
 
-        except Exception as e:
-            print(f"Error processing thumbnail for chart {chart_id}: {e}")
-            item.setIcon(QIcon.fromTheme("image-missing"))
+        # Prefetch one page below the viewport so scrolling finds thumbnails ready
+        viewport_rect = grid.viewport().rect()
+        load_rect = viewport_rect.adjusted(0, 0, 0, viewport_rect.height())
 
-    def _add_frame_to_pixmap(self, pixmap):
-        """Add a black frame around a pixmap"""
-        if pixmap.isNull():
-            return pixmap
+        visible_ids = [chart_id for chart_id, request in requests.items()
+                       if 'token' not in request and not request['item'].isHidden()
+                       and grid.visualItemRect(request['item']).intersects(load_rect)]
+        if not visible_ids:
+            return
 
-        frame_width = 2
-        width = pixmap.width() + (frame_width * 2)
-        height = pixmap.height() + (frame_width * 2)
+        thumbnails = self.event_bus.emit('get_chart_thumbnails', visible_ids)
+        target_size = grid.iconSize() * self.devicePixelRatioF()
+        thread_pool = QThreadPool.globalInstance()
 
-        framed_pixmap = QPixmap(width, height)
-        framed_pixmap.fill(Qt.GlobalColor.transparent)
+        for chart_id in visible_ids:
+            request = requests[chart_id]
+            thumbnail_data = thumbnails.get(chart_id)
+            if not thumbnail_data:
+                request['item'].setIcon(QIcon.fromTheme("image-missing"))
+                del requests[chart_id]
+                continue
 
-        painter = QPainter(framed_pixmap)
-        painter.drawPixmap(frame_width, frame_width, pixmap)
-        painter.setPen(QPen(QColor(0, 0, 0), frame_width))
-        painter.drawRect(frame_width // 2, frame_width // 2, width - frame_width, height - frame_width)
-        painter.end()
+            token = self.next_thumbnail_token
+            self.next_thumbnail_token += 1
+            request['token'] = token
+            self.thumbnail_tokens[token] = (location, chart_id, request)
+            thread_pool.start(ThumbnailTask(self.thumbnail_signals, token, thumbnail_data, request['badge'], target_size))
 
-        return framed_pixmap
+    def _on_thumbnail_ready(self, token, image):
+        """Set a finished thumbnail on its item, unless the location was reloaded meanwhile"""
+        location, chart_id, request = self.thumbnail_tokens.pop(token, (None, None, None))
+        if request is None:
+            return
+
+        if image is None or image.isNull():
+            pixmap = None
+        else:
+            pixmap = QPixmap.fromImage(image)
+            self._cache_thumbnail(request['cache_key'], pixmap)
+
+        requests = self.thumbnail_requests.get(location, {})
+        if requests.get(chart_id) is not request:
+            return  # Item was replaced by a reload
 
-    def _add_permission_indicator(self, pixmap, chart_id):
-        """Add permission indicator to pixmap"""
-        if pixmap.isNull():
-            return pixmap
+        del requests[chart_id]
+        request['item'].setIcon(QIcon(pixmap) if pixmap is not None else QIcon.fromTheme("image-missing"))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_thumbnail_update()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_thumbnail_update()
+
+    @staticmethod
+    def compose_thumbnail(thumbnail_data, badge, target_size):
+        """Decode PNG bytes, add the frame and permission badge and scale to fit target_size. Safe off the UI thread."""
+        image = QImage()
+        if not image.loadFromData(thumbnail_data) or image.isNull():
+            return None
 
         frame_width = 2
-        width = pixmap.width() + (frame_width * 2)
-        height = pixmap.height() + (frame_width * 2)
+        width = image.width() + (frame_width * 2)
+        height = image.height() + (frame_width * 2)
 
-        framed_pixmap = QPixmap(width, height)
-        framed_pixmap.fill(Qt.GlobalColor.transparent)
+        framed_image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        framed_image.fill(Qt.GlobalColor.transparent)
 
-        painter = QPainter(framed_pixmap)
+        painter = QPainter(framed_image)
 
-        # Draw the original pixmap
-        painter.drawPixmap(frame_width, frame_width, pixmap)
+        # Draw the original image
+        painter.drawImage(frame_width, frame_width, image)
 
         # Draw frame
         painter.setPen(QPen(QColor(0, 0, 0), frame_width))
         painter.drawRect(frame_width // 2, frame_width // 2, width - frame_width, height - frame_width)
 
-        # Get permissions and draw indicator
-        permissions = self.event_bus.emit('get_chart_permissions', chart_id)
-        is_owner = permissions.get('is_owner', False)
-        has_write_access = permissions.get('has_write_access', False)
-
-        # Draw permission indicator
-        self._draw_permission_icon(painter, width, height, is_owner, has_write_access)
+        # Draw permission indicator for shared locations
+        if badge is not None:
+            is_owner, has_write_access = badge
+            ChartBrowserDialog._draw_permission_icon(painter, width, height, is_owner, has_write_access)
 
         painter.end()
-        return framed_pixmap
 
-    def _draw_permission_icon(self, painter, width, height, is_owner, has_write_access):
+        # The icon is drawn at most target_size, scaling here keeps full size images out of memory
+        if width > target_size.width() or height > target_size.height():
+            framed_image = framed_image.scaled(
+                target_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+
+        return framed_image
+
+    @staticmethod
+    def _draw_permission_icon(painter, width, height, is_owner, has_write_access):
         """Draw permission icon on the pixmap"""
         icon_size = int(width * 0.2)
         icon_x = width - icon_size - 4
@@ -2939,12 +3044,12 @@ class ChartBrowserDialog(QDialog):
         painter.drawEllipse(icon_x, icon_y, icon_size, icon_size)
 
         # Draw icon
-        icon_pixmap = QPixmap(icon_path)
-        if not icon_pixmap.isNull():
+        icon_image = QImage(icon_path)
+        if not icon_image.isNull():
             icon_inner_size = int(icon_size * 0.7)
             icon_offset = (icon_size - icon_inner_size) // 2
 
-            scaled_icon = icon_pixmap.scaled(
+            scaled_icon = icon_image.scaled(
                 icon_inner_size,
                 icon_inner_size,
                 Qt.AspectRatioMode.KeepAspectRatio,
@@ -2953,7 +3058,7 @@ class ChartBrowserDialog(QDialog):
 
             icon_draw_x = icon_x + icon_offset + (icon_inner_size - scaled_icon.width()) // 2
             icon_draw_y = icon_y + icon_offset + (icon_inner_size - scaled_icon.height()) // 2
-            painter.drawPixmap(icon_draw_x, icon_draw_y, scaled_icon)
+            painter.drawImage(icon_draw_x, icon_draw_y, scaled_icon)
 
     # Chart Operations
     def show_chart_context_menu(self, position):
@@ -3186,6 +3291,8 @@ class ChartBrowserDialog(QDialog):
                         should_hide = search_text.lower() not in combined_text
                         item.setHidden(should_hide)
 
+            self._schedule_thumbnail_update()
+
     def on_selection_changed(self):
         """Handle selection changes"""
         # Enable/disable Open button based on selection
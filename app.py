@@ -515,16 +515,26 @@ class ChartApp(QMainWindow):
         # Stuff to do before closing application
         self.event_bus.emit('save_decision', data=event)
 
+        # Store thumbnails still encoding in the background before syncing
+        self.event_bus.emit('flush_thumbnails')
+
         # Save current preferences
         if self.save_preferences_upon_close:
             self.data_manager.save_user_preferences()
 
-        # Sync with remote databases after all save operations
+        # Sync with remote databases after all save operations, replacing queued jobs and waiting for it to finish
+        self.db_monitor.stop_monitoring()
+        self.event_bus.emit('cancel_sync_jobs')
         self.event_bus.emit('sync_remotes')
+        self.event_bus.emit('wait_for_sync')
 
         # Reclaim space
         self.event_bus.emit('vacuum_database')
 
+        # Report which events dominated UI latency this session
+        if self.event_bus.profile_events:
+            self.event_bus.dump_event_report()
+
         # Accept the close event to close the window
         event.accept()
 
@@ -1155,6 +1165,29 @@ class EventHandlers:
         self.event_bus.subscribe('column_map_dialog', self.column_map_dialog, has_data=True)
         self.event_bus.subscribe('save_chart_as_recent', self.save_recent, has_data=True)
         self.event_bus.subscribe('trigger_user_prompt', self.trigger_user_prompt, has_data=True)
+        self.event_bus.subscribe('raw_data_import_progress', self.raw_data_import_progress, has_data=True)
+        self.event_bus.subscribe('chart_thumbnail_updated', self.chart_thumbnail_updated, has_data=True)
+
+        self.import_progress_dialog = None
+
+    def chart_thumbnail_updated(self, chart_id):
+        # Thumbnails encoded after a save don't change last_modified, so the browser cache is told directly
+        from Popups import ChartBrowserDialog
+        ChartBrowserDialog.invalidate_thumbnail(chart_id)
+
+    def raw_data_import_progress(self, progress):
+        # Only shows up if the import takes longer than the minimum duration
+        if progress < 1 and self.import_progress_dialog is None:
+            self.import_progress_dialog = QProgressDialog('Importing data...', None, 0, 100, self.chart_app)
+            self.import_progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+            self.import_progress_dialog.setMinimumDuration(500)
+            self.import_progress_dialog.setAutoClose(False)
+
+        if self.import_progress_dialog is not None:
+            self.import_progress_dialog.setValue(int(progress * 100))
+            if progress >= 1:
+                self.import_progress_dialog.close()
+                self.import_progress_dialog = None
 
     def show_date_dialog(self):
         dialog = StartDateDialog(self.chart_app)
@@ -7,14 +7,15 @@ from PySide6.QtWidgets import (
     QStackedWidget, QSpinBox, QSpacerItem, QSizePolicy, QDoubleSpinBox, QColorDialog, 
     QListWidgetItem, QFrame, QCalendarWidget, QDialogButtonBox, QScrollArea, QTextEdit,
     QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QMenu, QFormLayout, 
-    QSplitter, QItemDelegate, QInputDialog, QStackedLayout
+    QSplitter, QItemDelegate, QInputDialog, QStackedLayout, QProgressDialog
 )
 from PySide6.QtGui import (
     QDoubleValidator, QFont, QIcon, QIntValidator, QDesktopServices, QPixmap, 
-    QAction, QFontMetrics, QPainter, QPen, QColor, QShortcut, QValidator, QMouseEvent
+    QAction, QFontMetrics, QPainter, QPen, QColor, QShortcut, QValidator, QMouseEvent, QImage
 )
 from PySide6.QtCore import (
-    Qt, QDate, QUrl, QEvent, QObject, QTimer, Signal, QSize, QDir, QKeyCombination, QPoint, QPointF
+    Qt, QDate, QUrl, QEvent, QObject, QTimer, Signal, QSize, QDir, QKeyCombination, QPoint, QPointF,
+    QRunnable, QThreadPool, QBuffer, QByteArray
 )
 
 # Standard libraries
@@ -43,10 +44,12 @@ import textwrap
 # Data manipulation
 import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 
 # Matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
 from matplotlib.text import Text
 from matplotlib.markers import MarkerStyle
 from matplotlib import transforms
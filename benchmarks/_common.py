@@ -0,0 +1,91 @@
+# Shared helpers for the benchmark scripts, run them from the repository root, e.g. python benchmarks/bench_save.py
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+import importlib.util
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, REPO_DIR)
+
+
+def parse_args(description, **extra):
+    """Parse --baseline REV (compare with the modules at a git revision) and any extra int options."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--baseline', help='git revision to time side by side with the working tree, e.g. a commit before the change')
+    for name, default in extra.items():
+        parser.add_argument(f'--{name}', type=int, default=default)
+    return parser.parse_args()
+
+
+def load_module(module_name, rev=None):
+    """Import a repository module, from the working tree or as it was at git revision rev."""
+    if rev is None:
+        return importlib.import_module(module_name)
+
+    source = subprocess.run(['git', 'show', f'{rev}:{module_name}.py'], cwd=REPO_DIR, check=True,
+                            capture_output=True, text=True).stdout
+    path = os.path.join(tempfile.mkdtemp(), f'{module_name}.py')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(source)
+
+    spec = importlib.util.spec_from_file_location(f'{module_name}_at_{abs(hash(rev))}', path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def versions(args, module_name):
+    """(label, module) pairs to time, the baseline first when one was given."""
+    pairs = [('working tree', load_module(module_name))]
+    if args.baseline:
+        pairs.insert(0, (args.baseline, load_module(module_name, args.baseline)))
+    return pairs
+
+
+def best_of(function, repeat=5):
+    """Best wall time of repeat calls in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+class FakeEventBus:
+    # Stands in for EventBus where a benchmark drives a component without the application
+    def emit(self, *args, **kwargs):
+        return None
+
+
+class FakeDataManager:
+    # The parts of DataManager the database classes use
+    def __init__(self, config_dir):
+        self.config_dir = config_dir
+        self.user_preferences = {'user_name': 'bench'}
+        self.event_bus = FakeEventBus()
+        self.chart_data = {'chart_file_path': 'chart', 'type': 'Daily'}
+        self.df_raw = None
+
+    def get_config_directory(self, as_str=False):
+        return self.config_dir
+
+    def get_default_user_name(self):
+        return 'bench'
+
+
+def open_repository(database_module, config_dir=None):
+    """Connect a SQLiteDatabase in a fresh directory and return (data manager, database, chart repository)."""
+    config_dir = config_dir or tempfile.mkdtemp()
+    data_manager = FakeDataManager(config_dir)
+    db = database_module.SQLiteDatabase(data_manager)
+    db.connect(config_dir)
+    repo = database_module.ChartRepository(db, data_manager, FakeEventBus())
+    repo._get_save_permissions = lambda chart_id: {'can_save': True, 'preserve_owner': 'bench',
+                                                   'preserve_accepting_changes': 0}
+    return data_manager, db, repo
@@ -0,0 +1,43 @@
+# Full re-aggregation of ten data columns, as done when a chart is replotted (user-001)
+import warnings
+
+from _common import parse_args, versions, best_of
+
+import numpy as np
+import pandas as pd
+from PySide6.QtWidgets import QApplication
+
+args = parse_args('Time building ten DataPointColumns on a DailyMinute chart with weekly means')
+warnings.filterwarnings('ignore')
+app = QApplication([])
+
+import scc
+from DataManager import DataManager
+from EventStateManager import StateRegistry
+
+data_manager = DataManager()
+state_registry = StateRegistry(data_manager)
+data_manager.chart_data['type'] = 'DailyMinute'
+chart = scc.DailyMinute(start_date=pd.Timestamp('2024-01-07'))
+figure, ax = chart.get_figure()
+
+sys_cols = ['c', 'i'] + [f'o{k}' for k in range(1, 9)]
+view_settings = {'calendar_group': 'W', 'agg_type': 'mean', 'data': True, 'trend_line': False,
+                 'bounce': False, 'cel_label': False}
+rng = np.random.default_rng(0)
+
+for label, module in versions(args, 'DataManager'):
+    module.DataManager._instance = data_manager  # Columns of a baseline module use the same data
+    for rows in (1_000, 10_000, 100_000):
+        df = pd.DataFrame({'d': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 140, rows), unit='D'),
+                           'm': rng.choice([1.0, 2.0, 0.5], rows)})
+        for sys_col in sys_cols:
+            df[sys_col] = rng.integers(0, 30, rows).astype(float)
+
+        def build():
+            data_manager.df_raw = df.copy()  # A replaced df_raw drops any cached aggregation
+            for sys_col in sys_cols:
+                module.DataPointColumn(ax, chart.date_to_pos, chart.x_to_day_count, sys_col, sys_col.upper(),
+                                       dict(view_settings))
+
+        print(f'{label:>14}  {rows:>7} rows  {best_of(build, 3):.3f} s')
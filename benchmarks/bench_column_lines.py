@@ -0,0 +1,47 @@
+# Plotting data columns with their connecting lines, and redrawing the chart (user-003)
+import time
+import warnings
+
+from _common import parse_args, versions, best_of
+
+import numpy as np
+import pandas as pd
+from PySide6.QtWidgets import QApplication
+
+args = parse_args('Time plotting five daily columns of 730 points and redrawing the canvas')
+warnings.filterwarnings('ignore')
+app = QApplication([])
+
+import scc
+from DataManager import DataManager
+from EventStateManager import StateRegistry
+
+data_manager = DataManager()
+state_registry = StateRegistry(data_manager)
+sys_cols = ['c', 'i', 'o1', 'o2', 'o3']
+days = pd.date_range('2023-01-01', periods=730, freq='D')
+rng = np.random.default_rng(0)
+data_manager.chart_data['type'] = 'Daily'
+data_manager.df_raw = pd.DataFrame({'d': days, 'm': 1.0, **{c: rng.integers(1, 50, len(days)).astype(float) for c in sys_cols}})
+view_settings = {'calendar_group': 'D', 'agg_type': 'raw', 'data': True, 'trend_line': True, 'bounce': True, 'cel_label': True}
+
+images = []
+for label, module in versions(args, 'DataManager'):
+    module.DataManager._instance = data_manager
+    chart = scc.Daily(start_date=pd.Timestamp('2023-01-01'))
+    figure, ax = chart.get_figure()
+
+    start = time.perf_counter()
+    for sys_col in sys_cols:
+        module.DataPointColumn(ax, chart.date_to_pos, chart.x_to_day_count, sys_col, sys_col.upper(), dict(view_settings)).plot()
+    plot_seconds = time.perf_counter() - start
+
+    figure.canvas.draw()
+    draw_seconds = best_of(figure.canvas.draw)
+    images.append(np.asarray(figure.canvas.buffer_rgba()).copy())
+    print(f'{label:>14}  artists {len(ax.lines) + len(ax.collections):>4}  plot {plot_seconds:.3f} s  draw {draw_seconds:.3f} s')
+
+if len(images) == 2:
+    # Segments joined in one collection antialias slightly differently where lines meet
+    difference = np.abs(images[0].astype(int) - images[1].astype(int)).max(axis=2)
+    print(f'pixels differing: {(difference > 0).sum()} of {difference.size}, by more than 40 levels: {(difference > 40).sum()}')
@@ -0,0 +1,84 @@
+# Commit cost of the local connection profile, the chart_sync location index, and save/load/sync with and without
+# the profile (user-013)
+import os
+import time
+import sqlite3
+import tempfile
+
+from _common import parse_args, versions, open_repository, FakeEventBus
+
+import numpy as np
+import pandas as pd
+
+args = parse_args('Time commits, an indexed chart_sync lookup and chart save, load and sync', charts=100)
+
+
+def time_commits(pragmas, commits=300):
+    connection = sqlite3.connect(os.path.join(tempfile.mkdtemp(), 'commits.db'))
+    for pragma in pragmas:
+        connection.execute(pragma).fetchall()
+    connection.execute('CREATE TABLE t (a, b)')
+    connection.commit()
+
+    start = time.perf_counter()
+    for i in range(commits):
+        connection.execute('INSERT INTO t VALUES (?, ?)', (i, 'x' * 100))
+        connection.commit()
+    return (time.perf_counter() - start) / commits
+
+
+print('small transaction commit')
+for label, pragmas in [('journal DELETE, synchronous FULL', []),
+                       ('WAL, synchronous NORMAL', ['PRAGMA journal_mode = WAL', 'PRAGMA synchronous = NORMAL'])]:
+    print(f'  {label:<34} {time_commits(pragmas) * 1e3:.3f} ms')
+
+connection = sqlite3.connect(':memory:')
+connection.execute('CREATE TABLE chart_sync (chart_id TEXT, sync_location TEXT, last_sync INTEGER, local_hash TEXT, '
+                   'PRIMARY KEY (chart_id, sync_location))')
+connection.executemany("INSERT INTO chart_sync VALUES (?, ?, 0, '')", [(f'c{i}', f'loc{i % 50}') for i in range(20_000)])
+print('chart_sync lookup by sync_location, 20k rows')
+for label in ('no index', 'index'):
+    if label == 'index':
+        connection.execute('CREATE INDEX idx_chart_sync_location ON chart_sync (sync_location)')
+    start = time.perf_counter()
+    for _ in range(200):
+        connection.execute('SELECT chart_id FROM chart_sync WHERE sync_location = ?', ('loc7',)).fetchall()
+    print(f'  {label:<34} {(time.perf_counter() - start) / 200 * 1e3:.3f} ms')
+
+runs = [(label, database, True) for label, database in versions(args, 'database')]
+runs.append(('working tree, profile off', runs[-1][1], False))
+days = 500
+df = pd.DataFrame({'d': pd.date_range('2000-01-01', periods=days), 'm': 1.0, 'c': np.arange(days, dtype=float), 'i': 2.0})
+
+print(f'{args.charts} charts of {days * 3} cells')
+for label, database, use_profile in runs:
+    database.SQLiteDatabase.USE_CONNECTION_PROFILE = use_profile
+    data_manager, db, repo = open_repository(database)
+
+    start = time.perf_counter()
+    for k in range(args.charts):
+        data_manager.chart_data['chart_file_path'] = f'chart{k}'
+        data_manager.df_raw = df.assign(c=df['c'] + k)
+        repo.save_complete_chart()
+    save_seconds = (time.perf_counter() - start) / args.charts
+
+    start = time.perf_counter()
+    for k in range(args.charts):
+        repo.load_chart_data(f'chart{k}')
+    load_seconds = (time.perf_counter() - start) / args.charts
+
+    db.cursor.executemany("INSERT OR REPLACE INTO chart_sync (chart_id, sync_location, last_sync, local_hash) VALUES (?, 'loc', 0, '')",
+                          [(f'chart{k}',) for k in range(args.charts)])
+    db.connection.commit()
+    sync_manager = database.SyncManager(db, repo, database.TombstoneManager(db, data_manager), data_manager, FakeEventBus())
+    remote_path = os.path.join(tempfile.mkdtemp(), 'opencelerator-loc.db')
+    remote = sqlite3.connect(remote_path)
+    db.create_tables_for_remote(remote.cursor())
+    remote.commit()
+    remote.close()
+
+    start = time.perf_counter()
+    sync_manager._sync_with_remote('loc', remote_path)
+    db.connection.commit()
+    push_seconds = time.perf_counter() - start
+    print(f'  {label:<34} save {save_seconds * 1e3:.1f} ms  load {load_seconds * 1e3:.1f} ms  first push {push_seconds:.2f} s')
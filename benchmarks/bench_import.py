@@ -0,0 +1,81 @@
+# Column mapped raw data import of a synthetic CSV, wall time and tracemalloc peak (user-025)
+import os
+import time
+import tempfile
+import warnings
+import tracemalloc
+
+from _common import parse_args, versions
+
+import numpy as np
+import pandas as pd
+
+args = parse_args('Time DataManager.column_mapped_raw_data_import on synthetic CSV files', rows=10_000, largest=100_000)
+warnings.simplefilter('ignore')
+
+
+class ImportEventBus:
+    # Answers the chart data lookups the import makes and records its progress updates
+    def __init__(self, chart_data):
+        self.chart_data = chart_data
+
+    def emit(self, event, data=None):
+        if event == 'get_chart_data':
+            return self.chart_data.get(data[0], data[1])
+        if event == 'update_chart_data':
+            self.chart_data['column_map'][data[0][1]] = data[1]
+
+
+def write_csv(rows, path, seed=0):
+    """Dates in mixed full and partial formats with some unparseable ones, counts with stray strings and negatives."""
+    rng = np.random.default_rng(seed)
+    days = pd.Timestamp('2000-01-01') + pd.to_timedelta(rng.integers(0, 9000, rows), 'D')
+    dates = days.strftime('%Y-%m-%d').to_numpy().astype(object)
+    kind = rng.random(rows)
+    for low, high, fmt in [(0, 0.05, '%Y-%m'), (0.05, 0.08, '%m/%Y'), (0.08, 0.1, '%Y')]:
+        mask = (kind >= low) & (kind < high)
+        dates[mask] = days[mask].strftime(fmt)
+    dates[(kind >= 0.1) & (kind < 0.11)] = 'garbage'
+    correct = rng.integers(-3, 50, rows).astype(object)
+    correct[rng.random(rows) < 0.02] = ' 7 '
+    correct[rng.random(rows) < 0.02] = 'x'
+    pd.DataFrame({'Date': dates, 'Correct': correct, 'Incorrect': rng.integers(0, 20, rows),
+                  'o1': rng.normal(0, 5, rows), 'note': 'z'}).to_csv(path, index=False)
+
+
+def run_import(data_manager_module, path):
+    data_manager = object.__new__(data_manager_module.DataManager)
+    data_manager.chart_data = {'column_map': {'d': 'Date', 'c': 'Correct', 'i': 'Incorrect'}, 'date_format': None, 'type': 'Daily'}
+    data_manager.event_bus = ImportEventBus(data_manager.chart_data)
+    data_manager._validate_column_map = lambda df: True
+    data_manager.column_mapped_raw_data_import(path)
+    return data_manager.df_raw
+
+
+modules = versions(args, 'DataManager')
+sizes = [args.rows]
+while sizes[-1] * 10 <= args.largest:
+    sizes.append(sizes[-1] * 10)
+
+temp_dir = tempfile.mkdtemp()
+for rows in sizes:
+    path = os.path.join(temp_dir, f'import_{rows}.csv')
+    write_csv(rows, path)
+    frames = []
+    for label, module in modules:
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            run_import(module, path)
+            times.append(time.perf_counter() - start)
+        tracemalloc.start()
+        frames.append(run_import(module, path))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f'{label:>14}  {rows} rows  {min(times) * 1e3:.0f} ms  peak {peak / 2 ** 20:.0f} MB')
+    if len(frames) == 2:
+        # The row by row import left the count columns as object dtype, so compare their values as floats
+        baseline, current = (frame.apply(lambda column: column if column.name == 'd' else pd.to_numeric(column).astype(float))
+                             for frame in frames)
+        pd.testing.assert_frame_equal(baseline, current)
+        print(f'{"":>14}  imported values identical')
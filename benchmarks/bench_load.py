@@ -0,0 +1,34 @@
+# Loading a chart: the long to wide pivot of its data point rows and load_chart_data as a whole (user-011)
+import time
+
+from _common import parse_args, versions, open_repository, best_of
+
+import numpy as np
+import pandas as pd
+
+args = parse_args('Time the data point pivot and load_chart_data for a chart of about 100k cells', days=25_000)
+
+rng = np.random.default_rng(0)
+df = pd.DataFrame({'d': pd.date_range('2000-01-01', periods=args.days), 'm': rng.random(args.days),
+                   'c': rng.integers(0, 9, args.days).astype(float), 'i': rng.random(args.days), 'o1': rng.random(args.days)})
+df.loc[rng.random(args.days) < 0.3, 'i'] = np.nan
+select_rows = "SELECT date, sys_col, value FROM series WHERE chart_id = ?"
+
+frames = []
+for label, database in versions(args, 'database'):
+    data_manager, db, repo = open_repository(database)
+    data_manager.df_raw = df
+    repo.save_complete_chart()
+
+    results = db.execute_with_retry(select_rows, ('chart',), fetch='all')
+    pivot_seconds = best_of(lambda: repo._build_dataframe_from_results(results), 15)
+    load_seconds = best_of(lambda: repo.load_chart_data('chart'), 15)
+    fetch_seconds = best_of(lambda: db.execute_with_retry(select_rows, ('chart',), fetch='all'))
+    frames.append(repo._build_dataframe_from_results(results))
+    print(f'{label:>14}  {len(results)} cells  pivot {pivot_seconds * 1e3:.0f} ms  load_chart_data {load_seconds * 1e3:.0f} ms  '
+          f'fetch alone {fetch_seconds * 1e3:.0f} ms')
+
+if len(frames) == 2:
+    baseline, current = frames
+    pd.testing.assert_frame_equal(baseline[current.columns], current)
+    print('loaded frames identical')
@@ -0,0 +1,39 @@
+# Saving chart data points, end to end and as one prepared transaction (user-008)
+import time
+import inspect
+
+from _common import parse_args, versions, open_repository
+
+import numpy as np
+import pandas as pd
+
+args = parse_args('Time save_complete_chart and the data point transaction at 1k, 10k and 100k cells')
+insert_query = "INSERT OR REPLACE INTO series (chart_id, date, sys_col, value) VALUES (?, ?, ?, ?)"
+
+for label, database in versions(args, 'database'):
+    supports_bulk = "operation.get('many')" in inspect.getsource(database.SQLiteDatabase)  # Older revisions run one statement per operation
+    for cells in (1_000, 10_000, 100_000):
+        data_manager, db, repo = open_repository(database)
+        days = cells // 4
+        data_manager.df_raw = pd.DataFrame({'d': pd.date_range('2000-01-01', periods=days), 'm': 1.0,
+                                            'c': np.arange(days, dtype=float), 'i': 2.0, 'o1': 3.0})
+        repo.save_complete_chart()  # Create the chart, the timed save then rewrites it
+
+        # A different value in every cell, so no version can skip unchanged cells
+        data_manager.df_raw = data_manager.df_raw.assign(c=lambda df: df['c'] + 0.5, i=3.0, o1=4.0, m=2.0)
+        start = time.perf_counter()
+        repo.save_complete_chart()
+        save_seconds = time.perf_counter() - start
+
+        rows = [('chart', f'2000-{i:06d}', 'c', float(i)) for i in range(cells)]
+        operations = [{'query': 'DELETE FROM series WHERE chart_id = ?', 'params': ('chart',)}]
+        if supports_bulk:
+            operations.append({'query': insert_query, 'params': rows, 'many': True})
+        else:
+            operations += [{'query': insert_query, 'params': row} for row in rows]
+        db.execute_transaction(operations)
+        start = time.perf_counter()
+        db.execute_transaction(operations)
+        transaction_seconds = time.perf_counter() - start
+
+        print(f'{label:>14}  {cells:>7} cells  save {save_seconds:.3f} s  transaction {transaction_seconds:.3f} s')
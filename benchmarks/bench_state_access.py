@@ -0,0 +1,34 @@
+# Throughput of chart data and preference access through the event bus with debug flags off (user-005)
+import time
+
+from _common import parse_args, versions
+
+args = parse_args('Time get_chart_data, get_user_preference and update_chart_data emits', emits=200_000)
+
+
+class BenchDataManager:
+    # Only the state StateRegistry reads and writes
+    def __init__(self):
+        self.chart_data = {'type': 'Daily', 'column_map': {f'c{i}': f'col{i}' for i in range(50)},
+                           'notes': ['x' * 200] * 200, 'view': {'c': {'agg_type': 'raw'}}}
+        self.user_preferences = {'celeration_unit': 'Weekly'}
+
+
+cases = [
+    ('get type', 'get_chart_data', ['type', 'Daily']),
+    ('get column_map', 'get_chart_data', ['column_map', {}]),
+    ('get notes', 'get_chart_data', ['notes', []]),
+    ('get nested', 'get_chart_data', [['view', 'c', 'agg_type'], 'raw']),
+    ('get user pref', 'get_user_preference', ['celeration_unit', 'Weekly']),
+    ('update chart data', 'update_chart_data', ['type', 'Daily']),
+]
+
+for label, module in versions(args, 'EventStateManager'):
+    event_bus = module.EventBus()
+    state_registry = module.StateRegistry(BenchDataManager())
+    print(label)
+    for name, event, data in cases:
+        start = time.perf_counter()
+        for _ in range(args.emits):
+            event_bus.emit(event, data)
+        print(f'  {name:<18} {args.emits / (time.perf_counter() - start) / 1000:>6.0f}k emits/s')
@@ -0,0 +1,86 @@
+# sync_remotes against one remote location of 1000 synced charts, with optional simulated remote latency (user-020)
+import time
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from _common import parse_args, versions, FakeDataManager
+
+from PySide6.QtWidgets import QApplication
+
+args = parse_args('Time sync_remotes when nothing, 20 remote charts or 20 local charts changed',
+                  charts=1000, cells=100, latency_ms=0)
+app = QApplication([])
+
+
+def slow_remotes(database, latency):
+    # Every remote open waits 20 latencies, and every 1000 SQLite VM steps on a remote wait one
+    connect_remote = database.SQLiteDatabase.connect_remote
+
+    def connect(self, db_file):
+        time.sleep(latency * 20)
+        connection = connect_remote(self, db_file)
+        connection.set_progress_handler(lambda: time.sleep(latency) or 0, 1000)
+        return connection
+
+    database.SQLiteDatabase.connect_remote = connect
+
+
+def dump(connection):
+    return (connection.execute("SELECT chart_id, date, sys_col, value FROM series ORDER BY 1, 2, 3").fetchall(),
+            connection.execute("SELECT chart_id, metadata, metadata_hash, last_modified FROM chart ORDER BY 1").fetchall())
+
+
+results = []
+for label, database in versions(args, 'database'):
+    if args.latency_ms:
+        slow_remotes(database, args.latency_ms / 1000)
+    database.EventBus._instance = None
+
+    local_dir, remote_dir = tempfile.mkdtemp(), tempfile.mkdtemp()
+    data_manager = FakeDataManager(local_dir)
+    data_manager.user_preferences['db_location'] = {'local': local_dir, 'loc': remote_dir}
+    manager = database.SQLiteManager(data_manager)
+    manager.connect(local_dir)
+    data_manager.sqlite_manager = manager
+    db, sync_manager = manager.db, manager.sync_manager
+
+    for i in range(args.charts):
+        chart_id = f'c{i:04d}'
+        db.cursor.execute("INSERT INTO chart (chart_id, metadata, metadata_hash, last_modified, owner) "
+                          "VALUES (?, '{}', 'h', 1000, 'bench')", (chart_id,))
+        db.cursor.executemany("INSERT INTO series VALUES (?, ?, ?, ?)",
+                              [(chart_id, f'2000-{j:04d}', 'c', float(j)) for j in range(args.cells)])
+        db.cursor.execute("INSERT INTO chart_sync (chart_id, sync_location, last_sync) VALUES (?, 'loc', 0)", (chart_id,))
+    db.connection.commit()
+
+    def timed_sync():
+        start = time.perf_counter()
+        sync_manager.sync_remotes()
+        return (time.perf_counter() - start) * 1e3
+
+    first = timed_sync()
+    remote = sqlite3.connect(Path(remote_dir) / f'{db.DB_NAME}-loc.db')
+    unchanged = timed_sync()
+
+    # 20 charts edited on the remote, one cell each
+    for i in range(0, args.charts, args.charts // 20):
+        remote.execute("UPDATE chart SET last_modified = 2000, metadata_hash = 'r' WHERE chart_id = ?", (f'c{i:04d}',))
+        remote.execute("UPDATE series SET value = -1 WHERE chart_id = ? AND date = '2000-0005'", (f'c{i:04d}',))
+    remote.commit()
+    pulled = timed_sync()
+
+    # 20 charts edited locally, one cell added each, with a clock behind the remote edits
+    for i in range(args.charts // 40, args.charts, args.charts // 20):
+        db.cursor.execute("UPDATE chart SET last_modified = 1500, metadata_hash = 'l' WHERE chart_id = ?", (f'c{i:04d}',))
+        db.cursor.execute("INSERT INTO series VALUES (?, '2001-0001', 'i', 3.0)", (f'c{i:04d}',))
+    db.connection.commit()
+    pushed = timed_sync()
+
+    local_state, remote_state = dump(db.connection), dump(remote)
+    results.append(local_state)
+    print(f'{label:>14}  first {first:.0f} ms  nothing changed {unchanged:.0f} ms  20 remote edits {pulled:.0f} ms  '
+          f'20 local edits {pushed:.0f} ms  local equals remote {local_state == remote_state}')
+
+if len(results) == 2:
+    print('same local database as the baseline:', results[0] == results[1])
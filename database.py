@@ -1,5 +1,13 @@
 from app_imports import *
 from EventStateManager import EventBus
+import zlib
+import threading
+import contextlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # Packed series fall back to zlib
 
 
 # Debug flag and function
@@ -11,6 +19,137 @@ def debug_print(message):
         print(message)
 
 
+class PooledConnection(sqlite3.Connection):
+    # Connection handed out by RemoteConnectionPool, checked out from get() until its with block ends
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_lock = threading.RLock()  # Held while checked out, so other threads only close it between uses
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            return super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            self.use_lock.release()
+
+
+class RemoteConnectionPool:
+    # Keeps remote database connections open between uses, opening a file on a network or cloud drive is slow.
+    # Connections are used by the thread that opened them, so the pool holds one per file and thread.
+    # A connection is replaced when its file was replaced (cloud sync tools write a new file) or sat idle too long.
+    # Any thread may close a connection between uses, so a file can be closed everywhere before it is deleted.
+
+    IDLE_TIMEOUT = 60  # Seconds, idle connections are closed so sync tools are not kept from the file
+
+    def __init__(self, open_connection):
+        self.open_connection = open_connection  # Must return a PooledConnection usable from any thread
+        self.connections = {}  # (thread id, path) -> [connection, file signature, last use]
+        self.lock = threading.Lock()
+        self.stats = {'connects': 0, 'reuses': 0, 'reconnects': 0, 'connect_seconds': 0.0}
+
+    @staticmethod
+    def _file_signature(path):
+        """Identify the file behind a path, by inode or by mtime and size where the filesystem has no inodes."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        if stat.st_ino:
+            return stat.st_dev, stat.st_ino
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, db_file):
+        """Check out the calling thread's connection to db_file, reusing the last one if its file is unchanged.
+
+        Use it in a with block, leaving the block commits and returns it to the pool.
+        """
+        path = os.path.abspath(str(db_file))
+        key = (threading.get_ident(), path)
+        now = time.monotonic()
+        self.close_idle()
+
+        signature = self._file_signature(path)
+        with self.lock:
+            entry = self.connections.get(key)
+
+        if entry is not None:
+            entry[0].use_lock.acquire()
+            with self.lock:
+                pooled = self.connections.get(key) is entry  # Another thread may have closed it meanwhile
+
+            if pooled and signature is not None and signature == entry[1]:
+                entry[2] = now
+                with self.lock:
+                    self.stats['reuses'] += 1
+                return entry[0]
+
+            entry[0].use_lock.release()
+            if pooled:
+                debug_print(f"RemoteConnectionPool - {path} was replaced or removed, reconnecting")
+                self._close_entry(key, entry)
+                with self.lock:
+                    self.stats['reconnects'] += 1
+
+        start = time.perf_counter()
+        connection = self.open_connection(path)
+        elapsed = time.perf_counter() - start
+        connection.use_lock.acquire()
+        with self.lock:
+            self.stats['connects'] += 1
+            self.stats['connect_seconds'] += elapsed
+            self.connections[key] = [connection, signature or self._file_signature(path), now]
+        return connection
+
+    def _close_entry(self, key, entry, wait=True):
+        """Close a pooled connection once no thread has it checked out, False if it is in use and wait is off."""
+        if not entry[0].use_lock.acquire(blocking=wait):
+            return False
+
+        try:
+            with self.lock:
+                if self.connections.get(key) is not entry:
+                    return True  # Already closed by another thread
+                del self.connections[key]
+            entry[0].close()
+            return True
+        finally:
+            entry[0].use_lock.release()
+
+    def close_path(self, db_file):
+        """Close every thread's connection to db_file, waiting for uses in progress, e.g. before deleting the file."""
+        path = os.path.abspath(str(db_file))
+        with self.lock:
+            entries = [(key, entry) for key, entry in self.connections.items() if key[1] == path]
+        for key, entry in entries:
+            self._close_entry(key, entry)
+
+    def close_idle(self):
+        """Close connections of any thread left unused for IDLE_TIMEOUT, also run on a timer by SQLiteManager."""
+        now = time.monotonic()
+        with self.lock:
+            entries = [(key, entry) for key, entry in self.connections.items() if now - entry[2] > self.IDLE_TIMEOUT]
+        for key, entry in entries:
+            self._close_entry(key, entry, wait=False)  # Checked out connections are not idle
+
+    def close_all(self):
+        """Close all pooled connections, used before closing the application."""
+        with self.lock:
+            entries = list(self.connections.items())
+        for key, entry in entries:
+            self._close_entry(key, entry)
+
+    def get_stats(self):
+        """Connection counts, time spent connecting and the estimated time saved by reuses."""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['open'] = len(self.connections)
+
+        mean_connect = stats['connect_seconds'] / stats['connects'] if stats['connects'] else 0.0
+        stats['saved_seconds'] = stats['reuses'] * mean_connect
+        return stats
+
+
 class SQLiteDatabase:
     # Low-level database operations and connection management.
     # Handles schema creation, transactions, and basic CRUD operations.
@@ -19,7 +158,28 @@ class SQLiteDatabase:
     TABLE_CHART_METADATA = "chart"
     TABLE_CHART_SYNC = "chart_sync"
     TABLE_TOMBSTONES = "tombstones"
+    TABLE_SERIES_PACKED = "series_packed"
+    LOCAL_ONLY_TABLES = (TABLE_SERIES_PACKED,)  # Never created on remote databases, remotes hold rows only
     DB_NAME = 'opencelerator'
+    SCHEMA_VERSION = 2  # Stored in PRAGMA user_version, bump on ANY change to SCHEMA_DEFINITIONS, COLUMN_DEFAULTS or SCHEMA_UPGRADES
+    USE_CONNECTION_PROFILE = True  # Apply LOCAL_PRAGMAS / REMOTE_PRAGMAS on connect
+
+    # Local database is only opened by this process, so WAL is safe and avoids rewriting the journal per save
+    LOCAL_PRAGMAS = [
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA cache_size = -16000",  # 16 MB
+        "PRAGMA mmap_size = 67108864",  # 64 MB
+        "PRAGMA temp_store = MEMORY",
+    ]
+
+    # Remote databases live in shared or cloud-synced folders where WAL's shared memory index is unsafe
+    REMOTE_PRAGMAS = [
+        "PRAGMA journal_mode = DELETE",
+        "PRAGMA busy_timeout = 5000",
+        "PRAGMA cache_size = -8000",  # 8 MB
+        "PRAGMA temp_store = MEMORY",
+    ]
 
     # SINGLE SOURCE OF TRUTH FOR ALL SCHEMAS
     SCHEMA_DEFINITIONS = {
@@ -49,9 +209,23 @@ class SQLiteDatabase:
         'tombstones': {  # TABLE_TOMBSTONES
             'chart_id': 'TEXT PRIMARY KEY',
             'added': 'INTEGER'
+        },
+        'series_packed': {  # TABLE_SERIES_PACKED, compact local alternative to series
+            'chart_id': 'TEXT PRIMARY KEY',
+            'codec': 'TEXT',
+            'data': 'BLOB'
         }
     }
 
+    # Statements run once per database, keyed by the schema version that introduced them
+    SCHEMA_UPGRADES = {
+        1: [
+            f"CREATE INDEX IF NOT EXISTS idx_chart_sync_location ON {TABLE_CHART_SYNC} (sync_location)",
+            f"CREATE INDEX IF NOT EXISTS idx_tombstones_added ON {TABLE_TOMBSTONES} (added)",
+        ],
+        2: [],  # Stamps remote databases whose columns and defaults ensure_remote_columns has verified
+    }
+
     COLUMN_DEFAULTS = {
         'chart': {
             'owner': None,  # Will be set to current user
@@ -60,11 +234,18 @@ class SQLiteDatabase:
         }
     }
 
+    # Stored in PRAGMA application_id of remotes, so ensure_remote_columns runs again whenever the schema changes,
+    # even if SCHEMA_VERSION was not bumped
+    SCHEMA_FINGERPRINT = zlib.crc32(repr((SCHEMA_DEFINITIONS, COLUMN_DEFAULTS, SCHEMA_UPGRADES)).encode()) & 0x7FFFFFFF
+
     def __init__(self, data_manager):
         self.data_manager = data_manager
         self.connection = None
         self.cursor = None
         self.initialized = False
+        self.db_file = None
+        self.remote_pool = RemoteConnectionPool(self._open_remote)
+        self.local_write_lock = threading.RLock()  # Shared with the sync worker so local writes take turns
 
     def connect(self, db_path=None):
         """Establish database connection and create tables if needed."""
@@ -80,8 +261,12 @@ class SQLiteDatabase:
             self.connection = sqlite3.connect(str(db_file))
             self.cursor = self.connection.cursor()
             self.initialized = True
+            self.db_file = db_file
+            self._apply_pragmas(self.cursor, self.LOCAL_PRAGMAS)
             self._create_tables()
             self._ensure_new_columns()
+            self.apply_schema_upgrades(self.cursor)
+            self.connection.commit()
             
             # Count total charts after database connection
             try:
@@ -102,6 +287,65 @@ class SQLiteDatabase:
             self.initialized = False
             return False
 
+    def connect_worker(self, db_file):
+        """Open another connection to an already initialized local database, owned by the calling thread."""
+        if not db_file:
+            return False
+
+        try:
+            self.connection = sqlite3.connect(str(db_file))
+            self.cursor = self.connection.cursor()
+            self.initialized = True
+            self.db_file = db_file
+            self._apply_pragmas(self.cursor, self.LOCAL_PRAGMAS)
+            return True
+        except sqlite3.Error as e:
+            debug_print(f"Worker database connection error: {e}")
+            self.initialized = False
+            return False
+
+    def connect_remote(self, db_file):
+        """Get a pooled connection to a remote database file, see RemoteConnectionPool."""
+        return self.remote_pool.get(db_file)
+
+    def _open_remote(self, db_file):
+        """Open a connection to a remote database file with the remote connection profile."""
+        connection = sqlite3.connect(str(db_file), check_same_thread=False, factory=PooledConnection)
+        self._apply_pragmas(connection.cursor(), self.REMOTE_PRAGMAS)
+        return connection
+
+    def _apply_pragmas(self, cursor, pragmas):
+        """Apply a connection profile, skipping pragmas the database or filesystem refuses."""
+        if not self.USE_CONNECTION_PROFILE:
+            return
+
+        for pragma in pragmas:
+            try:
+                cursor.execute(pragma)
+                cursor.fetchall()
+            except sqlite3.Error as e:
+                debug_print(f"_apply_pragmas() - {pragma} failed: {e}")
+
+    def apply_schema_upgrades(self, cursor):
+        """Run SCHEMA_UPGRADES newer than the database's user_version, then record SCHEMA_VERSION."""
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        for upgrade_version in sorted(self.SCHEMA_UPGRADES):
+            if upgrade_version > version:
+                for statement in self.SCHEMA_UPGRADES[upgrade_version]:
+                    cursor.execute(statement)
+
+        cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        debug_print(f"apply_schema_upgrades() - upgraded schema from version {version} to {self.SCHEMA_VERSION}")
+
+    def stamp_remote_schema(self, cursor):
+        """Apply SCHEMA_UPGRADES and record SCHEMA_FINGERPRINT, marking a remote's columns and defaults as checked."""
+        self.apply_schema_upgrades(cursor)
+        cursor.execute(f"PRAGMA application_id = {self.SCHEMA_FINGERPRINT}")
+
     def close(self):
         """Close database connection."""
         if self.connection:
@@ -181,6 +425,9 @@ class SQLiteDatabase:
 
         # Handle deprecated columns
         self._remove_deprecated_columns()
+
+        # Move series data to the storage mode selected in preferences
+        self._migrate_series_storage()
         self.connection.commit()
         
         # Count charts after schema updates
@@ -222,6 +469,99 @@ class SQLiteDatabase:
                     except sqlite3.OperationalError:
                         pass  # SQLite version doesn't support DROP COLUMN
 
+    def _migrate_series_storage(self):
+        """Pack or unpack all local chart series to match the compact_series_storage preference."""
+        if self.compact_series_enabled():
+            self.cursor.execute(f"SELECT DISTINCT chart_id FROM {self.TABLE_DATA_POINTS}")
+            for (chart_id,) in self.cursor.fetchall():
+                self.cursor.execute(f"SELECT date, sys_col, value FROM {self.TABLE_DATA_POINTS} WHERE chart_id = ?", (chart_id,))
+                try:
+                    codec, data = self.pack_series(self.cursor.fetchall())
+                except ValueError as e:
+                    debug_print(f"_migrate_series_storage - keeping rows for \"{chart_id}\": {e}")
+                    continue
+                self.cursor.execute(f"INSERT OR REPLACE INTO {self.TABLE_SERIES_PACKED} (chart_id, codec, data) VALUES (?, ?, ?)",
+                                    (chart_id, codec, data))
+                self.cursor.execute(f"DELETE FROM {self.TABLE_DATA_POINTS} WHERE chart_id = ?", (chart_id,))
+                debug_print(f"_migrate_series_storage - packed chart \"{chart_id}\"")
+        else:
+            self.cursor.execute(f"SELECT chart_id, codec, data FROM {self.TABLE_SERIES_PACKED}")
+            for chart_id, codec, data in self.cursor.fetchall():
+                try:
+                    rows = self.series_frame_to_rows(self.unpack_series(codec, data))
+                except Exception as e:
+                    # Unknown codec, zstandard missing or a damaged blob, keep it so a later start can retry
+                    debug_print(f"_migrate_series_storage - keeping packed series for \"{chart_id}\": {e}")
+                    continue
+                self.cursor.executemany(f"INSERT OR REPLACE INTO {self.TABLE_DATA_POINTS} (chart_id, date, sys_col, value) VALUES (?, ?, ?, ?)",
+                                        [(chart_id, date, sys_col, value) for date, sys_col, value in rows])
+                self.cursor.execute(f"DELETE FROM {self.TABLE_SERIES_PACKED} WHERE chart_id = ?", (chart_id,))
+                debug_print(f"_migrate_series_storage - unpacked chart \"{chart_id}\"")
+
+    def compact_series_enabled(self):
+        """Whether local chart series are stored as packed blobs instead of one row per cell."""
+        return bool(self.data_manager.user_preferences.get('compact_series_storage', False))
+
+    def pivot_data_points(self, results):
+        """Pivot (date, sys_col, value) rows to one row per date string and one column per sys_col."""
+        df_long = pd.DataFrame(results, columns=['date', 'sys_col', 'value'])
+        date_codes, dates = pd.factorize(df_long['date'], sort=True)
+        col_codes, columns = pd.factorize(df_long['sys_col'], sort=True)
+
+        # (chart_id, date, sys_col) is the primary key, so every cell is written at most once
+        values = np.full((len(dates), len(columns)), np.nan)
+        values[date_codes, col_codes] = pd.to_numeric(df_long['value'], errors='coerce').to_numpy(dtype='float64')
+
+        df = pd.DataFrame(values, columns=list(columns))
+        df.insert(0, 'd', list(dates))
+        return df
+
+    def series_frame_to_rows(self, df):
+        """Convert a pivoted series frame back to (date, sys_col, value) rows, skipping empty cells."""
+        value_cols = [col for col in df.columns if col != 'd']
+        values = df[value_cols].to_numpy(dtype='float64')
+        row_idx, col_idx = np.nonzero(~np.isnan(values))
+
+        return list(zip(
+            df['d'].to_numpy(dtype=object)[row_idx].tolist(),
+            np.array(value_cols, dtype=object)[col_idx].tolist(),
+            values[row_idx, col_idx].tolist()
+        ))
+
+    def pack_series(self, results):
+        """Pack (date, sys_col, value) rows into int32 day offsets and one float64 array per sys_col."""
+        df = self.pivot_data_points(results)
+        days = (pd.to_datetime(df['d'], format='%Y-%m-%d') - pd.Timestamp('1970-01-01')).dt.days
+        value_cols = [col for col in df.columns if col != 'd']
+
+        buffer = io.BytesIO()
+        np.savez(buffer,
+                 days=days.to_numpy(dtype='int32'),
+                 sys_cols=np.array(value_cols, dtype=str),
+                 values=np.ascontiguousarray(df[value_cols].to_numpy(dtype='float64').T))
+
+        if zstandard is not None:
+            return 'npz-zstd', zstandard.ZstdCompressor(level=3).compress(buffer.getvalue())
+        return 'npz-zlib', zlib.compress(buffer.getvalue(), 6)
+
+    def unpack_series(self, codec, data):
+        """Unpack a series blob to the same frame pivot_data_points builds."""
+        if codec == 'npz-zstd':
+            if zstandard is None:
+                raise ValueError("zstandard is required to read this chart's series")
+            data = zstandard.ZstdDecompressor().decompress(data)
+        elif codec == 'npz-zlib':
+            data = zlib.decompress(data)
+        else:
+            raise ValueError(f"Unknown series codec: {codec}")
+
+        with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            dates = (np.datetime64('1970-01-01', 'D') + arrays['days'].astype('timedelta64[D]')).astype(str)
+            df = pd.DataFrame(arrays['values'].T, columns=arrays['sys_cols'].tolist())
+
+        df.insert(0, 'd', dates.tolist())
+        return df
+
     def _ensure_connection(self):
         """Ensure database connection is established."""
         if not self.initialized:
@@ -259,10 +599,18 @@ class SQLiteDatabase:
             return None
 
     def execute_transaction(self, operations):
+        # Saves on the UI thread and sync worker writes to the local database never interleave
+        with self.local_write_lock:
+            return self._execute_transaction(operations)
+
+    def _execute_transaction(self, operations):
         if not self._ensure_connection():
             return False
 
         try:
+            # FOREIGN KEY/CONSTRAINT CHECKING: Enable detailed error reporting (once, it is a no-op inside a transaction)
+            self.cursor.execute("PRAGMA foreign_keys = ON")
+
             # TRANSACTION STEP TRACKING: Log each SQL statement execution
             for i, operation in enumerate(operations):
                 query = operation['query']
@@ -272,11 +620,11 @@ class SQLiteDatabase:
                 query_type = query.split()[0].upper()
                 debug_print(f"execute_transaction - STEP_{i+1}: {query_type}")
                 
-                # FOREIGN KEY/CONSTRAINT CHECKING: Enable detailed error reporting
-                self.cursor.execute("PRAGMA foreign_keys = ON")
-                
                 try:
-                    if params:
+                    if operation.get('many'):
+                        # Bulk operation, params is a sequence of parameter tuples for one prepared statement
+                        self.cursor.executemany(query, params)
+                    elif params:
                         self.cursor.execute(query, params)
                     else:
                         self.cursor.execute(query)
@@ -329,21 +677,29 @@ class SQLiteDatabase:
             return False
 
     def prepare_metadata(self, chart_data=None):
-        """Prepare metadata for storage (removes raw_data)."""
-        metadata = copy.deepcopy(chart_data or self.data_manager.chart_data)
-        metadata.pop('raw_data', None)
-        metadata.pop('owner', None)  # Use DB column instead
-        return json.dumps(json.loads(json.dumps(metadata, default=str)))
+        """Prepare metadata for storage (removes raw_data) in a single serialization pass."""
+        chart_data = chart_data or self.data_manager.chart_data
+        # Owner uses the DB column instead, a shallow copy is enough since values are only read
+        metadata = {key: value for key, value in chart_data.items() if key not in ('raw_data', 'owner')}
+        return json.dumps(metadata, default=str)
 
     def calculate_metadata_hash(self, metadata_json):
         """Calculate MD5 hash of metadata."""
         return hashlib.md5(metadata_json.encode('utf-8')).hexdigest()
 
     def ensure_remote_columns(self, remote_cursor):
-        """Ensure remote database matches schema using same definitions."""
-        user_name = self._get_current_user_name()
+        """Ensure remote database matches schema using same definitions, skipped once its schema stamp is current."""
+        remote_cursor.execute("PRAGMA user_version")
+        version = remote_cursor.fetchone()[0]
+        remote_cursor.execute("PRAGMA application_id")
+        if version >= self.SCHEMA_VERSION and remote_cursor.fetchone()[0] == self.SCHEMA_FINGERPRINT:
+            return
 
+        user_name = self._get_current_user_name()
         for table_name, expected_schema in self.SCHEMA_DEFINITIONS.items():
+            if table_name in self.LOCAL_ONLY_TABLES:
+                continue
+
             # Get remote columns
             try:
                 remote_cursor.execute(f"PRAGMA table_info({table_name})")
@@ -351,6 +707,11 @@ class SQLiteDatabase:
             except sqlite3.OperationalError:
                 current_columns = {}
 
+            # Create missing tables, same as create_tables_for_remote
+            if not current_columns:
+                remote_cursor.execute(self._get_create_table_sql(table_name))
+                continue
+
             # Add missing columns
             for col_name, col_def in expected_schema.items():
                 if col_name.startswith('_'):
@@ -372,6 +733,12 @@ class SQLiteDatabase:
                         (default_value,)
                     )
 
+        # Stamp the version last, so an interrupted check runs again
+        try:
+            self.stamp_remote_schema(remote_cursor)
+        except sqlite3.OperationalError as e:
+            debug_print(f"ensure_remote_columns() - schema upgrade skipped: {e}")
+
     def vacuum_database(self, respect_time_limit=True):
         """Vacuum database to reclaim space"""
         if not self.initialized or not self.connection:
@@ -420,18 +787,21 @@ class SQLiteDatabase:
                     pass
 
     def cleanup_journal(self):
-        """Clean up database journal files."""
+        """Fold the WAL back into the database file without leaving WAL mode."""
         try:
-            self.cursor.execute("PRAGMA journal_mode=DELETE")
-            self.cursor.execute("PRAGMA wal_checkpoint(FULL)")
+            self.cursor.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            self.cursor.fetchall()
         except sqlite3.Error as e:
             debug_print(f"Error cleaning up journal: {e}")
 
     def create_tables_for_remote(self, remote_cursor):
         """Create tables on remote using same schema definitions."""
         for table_name in self.SCHEMA_DEFINITIONS:
+            if table_name in self.LOCAL_ONLY_TABLES:
+                continue
             sql = self._get_create_table_sql(table_name)
             remote_cursor.execute(sql)
+        self.stamp_remote_schema(remote_cursor)
 
         # Set defaults
         user_name = self._get_current_user_name()
@@ -449,6 +819,8 @@ class SQLiteDatabase:
 
 
 class TombstoneManager:
+    TOMBSTONE_RETENTION = 180 * 24 * 60 * 60  # Seconds a remote tombstone is kept, clients offline for longer may resurrect the chart
+
     def __init__(self, db: 'SQLiteDatabase', data_manager):
         self.db = db
         self.data_manager = data_manager
@@ -456,10 +828,7 @@ class TombstoneManager:
     def is_tombstoned(self, remote_cursor, chart_id):
         """Check if a chart_id is tombstoned in the remote database"""
         try:
-            # Use centralized schema to create tombstones table
-            sql = self.db._get_create_table_sql(self.db.TABLE_TOMBSTONES)
-            remote_cursor.execute(sql)
-
+            # A remote without tombstones table has no tombstones
             remote_cursor.execute(f"SELECT 1 FROM {self.db.TABLE_TOMBSTONES} WHERE chart_id = ?", (chart_id,))
             found = remote_cursor.fetchone() is not None
             
@@ -482,7 +851,7 @@ class TombstoneManager:
 
         if remote_db_path.exists():
             try:
-                with sqlite3.connect(str(remote_db_path)) as remote_conn:
+                with self.db.connect_remote(remote_db_path) as remote_conn:
                     remote_cursor = remote_conn.cursor()
 
                     # Use centralized schema to create tombstones table
@@ -499,14 +868,14 @@ class TombstoneManager:
                 debug_print(f"Error adding tombstone to {location_key}: {e}")
 
     def process_tombstones(self, remote_cursor):
-        """Process tombstones: delete local charts and remove from remote"""
+        """Process tombstones: delete local charts and remove from remote, returns the set of tombstoned chart_ids"""
         try:
             # Use centralized schema to create tombstones table
             sql = self.db._get_create_table_sql(self.db.TABLE_TOMBSTONES)
             remote_cursor.execute(sql)
 
             remote_cursor.execute(f"SELECT chart_id FROM {self.db.TABLE_TOMBSTONES}")
-            tombstoned_chart_ids = [row[0] for row in remote_cursor.fetchall()]
+            tombstoned_chart_ids = {row[0] for row in remote_cursor.fetchall()}
             
             # Extract location from remote cursor if possible, or use generic identifier
             location = "unknown_location"  # Default fallback since we can't easily extract from cursor
@@ -521,52 +890,41 @@ class TombstoneManager:
             debug_print(f"process_tombstones - location=\"{location}\", tombstones_found={len(tombstoned_chart_ids)}")
             
             # Log first 3 tombstoned chart IDs for debugging
-            first_three_ids = tombstoned_chart_ids[:3] if tombstoned_chart_ids else []
+            first_three_ids = sorted(tombstoned_chart_ids)[:3]
             debug_print(f"process_tombstones - tombstoned_chart_ids={first_three_ids}")
 
-            for tombstone_chart_id in tombstoned_chart_ids:
-                # Delete local chart
-                local_result = self.db.execute_with_retry(
-                    f"SELECT chart_id FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
-                    (tombstone_chart_id,),
-                    fetch='one'
-                )
-
-                if local_result:
-                    chart_id = local_result[0]
-                    debug_print(f"process_tombstones - deleting local chart \"{chart_id}\"")
-                    self.db.execute_with_retry(
-                        f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?",
-                        (chart_id,)
-                    )
-                    self.db.execute_with_retry(
-                        f"DELETE FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
-                        (chart_id,)
-                    )
-                    self.db.execute_with_retry(
-                        f"DELETE FROM {self.db.TABLE_CHART_SYNC} WHERE chart_id = ?",
-                        (chart_id,)
-                    )
+            if tombstoned_chart_ids:
+                # Delete local charts
+                chart_ids = list(tombstoned_chart_ids)
+                operations = []
+                for start in range(0, len(chart_ids), ChartRepository.QUERY_BATCH_SIZE):
+                    batch = tuple(chart_ids[start:start + ChartRepository.QUERY_BATCH_SIZE])
+                    placeholders = ', '.join('?' * len(batch))
+                    for table in (self.db.TABLE_DATA_POINTS, self.db.TABLE_SERIES_PACKED,
+                                  self.db.TABLE_CHART_METADATA, self.db.TABLE_CHART_SYNC):
+                        operations.append({'query': f"DELETE FROM {table} WHERE chart_id IN ({placeholders})", 'params': batch})
+                self.db.execute_transaction(operations)
 
-                # Delete remote chart
-                remote_cursor.execute(
-                    f"SELECT chart_id FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
-                    (tombstone_chart_id,)
-                )
-                remote_result = remote_cursor.fetchone()
+                # Delete remote charts
+                for table in (self.db.TABLE_DATA_POINTS, self.db.TABLE_CHART_METADATA):
+                    remote_cursor.execute(
+                        f"DELETE FROM {table} WHERE chart_id IN (SELECT chart_id FROM {self.db.TABLE_TOMBSTONES})")
+                debug_print(f"process_tombstones - deleted {remote_cursor.rowcount} remote charts")
 
-                if remote_result:
-                    chart_id = remote_result[0]
-                    debug_print(f"process_tombstones - deleting remote chart \"{chart_id}\"")
-                    remote_cursor.execute(f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", (chart_id,))
-                    remote_cursor.execute(f"DELETE FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?", (chart_id,))
+            # Age out tombstones, ones without a time start aging now
+            current_time = int(time.time())
+            remote_cursor.execute(f"UPDATE {self.db.TABLE_TOMBSTONES} SET added = ? WHERE added IS NULL", (current_time,))
+            remote_cursor.execute(f"DELETE FROM {self.db.TABLE_TOMBSTONES} WHERE added < ?",
+                                  (current_time - self.TOMBSTONE_RETENTION,))
+            if remote_cursor.rowcount:
+                debug_print(f"process_tombstones - removed {remote_cursor.rowcount} expired tombstones")
 
             remote_cursor.connection.commit()
-            if self.db.connection:
-                self.db.connection.commit()
+            return tombstoned_chart_ids
 
         except Exception as e:
             debug_print(f"Error processing tombstones: {e}")
+            return set()
 
     def add_tombstones_for_chart_deletion(self, chart_id, chart_owner):
         """Add tombstones to all remote locations when a chart is deleted by its owner"""
@@ -605,11 +963,23 @@ class ChartRepository:
     # Manages chart data persistence, metadata handling, and chart-specific business logic.
     # Handles chart CRUD operations, permissions, and import/export functionality.
 
+    # Saves rewriting more than this fraction of a chart's cells replace all cells instead of applying a delta
+    DELTA_SAVE_MAX_FRACTION = 0.5
+    QUERY_BATCH_SIZE = 500  # Chart IDs per IN (...) query, older SQLite builds allow 999 parameters
+
     def __init__(self, db: 'SQLiteDatabase', data_manager, event_bus):
         self.db = db
         self.data_manager = data_manager
         self.event_bus = event_bus
 
+        # (chart_id, chart_data dict, generation) when the chart last matched its stored metadata.
+        # Holding the dict means a reloaded chart never matches, even if the new dict reuses its id.
+        self.clean_generation = None
+
+        # (chart_id, (last_modified, metadata_hash), df) of the row stored series last loaded or saved.
+        # Saves diff against it instead of reading every stored cell back, while the stored version is unchanged.
+        self.persisted_series = None
+
     def save_complete_chart(self):
         """Save complete chart (data + metadata) to database."""
         debug_print('save complete chart ran')
@@ -629,24 +999,16 @@ class ChartRepository:
         if not permissions['can_save']:
             return False
 
-        operations = [
-            {'query': f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", 'params': (chart_id,)},
-            {'query': f"DELETE FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?", 'params': (chart_id,)},
-        ]
-
-        # Add data point operations
-        if not df_data.empty:
-            data_rows = self._prepare_data_points(chart_id, df_data)
-            for row in data_rows:
-                operations.append({
-                    'query': f"INSERT OR REPLACE INTO {self.db.TABLE_DATA_POINTS} (chart_id, date, sys_col, value) VALUES (?, ?, ?, ?)",
-                    'params': row
-                })
+        # Only write the data point cells that changed since the last save
+        operations, stored_as_rows = self._get_data_point_operations(chart_id, df_data)
+        operations.append(
+            {'query': f"DELETE FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?", 'params': (chart_id,)}
+        )
 
         # Add metadata operation
         metadata_json = self.db.prepare_metadata(chart_data)
         metadata_hash = self.db.calculate_metadata_hash(metadata_json)
-        thumbnail_data = self.data_manager.event_bus.emit('get_thumbnail', {'size': (96, 96)})
+        thumbnail_data = self._get_save_thumbnail(chart_id, metadata_hash)
 
         operations.append({
             'query': f"""INSERT OR REPLACE INTO {self.db.TABLE_CHART_METADATA} 
@@ -660,6 +1022,8 @@ class ChartRepository:
 
         if success:
             self.db.cleanup_journal()
+            self.clean_generation = self._get_chart_generation(chart_id)
+            self.persisted_series = (chart_id, (last_modified, metadata_hash), df_data) if stored_as_rows else None
             # Return data for sync operations
             return {
                 'chart_id': chart_id,
@@ -670,6 +1034,34 @@ class ChartRepository:
 
         return False
 
+    def _get_save_thumbnail(self, chart_id, metadata_hash):
+        """Get the thumbnail to save, keeping the stored one while a changed chart's thumbnail is encoded."""
+        thumbnail_data = self.event_bus.emit('get_thumbnail', {'size': (480, 400), 'chart_id': chart_id,
+                                                               'metadata_hash': metadata_hash})
+        if thumbnail_data is None:
+            # Written by update_chart_thumbnail once the background encode finishes
+            thumbnail_data = self.get_chart_thumbnail(chart_id)
+
+        return thumbnail_data
+
+    def update_chart_thumbnail(self, data):
+        """Store a thumbnail that finished encoding after its chart was saved."""
+        chart_id = data['chart_id']
+
+        if not self.db._ensure_connection():
+            return False
+
+        success = self.db.execute_with_retry(
+            f"UPDATE {self.db.TABLE_CHART_METADATA} SET thumbnail = ? WHERE chart_id = ?",
+            (data['thumbnail'], chart_id)
+        )
+
+        if success:
+            self.db.connection.commit()
+            return {'success': True, 'chart_id': chart_id, 'thumbnail': data['thumbnail']}
+
+        return {'success': False}
+
     def load_chart_data(self, chart_id):
         """Load chart data from database and return as DataFrame."""
         debug_print(f"load_chart_data() - attempting to load chart: \"{chart_id}\"")
@@ -693,6 +1085,18 @@ class ChartRepository:
             available_chart_ids = [row[0] for row in all_charts] if all_charts else []
             debug_print(f"load_chart_data() - available charts in database: {available_chart_ids}")
         
+        # Load metadata
+        metadata_loaded = self._load_chart_metadata(chart_id)
+        debug_print(f"load_chart_data() - metadata loaded successfully: {metadata_loaded}")
+
+        # Load packed data points
+        self.persisted_series = None
+        df_packed = self._load_packed_series(chart_id)
+        if df_packed is not None:
+            debug_print(f"load_chart_data() - loaded packed series for chart \"{chart_id}\"")
+            df_packed['d'] = pd.to_datetime(df_packed['d'])
+            return df_packed
+
         # Load data points
         results = self.db.execute_with_retry(
             f"SELECT date, sys_col, value FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?",
@@ -700,16 +1104,14 @@ class ChartRepository:
             fetch='all'
         )
 
-        # Load metadata
-        metadata_loaded = self._load_chart_metadata(chart_id)
-        debug_print(f"load_chart_data() - metadata loaded successfully: {metadata_loaded}")
-
         if not results:
             debug_print(f"load_chart_data() - no data points found for chart \"{chart_id}\"")
             return pd.DataFrame()
 
         debug_print(f"load_chart_data() - found {len(results)} data points for chart \"{chart_id}\"")
-        return self._build_dataframe_from_results(results)
+        df = self._build_dataframe_from_results(results)
+        self.persisted_series = (chart_id, self._get_stored_version(chart_id), df.copy())
+        return df
 
     def delete_chart(self, chart_id):
         """Delete chart data and metadata from database."""
@@ -737,12 +1139,14 @@ class ChartRepository:
 
             operations = [
                 {'query': f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", 'params': (chart_id,)},
+                {'query': f"DELETE FROM {self.db.TABLE_SERIES_PACKED} WHERE chart_id = ?", 'params': (chart_id,)},
                 {'query': f"DELETE FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?", 'params': (chart_id,)},
             ]
 
             success = self.db.execute_transaction(operations)
 
             if success:
+                self._forget_persisted_series(chart_id)
                 debug_print(f"delete_chart - chart_id=\"{chart_id}\", owner=\"{chart_owner}\", sync_count={sync_count}")
                 # Return info needed for tombstone creation
                 return {
@@ -782,15 +1186,34 @@ class ChartRepository:
             if not can_save:
                 return False
 
+            # Changes made through update_chart_data since the chart was last clean need no hashing
+            current_generation = self._get_chart_generation(chart_id)
+            if self._is_same_chart_state(self.clean_generation, current_generation) \
+                    and self.clean_generation[2] != current_generation[2]:
+                return True
+
             current_metadata_json = self.db.prepare_metadata()
             current_hash = self.db.calculate_metadata_hash(current_metadata_json)
 
-            return stored_hash != current_hash
+            if stored_hash == current_hash:
+                self.clean_generation = current_generation
+                return False
+
+            return True
 
         except Exception as e:
             debug_print(f"Error checking if chart has changed: {e}")
             return True
 
+    def _get_chart_generation(self, chart_id):
+        """Identify the current chart_data state as (chart_id, chart_data dict, generation)."""
+        return chart_id, self.data_manager.chart_data, self.event_bus.emit('get_chart_data_generation')
+
+    def _is_same_chart_state(self, clean_generation, current_generation):
+        """Whether both generations belong to the same chart and the same chart_data dict."""
+        return (clean_generation is not None and clean_generation[0] == current_generation[0]
+                and clean_generation[1] is current_generation[1])
+
     def get_chart_metadata(self, chart_id):
         """Get chart metadata including thumbnail"""
         if not self.db._ensure_connection():
@@ -825,6 +1248,25 @@ class ChartRepository:
 
         return result[0] if result and result[0] else None
 
+    def get_chart_thumbnails(self, chart_ids):
+        """Get thumbnails for a list of chart IDs as {chart_id: png bytes}, skipping charts without one"""
+        if not chart_ids or not self.db._ensure_connection():
+            return {}
+
+        thumbnails = {}
+        chart_ids = list(chart_ids)
+        for start in range(0, len(chart_ids), self.QUERY_BATCH_SIZE):
+            batch = chart_ids[start:start + self.QUERY_BATCH_SIZE]
+            results = self.db.execute_with_retry(
+                f"SELECT chart_id, thumbnail FROM {self.db.TABLE_CHART_METADATA} "
+                f"WHERE chart_id IN ({', '.join('?' * len(batch))}) AND thumbnail IS NOT NULL",
+                batch,
+                fetch='all'
+            )
+            thumbnails.update(results or [])
+
+        return thumbnails
+
     def get_chart_permissions(self, chart_id):
         """Get permission information for a chart"""
         if not self.db._ensure_connection():
@@ -866,28 +1308,96 @@ class ChartRepository:
 
         chart_info = {}
         current_user_name = self.db._get_current_user_name()
+        chart_ids = list(chart_ids)
 
-        for chart_id in chart_ids:
+        # Query in batches to stay below SQLite's bound parameter limit
+        for start in range(0, len(chart_ids), self.QUERY_BATCH_SIZE):
+            batch = chart_ids[start:start + self.QUERY_BATCH_SIZE]
             try:
-                result = self.db.execute_with_retry(
-                    f"SELECT owner FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
-                    (chart_id,),
-                    fetch='one'
+                results = self.db.execute_with_retry(
+                    f"SELECT chart_id, owner FROM {self.db.TABLE_CHART_METADATA} "
+                    f"WHERE chart_id IN ({', '.join('?' * len(batch))})",
+                    batch,
+                    fetch='all'
                 )
 
-                if result:
-                    owner = result[0] or current_user_name
-                    is_owner = (owner == current_user_name)
+                for chart_id, owner in results or []:
+                    owner = owner or current_user_name
                     chart_info[chart_id] = {
                         'owner': owner,
-                        'is_owner': is_owner
+                        'is_owner': owner == current_user_name
                     }
 
             except Exception as e:
-                debug_print(f"Error getting chart info for {chart_id}: {e}")
+                debug_print(f"Error getting chart info for batch starting at {batch[0]}: {e}")
 
         return chart_info
 
+    def get_chart_browser_items(self, location):
+        """Get display fields and permissions of every chart in a location with one query, thumbnails load separately"""
+        if not self.db._ensure_connection():
+            return []
+
+        # Only the fields shown in the browser are extracted, parsing full metadata per chart dominated load time
+        display_columns = ("json_extract(c.metadata, '$.type'), "
+                           "CASE WHEN json_type(c.metadata, '$.credit') = 'array' "
+                           "THEN json_extract(c.metadata, '$.credit') END")
+        results = self._query_chart_browser_items(location, display_columns)
+        extracted = results is not None
+        if not extracted:
+            # SQLite built without JSON support or query failed, fall back to parsing metadata in Python
+            debug_print(f"get_chart_browser_items - json_extract query failed for {location}, parsing metadata")
+            results = self._query_chart_browser_items(location, "c.metadata, NULL")
+
+        current_user_name = self.db._get_current_user_name()
+        items = []
+        for chart_id, first_field, credit_json, has_thumbnail, last_modified, owner, accepting_changes in results or []:
+            try:
+                if extracted:
+                    metadata = {'type': first_field or 'Unknown', 'credit': json.loads(credit_json) if credit_json else []}
+                else:
+                    metadata = json.loads(first_field)
+            except (TypeError, json.JSONDecodeError) as e:
+                debug_print(f"Error parsing metadata for chart {chart_id}: {e}")
+                continue
+
+            is_owner = (owner == current_user_name)
+            items.append({
+                'chart_id': chart_id,
+                'metadata': metadata,
+                'has_thumbnail': bool(has_thumbnail),
+                'last_modified': last_modified,
+                'owner': owner,
+                'permissions': {
+                    'is_owner': is_owner,
+                    'has_write_access': is_owner or bool(accepting_changes),
+                    'accepting_changes': bool(accepting_changes)
+                }
+            })
+
+        return items
+
+    def _query_chart_browser_items(self, location, display_columns):
+        """Select chart_id, two display columns, thumbnail presence, last_modified, owner and accepting_changes for a location."""
+        columns = (f"c.chart_id, {display_columns}, length(c.thumbnail) > 0, c.last_modified, "
+                   f"c.owner, c.accepting_changes")
+        if location == 'local':
+            # Local charts are the ones not synced anywhere
+            return self.db.execute_with_retry(
+                f"SELECT {columns} FROM {self.db.TABLE_CHART_METADATA} c "
+                f"WHERE NOT EXISTS (SELECT 1 FROM {self.db.TABLE_CHART_SYNC} s WHERE s.chart_id = c.chart_id) "
+                f"ORDER BY c.rowid",
+                fetch='all'
+            )
+
+        return self.db.execute_with_retry(
+            f"SELECT {columns} FROM {self.db.TABLE_CHART_SYNC} s "
+            f"JOIN {self.db.TABLE_CHART_METADATA} c ON c.chart_id = s.chart_id "
+            f"WHERE s.sync_location = ? ORDER BY s.rowid",
+            (location,),
+            fetch='all'
+        )
+
     def get_all_chart_ids(self):
         """Get list of all chart IDs in database."""
         if not self.db._ensure_connection():
@@ -1030,27 +1540,20 @@ class ChartRepository:
                 return False
 
             # Get chart data points from database
-            data_points_result = self.db.execute_with_retry(
-                f"SELECT date, sys_col, value FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?",
-                (chart_id,),
-                fetch='all'
-            )
+            df_wide = self._load_packed_series(chart_id)
+            if df_wide is None:
+                data_points_result = self.db.execute_with_retry(
+                    f"SELECT date, sys_col, value FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?",
+                    (chart_id,),
+                    fetch='all'
+                )
+                df_wide = self.db.pivot_data_points(data_points_result) if data_points_result else None
 
             # Convert data points back to DataFrame format and add to raw_data
-            if data_points_result:
-                # Group data points by date
-                dates = sorted(set(row[0] for row in data_points_result))
-                columns = set(row[1] for row in data_points_result)
-
-                # Build raw_data structure
-                raw_data = {'d': dates}
-                for col in columns:
-                    raw_data[col] = [None] * len(dates)
+            if df_wide is not None and not df_wide.empty:
 
-                # Fill in the data
-                date_to_index = {date: idx for idx, date in enumerate(dates)}
-                for date, col, value in data_points_result:
-                    raw_data[col][date_to_index[date]] = value
+                # Empty cells are exported as null
+                raw_data = df_wide.astype(object).where(df_wide.notna(), None).to_dict('list')
 
                 chart_json['raw_data'] = raw_data
             else:
@@ -1119,6 +1622,10 @@ class ChartRepository:
                     'query': f"UPDATE {self.db.TABLE_DATA_POINTS} SET chart_id = ? WHERE chart_id = ?",
                     'params': (new_chart_id, chart_id)
                 },
+                {
+                    'query': f"UPDATE {self.db.TABLE_SERIES_PACKED} SET chart_id = ? WHERE chart_id = ?",
+                    'params': (new_chart_id, chart_id)
+                },
                 # Update chart_id and metadata in chart table
                 {
                     'query': f"UPDATE {self.db.TABLE_CHART_METADATA} SET chart_id = ?, metadata = ?, metadata_hash = ? WHERE chart_id = ?",
@@ -1135,6 +1642,8 @@ class ChartRepository:
             success = self.db.execute_transaction(operations)
 
             if success:
+                self._forget_persisted_series(chart_id)
+
                 # Add tombstones to remote databases
                 current_user_name = self.db._get_current_user_name()
                 if chart_owner == current_user_name:
@@ -1275,32 +1784,162 @@ class ChartRepository:
             'preserve_accepting_changes': preserve_accepting_changes
         }
 
+    def _get_data_point_operations(self, chart_id, df_data):
+        """Build (operations, stored as rows) applying only changed cells, or a full rewrite if most changed."""
+        data_rows = self._prepare_data_points(chart_id, df_data) if not df_data.empty else []
+
+        if self.db.compact_series_enabled():
+            packed_operations = self._get_packed_series_operations(chart_id, data_rows)
+            if packed_operations is not None:
+                return packed_operations, False
+
+        insert_query = f"INSERT OR REPLACE INTO {self.db.TABLE_DATA_POINTS} (chart_id, date, sys_col, value) VALUES (?, ?, ?, ?)"
+        full_rewrite = [
+            {'query': f"DELETE FROM {self.db.TABLE_SERIES_PACKED} WHERE chart_id = ?", 'params': (chart_id,)},
+            {'query': f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", 'params': (chart_id,)},
+            {'query': insert_query, 'params': data_rows, 'many': True},
+        ]
+
+        persisted = self._get_persisted_rows(chart_id)
+        cell_changes = self._get_cell_changes(chart_id, persisted, [row[1:] for row in data_rows])
+        if cell_changes is None:
+            return full_rewrite, True
+
+        upserts, deletes = cell_changes
+        operations = []
+        if deletes:
+            operations.append({
+                'query': f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ? AND date = ? AND sys_col = ?",
+                'params': deletes,
+                'many': True
+            })
+        if upserts:
+            operations.append({'query': insert_query, 'params': upserts, 'many': True})
+
+        return operations, True
+
+    def _get_persisted_rows(self, chart_id):
+        """Stored (date, sys_col, value) rows of a chart, from persisted_series while the stored version is unchanged."""
+        if self.persisted_series is not None and self.persisted_series[0] == chart_id:
+            # One single row read confirms that no sync, import or other save replaced the series since
+            stored_version = self._get_stored_version(chart_id)
+            _, version, df = self.persisted_series
+            if stored_version is not None and stored_version == version:
+                return [row[1:] for row in self._prepare_data_points(chart_id, df)] if not df.empty else []
+
+        return self.db.execute_with_retry(
+            f"SELECT date, sys_col, value FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?",
+            (chart_id,),
+            fetch='all'
+        )
+
+    def _get_stored_version(self, chart_id):
+        """Identify the stored version of a chart as (last_modified, metadata_hash), None if it is not stored."""
+        result = self.db.execute_with_retry(
+            f"SELECT COALESCE(last_modified, 0), metadata_hash FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
+            (chart_id,),
+            fetch='one'
+        )
+        return tuple(result) if result else None
+
+    def _forget_persisted_series(self, chart_id):
+        """Drop persisted_series of a chart that was deleted or renamed."""
+        if self.persisted_series is not None and self.persisted_series[0] == chart_id:
+            self.persisted_series = None
+
+    def _get_cell_changes(self, chart_id, persisted, rows):
+        """Diff stored (date, sys_col, value) rows against new ones as (upserts, deletes), or None if a full rewrite is cheaper."""
+        if not persisted:
+            return None
+
+        # Later rows win on duplicate cells, same as INSERT OR REPLACE
+        old_cells = {(date, sys_col): value for date, sys_col, value in persisted}
+        new_cells = {(date, sys_col): value for date, sys_col, value in rows}
+
+        upserts = [(chart_id, date, sys_col, value) for (date, sys_col), value in new_cells.items()
+                   if old_cells.get((date, sys_col)) != value]
+        deletes = [(chart_id, date, sys_col) for (date, sys_col) in old_cells.keys() - new_cells.keys()]
+
+        changed = len(upserts) + len(deletes)
+        debug_print(f"_get_cell_changes - chart={chart_id}, upserts={len(upserts)}, deletes={len(deletes)}, persisted={len(old_cells)}")
+        if changed > self.DELTA_SAVE_MAX_FRACTION * max(len(old_cells), len(new_cells)):
+            return None
+
+        return upserts, deletes
+
+    def _get_packed_series_operations(self, chart_id, data_rows):
+        """Build operations replacing the chart's series with one packed blob, or None if the dates can't be packed."""
+        # A blob can't be patched per cell, so any change rewrites it, an unchanged series writes nothing
+        try:
+            df_packed = self._load_packed_series(chart_id)
+        except Exception:
+            df_packed = None  # Unreadable blob, replace it
+        if df_packed is not None:
+            stored_cells = {(date, sys_col): value for date, sys_col, value in self.db.series_frame_to_rows(df_packed)}
+            if stored_cells == {(date, sys_col): value for _, date, sys_col, value in data_rows}:
+                return []
+
+        operations = [
+            {'query': f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", 'params': (chart_id,)},
+            {'query': f"DELETE FROM {self.db.TABLE_SERIES_PACKED} WHERE chart_id = ?", 'params': (chart_id,)},
+        ]
+        if data_rows:
+            try:
+                codec, data = self.db.pack_series([row[1:] for row in data_rows])
+            except ValueError as e:
+                debug_print(f"save_complete_chart - series not packed, saving rows: {e}")
+                return None
+
+            operations.append({
+                'query': f"INSERT INTO {self.db.TABLE_SERIES_PACKED} (chart_id, codec, data) VALUES (?, ?, ?)",
+                'params': (chart_id, codec, data)
+            })
+
+        return operations
+
     def _prepare_data_points(self, chart_id, df_data):
-        """Prepare data points for database insertion"""
-        rows = []
-        for _, row in df_data.iterrows():
-            date = row['d'].strftime('%Y-%m-%d') if hasattr(row['d'], 'strftime') else str(row['d'])
+        """Prepare data points for database insertion as (chart_id, date, sys_col, value) rows"""
+        value_cols = [col for col in df_data.columns if col != 'd']
+        if pd.api.types.is_datetime64_any_dtype(df_data['d']):
+            dates = df_data['d'].dt.strftime('%Y-%m-%d').to_numpy(dtype=object)
+        else:
+            dates = np.array([d.strftime('%Y-%m-%d') if hasattr(d, 'strftime') else str(d) for d in df_data['d']], dtype=object)
+
+        # Long format in row-major order (row by row, then column), skipping empty cells
+        values = df_data[value_cols].to_numpy(dtype='float64')
+        row_idx, col_idx = np.nonzero(~np.isnan(values))
 
-            for col in row.index:
-                if col != 'd' and not pd.isna(row[col]):
-                    rows.append((chart_id, date, col, float(row[col])))
+        return list(zip(
+            [chart_id] * len(row_idx),
+            dates[row_idx].tolist(),
+            np.array(value_cols, dtype=object)[col_idx].tolist(),
+            values[row_idx, col_idx].tolist()
+        ))
 
-        return rows
+    def _load_packed_series(self, chart_id, cursor=None):
+        """Load the packed series frame of a chart, or None if its series are stored as rows."""
+        cursor = cursor or self.db.cursor
+        try:
+            cursor.execute(f"SELECT codec, data FROM {self.db.TABLE_SERIES_PACKED} WHERE chart_id = ?", (chart_id,))
+            result = cursor.fetchone()
+        except sqlite3.OperationalError:
+            return None  # Database without packed series table
 
-    def _build_dataframe_from_results(self, results):
-        """Build DataFrame from database query results."""
-        dates = sorted(set(row[0] for row in results))
-        columns = set(row[1] for row in results)
+        return self.db.unpack_series(*result) if result else None
 
-        data_dict = {'d': dates}
-        for col in columns:
-            data_dict[col] = [None] * len(dates)
+    def _fetch_data_points(self, chart_id, cursor=None):
+        """Fetch (date, sys_col, value) rows of a chart regardless of storage mode."""
+        df_packed = self._load_packed_series(chart_id, cursor)
+        if df_packed is not None:
+            return self.db.series_frame_to_rows(df_packed)
 
-        date_to_index = {date: idx for idx, date in enumerate(dates)}
-        for date, col, value in results:
-            data_dict[col][date_to_index[date]] = value
+        cursor = cursor or self.db.cursor
+        cursor.execute(f"SELECT date, sys_col, value FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", (chart_id,))
+        return cursor.fetchall()
 
-        df = pd.DataFrame(data_dict)
+    def _build_dataframe_from_results(self, results):
+        """Build DataFrame from database query results."""
+        df = self.db.pivot_data_points(results)
         df['d'] = pd.to_datetime(df['d'])
         return df
 
@@ -1355,19 +1994,11 @@ class ChartRepository:
         if not permissions['can_save']:
             return False
 
-        operations = [
-            {'query': f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", 'params': (chart_id,)},
-            {'query': f"DELETE FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?", 'params': (chart_id,)},
-        ]
-
-        # Add data point operations
-        if not df_data.empty:
-            data_rows = self._prepare_data_points(chart_id, df_data)
-            for row in data_rows:
-                operations.append({
-                    'query': f"INSERT INTO {self.db.TABLE_DATA_POINTS} (chart_id, date, sys_col, value) VALUES (?, ?, ?, ?)",
-                    'params': row
-                })
+        # Data point operations in the configured storage mode
+        operations, _ = self._get_data_point_operations(chart_id, df_data)
+        operations.append(
+            {'query': f"DELETE FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?", 'params': (chart_id,)}
+        )
 
         # Prepare metadata and create renewed hash
         metadata_json = self.db.prepare_metadata(chart_data)
@@ -1379,7 +2010,7 @@ class ChartRepository:
         renewed_hash = hashlib.md5(renewed_hash_input.encode('utf-8')).hexdigest()
         hash_prefix = renewed_hash[:8]
 
-        thumbnail_data = self.data_manager.event_bus.emit('get_thumbnail', {'size': (96, 96)})
+        thumbnail_data = self._get_save_thumbnail(chart_id, original_hash)
         last_modified = int(time.time())
 
         operations.append({
@@ -1441,16 +2072,24 @@ class SyncManager:
     # Manages bidirectional synchronization with remote databases.
     # Handles conflict resolution, chart sharing, and remote database operations.
 
+    MERGE_ATTACH_LIMIT = 10  # Conflict files attached at once, SQLite's default SQLITE_MAX_ATTACHED
+
     def __init__(self, db: 'SQLiteDatabase', chart_repo: 'ChartRepository', tombstone_manager: 'TombstoneManager', data_manager, event_bus):
         self.db = db
         self.chart_repo = chart_repo
         self.tombstone_manager = tombstone_manager
         self.data_manager = data_manager
         self.event_bus = event_bus
+        self.cancel_check = None  # Set by the sync worker, returns True once the running job was cancelled
+        self.pulled_chart_ids = set()  # Charts the last sync_remotes copied into the local database
+
+    def _is_cancelled(self):
+        return self.cancel_check is not None and self.cancel_check()
 
     def sync_remotes(self):
         """Bidirectional sync of charts marked for sharing with remote databases."""
         debug_print('sync remotes ran')
+        self.pulled_chart_ids = set()
         if not self.db._ensure_connection():
             return False
 
@@ -1458,6 +2097,9 @@ class SyncManager:
         remote_locations = {k: v for k, v in db_locations.items() if k != 'local'}
 
         for location_key, location_path in remote_locations.items():
+            if self._is_cancelled():
+                return False
+
             if not location_path or not Path(location_path).exists():
                 continue
 
@@ -1470,6 +2112,7 @@ class SyncManager:
             if db_path.exists():
                 self._sync_with_remote(location_key, db_path)
 
+        debug_print(f"sync_remotes - remote connections {self.db.remote_pool.get_stats()}")
         return True
 
     def share_chart_to_location(self, data):
@@ -1560,6 +2203,17 @@ class SyncManager:
 
         return self._push_accepting_changes_to_remotes(chart_id, new_state)
 
+    def push_thumbnail(self, update_result):
+        """Push a thumbnail that finished encoding after save to remote databases"""
+        if not update_result or not update_result.get('success'):
+            return False
+
+        chart_id = update_result['chart_id']
+        if not self.chart_repo.is_chart_synced(chart_id):
+            return True
+
+        return self._push_thumbnail_to_remotes(chart_id, update_result['thumbnail'])
+
     def push_username_changes(self, update_result):
         """Push username changes to all remote databases"""
         if not update_result or not update_result.get('success'):
@@ -1600,6 +2254,8 @@ class SyncManager:
         rollback_ops = [
             {'query': f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?",
              'params': (new_chart_id,)},
+            {'query': f"DELETE FROM {self.db.TABLE_SERIES_PACKED} WHERE chart_id = ?",
+             'params': (new_chart_id,)},
             {'query': f"DELETE FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
              'params': (new_chart_id,)},
         ]
@@ -1615,7 +2271,7 @@ class SyncManager:
         remote_db_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with sqlite3.connect(str(remote_db_path)) as remote_conn:
+            with self.db.connect_remote(remote_db_path) as remote_conn:
                 remote_cursor = remote_conn.cursor()
                 # Use centralized schema from SQLiteDatabase
                 self.db.create_tables_for_remote(remote_cursor)
@@ -1641,145 +2297,160 @@ class SyncManager:
         if main_db not in db_files:
             return False
 
-        conflict_dbs = [f for f in db_files if f != main_db]
+        # Main first, so it keeps its own version wherever it ties for newest
+        conflict_dbs = sorted(f for f in db_files if f != main_db)
+        merge_dbs = [main_db] + conflict_dbs
 
         try:
-            all_charts = {}  # chart_id -> list of versions with metadata
-
-            # Collect all chart versions from all database files
-            for db_file in db_files:
-                with sqlite3.connect(str(db_file)) as conn:
+            # Collect (file index, timestamp) of every chart version, versions themselves stay on disk
+            all_charts = {}  # chart_id -> list of (file index, timestamp)
+            for file_index, db_file in enumerate(merge_dbs):
+                with self.db.connect_remote(db_file) as conn:
                     cursor = conn.cursor()
                     self.db.ensure_remote_columns(cursor)
+                    conn.commit()
 
-                    cursor.execute(f"""
-                        SELECT chart_id, metadata, thumbnail, metadata_hash, 
-                               COALESCE(last_modified, 0) as last_modified,
-                               COALESCE(owner, ?) as owner,
-                               COALESCE(accepting_changes, 0) as accepting_changes
-                        FROM {self.db.TABLE_CHART_METADATA}
-                    """, (self.db._get_current_user_name(),))
-
-                    for chart_id, metadata, thumbnail, hash_val, timestamp, owner, accepting_changes in cursor.fetchall():
-                        cursor.execute(
-                            f"SELECT date, sys_col, value FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?",
-                            (chart_id,))
-                        data_points = cursor.fetchall()
-
-                        chart_version = {
-                            'metadata': metadata,
-                            'thumbnail': thumbnail,
-                            'hash': hash_val,
-                            'timestamp': timestamp,
-                            'owner': owner,
-                            'accepting_changes': accepting_changes,
-                            'data_points': data_points
-                        }
-
-                        if chart_id not in all_charts:
-                            all_charts[chart_id] = []
-                        all_charts[chart_id].append(chart_version)
-
-            # Process each chart to determine conflict resolution strategy
-            charts_to_save = {}  # final_chart_id -> chart_data
+                    cursor.execute(f"SELECT chart_id, COALESCE(last_modified, 0) FROM {self.db.TABLE_CHART_METADATA}")
+                    for chart_id, timestamp in cursor.fetchall():
+                        all_charts.setdefault(chart_id, []).append((file_index, timestamp))
 
+            # Plan each chart: which file's version keeps the chart_id, and which versions become conflict_ copies
+            winners = {}  # file index -> chart_ids whose main version is replaced by that file's version
+            conflict_copies = []  # (file index, chart_id, conflict chart_id)
             for chart_id, versions in all_charts.items():
-                # Get unique timestamps
-                unique_timestamps = list(set(version['timestamp'] for version in versions))
+                unique_timestamps = {timestamp for _, timestamp in versions}
+                newest_timestamp = max(unique_timestamps)
+                newest_index = next(index for index, timestamp in versions if timestamp == newest_timestamp)
 
-                if len(unique_timestamps) == 1:
-                    # No timestamp conflict - all versions agree, save any one
-                    charts_to_save[chart_id] = versions[0]
-                    debug_print(
-                        f"resolve_db_conflict - chart '{chart_id}': no conflict (timestamp={unique_timestamps[0]})")
-                else:
-                    # Timestamp conflict - preserve all versions
-                    unique_timestamps.sort(reverse=True)  # Newest first
-                    newest_timestamp = unique_timestamps[0]
-
-                    # Save the newest version with original chart_id
-                    newest_version = next(v for v in versions if v['timestamp'] == newest_timestamp)
-                    charts_to_save[chart_id] = newest_version
-
-                    # Save older versions with conflict_ prefix
-                    older_versions = [v for v in versions if v['timestamp'] != newest_timestamp]
-                    for i, older_version in enumerate(older_versions):
-                        # Create conflict chart_id with prefix
-                        if len(older_versions) == 1:
-                            conflict_chart_id = f"conflict_{chart_id}"
-                        else:
-                            conflict_chart_id = f"conflict_{i + 1}_{chart_id}"
-
-                        # Update metadata to reflect new chart_id
-                        try:
-                            metadata_dict = json.loads(older_version['metadata'])
-                            metadata_dict['chart_file_path'] = conflict_chart_id
-                            older_version['metadata'] = json.dumps(metadata_dict)
-
-                            # Recalculate metadata hash for the updated metadata
-                            older_version['hash'] = hashlib.md5(older_version['metadata'].encode('utf-8')).hexdigest()
-                        except (json.JSONDecodeError, KeyError):
-                            # If metadata parsing fails, continue with original metadata
-                            pass
-
-                        charts_to_save[conflict_chart_id] = older_version
-
-                    debug_print(
-                        f"resolve_db_conflict - chart '{chart_id}': conflict resolved, saved {len(older_versions)} older versions with conflict_ prefix")
-
-            # Rebuild main database with all resolved charts
-            with sqlite3.connect(str(main_db)) as main_conn:
-                main_cursor = main_conn.cursor()
-                self.db.ensure_remote_columns(main_cursor)
+                if newest_index != 0:
+                    winners.setdefault(newest_index, []).append(chart_id)
 
-                # Clear existing data
-                main_cursor.execute(f"DELETE FROM {self.db.TABLE_DATA_POINTS}")
-                main_cursor.execute(f"DELETE FROM {self.db.TABLE_CHART_METADATA}")
+                if len(unique_timestamps) == 1:
+                    # No timestamp conflict - all versions agree, main only needs charts it lacks
+                    debug_print(f"resolve_db_conflict - chart '{chart_id}': no conflict (timestamp={newest_timestamp})")
+                    continue
 
-                # Insert all resolved charts
-                for final_chart_id, chart_data in charts_to_save.items():
-                    main_cursor.execute(f"""
-                        INSERT INTO {self.db.TABLE_CHART_METADATA} 
-                        (chart_id, metadata, thumbnail, metadata_hash, last_modified, owner, accepting_changes) 
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (final_chart_id, chart_data['metadata'], chart_data['thumbnail'], chart_data['hash'],
-                          chart_data['timestamp'], chart_data['owner'], chart_data['accepting_changes']))
+                # Timestamp conflict - preserve older versions with conflict_ prefix
+                older_versions = [index for index, timestamp in versions if timestamp != newest_timestamp]
+                for i, file_index in enumerate(older_versions):
+                    if len(older_versions) == 1:
+                        conflict_chart_id = f"conflict_{chart_id}"
+                    else:
+                        conflict_chart_id = f"conflict_{i + 1}_{chart_id}"
+                    conflict_copies.append((file_index, chart_id, conflict_chart_id))
 
-                    if chart_data['data_points']:
-                        # Update data points to use the final_chart_id
-                        main_cursor.executemany(f"""
-                            INSERT INTO {self.db.TABLE_DATA_POINTS} (chart_id, date, sys_col, value) 
-                            VALUES (?, ?, ?, ?)
-                        """, [(final_chart_id, date, sys_col, value) for date, sys_col, value in
-                              chart_data['data_points']])
+                debug_print(
+                    f"resolve_db_conflict - chart '{chart_id}': conflict resolved, saved {len(older_versions)} older versions with conflict_ prefix")
 
-                main_conn.commit()
+            # Merge inside main with conflict files attached, one transaction per MERGE_ATTACH_LIMIT files.
+            # SQLite cannot attach or detach inside a transaction, so more files than that need several.
+            # A batch's files are deleted only after its commit, so a failed batch leaves every file that is
+            # not yet merged in place, and the next resolve merges them into the already merged main.
+            with self.db.connect_remote(main_db) as main_conn:
+                main_cursor = main_conn.cursor()
 
-            # Delete conflict files
-            for conflict_db in conflict_dbs:
-                conflict_db.unlink()
+                for start in range(1, len(merge_dbs), self.MERGE_ATTACH_LIMIT):
+                    batch = range(start, min(start + self.MERGE_ATTACH_LIMIT, len(merge_dbs)))
+                    for file_index in batch:
+                        main_cursor.execute(f"ATTACH DATABASE ? AS merge_{file_index}", (str(merge_dbs[file_index]),))
 
+                    try:
+                        if start == 1:
+                            # Copies of main's own older versions go first, before a newer version replaces them
+                            self._merge_conflict_copies(main_cursor, 'main', [c for c in conflict_copies if c[0] == 0])
+
+                        for file_index in batch:
+                            schema = f"merge_{file_index}"
+                            self._merge_conflict_copies(main_cursor, schema, [c for c in conflict_copies if c[0] == file_index])
+                            self._merge_newest_versions(main_cursor, schema, winners.get(file_index, []))
+                        main_conn.commit()
+                    finally:
+                        main_conn.rollback()
+                        for file_index in batch:
+                            main_cursor.execute(f"DETACH DATABASE merge_{file_index}")
+
+                    # Delete the conflict files merged by this commit
+                    for file_index in batch:
+                        self.db.remote_pool.close_path(merge_dbs[file_index])
+                        merge_dbs[file_index].unlink()
+
+            changed = sum(len(chart_ids) for chart_ids in winners.values()) + len(conflict_copies)
             debug_print(
-                f"resolve_db_conflict - merged {len(db_files)} database files into {len(charts_to_save)} charts")
+                f"resolve_db_conflict - merged {len(db_files)} database files into {len(all_charts) + len(conflict_copies)} charts, {changed} written")
             return True
 
         except Exception as e:
             debug_print(f"Conflict resolution failed: {e}")
             return False
 
+    def _merge_newest_versions(self, main_cursor, schema, chart_ids):
+        """Replace charts in the main database by their versions in an attached database."""
+        columns = "chart_id, metadata, thumbnail, metadata_hash, last_modified, owner, accepting_changes"
+        for start in range(0, len(chart_ids), ChartRepository.QUERY_BATCH_SIZE):
+            batch = chart_ids[start:start + ChartRepository.QUERY_BATCH_SIZE]
+            placeholders = ', '.join('?' * len(batch))
+
+            main_cursor.execute(f"DELETE FROM main.{self.db.TABLE_DATA_POINTS} WHERE chart_id IN ({placeholders})", batch)
+            main_cursor.execute(f"""
+                INSERT OR REPLACE INTO main.{self.db.TABLE_CHART_METADATA} ({columns})
+                SELECT chart_id, metadata, thumbnail, metadata_hash, COALESCE(last_modified, 0),
+                       COALESCE(owner, ?), COALESCE(accepting_changes, 0)
+                FROM {schema}.{self.db.TABLE_CHART_METADATA} WHERE chart_id IN ({placeholders})
+            """, (self.db._get_current_user_name(), *batch))
+            main_cursor.execute(f"""
+                INSERT OR REPLACE INTO main.{self.db.TABLE_DATA_POINTS} (chart_id, date, sys_col, value)
+                SELECT chart_id, date, sys_col, value FROM {schema}.{self.db.TABLE_DATA_POINTS} WHERE chart_id IN ({placeholders})
+            """, batch)
+
+    def _merge_conflict_copies(self, main_cursor, schema, conflict_copies):
+        """Store versions from a database (main or attached) in the main database under their conflict_ chart_id."""
+        for _, chart_id, conflict_chart_id in conflict_copies:
+            main_cursor.execute(f"""
+                SELECT metadata, thumbnail, metadata_hash, COALESCE(last_modified, 0),
+                       COALESCE(owner, ?), COALESCE(accepting_changes, 0)
+                FROM {schema}.{self.db.TABLE_CHART_METADATA} WHERE chart_id = ?
+            """, (self.db._get_current_user_name(), chart_id))
+            metadata, thumbnail, hash_val, timestamp, owner, accepting_changes = main_cursor.fetchone()
+
+            # Update metadata to reflect new chart_id
+            try:
+                metadata_dict = json.loads(metadata)
+                metadata_dict['chart_file_path'] = conflict_chart_id
+                metadata = json.dumps(metadata_dict)
+
+                # Recalculate metadata hash for the updated metadata
+                hash_val = hashlib.md5(metadata.encode('utf-8')).hexdigest()
+            except (json.JSONDecodeError, KeyError, TypeError):
+                # If metadata parsing fails, continue with original metadata
+                pass
+
+            main_cursor.execute(f"DELETE FROM main.{self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", (conflict_chart_id,))
+            main_cursor.execute(f"""
+                INSERT OR REPLACE INTO main.{self.db.TABLE_CHART_METADATA}
+                (chart_id, metadata, thumbnail, metadata_hash, last_modified, owner, accepting_changes)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (conflict_chart_id, metadata, thumbnail, hash_val, timestamp, owner, accepting_changes))
+            main_cursor.execute(f"""
+                INSERT OR REPLACE INTO main.{self.db.TABLE_DATA_POINTS} (chart_id, date, sys_col, value)
+                SELECT ?, date, sys_col, value FROM {schema}.{self.db.TABLE_DATA_POINTS} WHERE chart_id = ?
+            """, (conflict_chart_id, chart_id))
+
     # Private sync implementation methods
     def _sync_with_remote(self, location_key, remote_db_path):
         """Sync charts marked for this location with remote database."""
-        with sqlite3.connect(str(remote_db_path)) as remote_conn:
+        with self.db.connect_remote(remote_db_path) as remote_conn:
             remote_cursor = remote_conn.cursor()
 
             self.db.ensure_remote_columns(remote_cursor)
-            self.tombstone_manager.process_tombstones(remote_cursor)
+            tombstoned_chart_ids = self.tombstone_manager.process_tombstones(remote_cursor)
             self._discover_new_shared_charts(location_key, remote_cursor)
 
-            # Get charts marked for sync
+            # Get charts marked for sync with their local version and the version both sides had at the last sync
             charts_results = self.db.execute_with_retry(
-                f"SELECT chart_id FROM {self.db.TABLE_CHART_SYNC} WHERE sync_location = ?",
+                f"SELECT s.chart_id, c.chart_id IS NOT NULL, COALESCE(c.last_modified, 0), c.metadata_hash, "
+                f"COALESCE(s.last_sync, 0), s.local_hash "
+                f"FROM {self.db.TABLE_CHART_SYNC} s LEFT JOIN {self.db.TABLE_CHART_METADATA} c ON c.chart_id = s.chart_id "
+                f"WHERE s.sync_location = ?",
                 (location_key,),
                 fetch='all'
             )
@@ -1787,41 +2458,85 @@ class SyncManager:
             if not charts_results:
                 return
 
-            chart_ids = [row[0] for row in charts_results]
-
-            if not chart_ids:
-                return
+            remote_versions = self._get_remote_versions(remote_cursor, [row[0] for row in charts_results])
+            sync_records = []
 
             # Sync each marked chart
-            for chart_id in chart_ids:
-                if self.tombstone_manager.is_tombstoned(remote_cursor, chart_id):
+            for chart_id, local_exists, local_timestamp, local_hash, last_sync, synced_hash in charts_results:
+                if self._is_cancelled():
+                    debug_print(f"_sync_with_remote - location=\"{location_key}\" cancelled")
+                    break
+
+                if chart_id in tombstoned_chart_ids:
                     continue
 
-                # Get timestamps directly
-                local_result = self.db.execute_with_retry(
-                    f"SELECT last_modified FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
-                    (chart_id,),
-                    fetch='one'
-                )
-                local_timestamp = local_result[0] if local_result else 0
+                remote_exists = chart_id in remote_versions
+                remote_timestamp, remote_hash = remote_versions.get(chart_id, (0, None))
+
+                # A side changed if it moved away from the version recorded at the last sync,
+                # a chart missing from the remote (reset or restored remote) counts as changed locally
+                local_changed = bool(local_exists) and (
+                        not remote_exists or local_timestamp != last_sync or local_hash != synced_hash)
+                remote_changed = remote_exists and remote_timestamp != last_sync
+                if not local_changed and not remote_changed:
+                    continue
+
+                debug_print(f"[SYNC DEBUG] Chart {chart_id}: local={local_timestamp}, remote={remote_timestamp}, last_sync={last_sync}")
 
-                remote_cursor.execute(f"SELECT last_modified FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
-                                      (chart_id,))
-                remote_row = remote_cursor.fetchone()
-                remote_timestamp = remote_row[0] if remote_row else 0
+                # Only when both sides changed does the newer timestamp win
+                if local_changed and remote_changed:
+                    local_newer = local_timestamp > remote_timestamp
+                    remote_newer = remote_timestamp > local_timestamp
 
-                debug_print(f"[SYNC DEBUG] Chart {chart_id}: local={local_timestamp}, remote={remote_timestamp}")
+                    # Same timestamp but different content, the higher hash wins so every client picks the same side
+                    if not local_newer and not remote_newer and local_hash != remote_hash:
+                        local_newer = (local_hash or '') > (remote_hash or '')
+                        remote_newer = not local_newer
+                else:
+                    local_newer = local_changed
+                    remote_newer = remote_changed
 
-                if local_timestamp == remote_timestamp:
+                if not local_newer and not remote_newer:
                     debug_print(f"[SYNC DEBUG] Timestamps equal, no sync needed")
-                elif local_timestamp > remote_timestamp:
+                    sync_records.append((local_timestamp, local_hash, chart_id, location_key))
+                    continue
+
+                if local_newer:
                     debug_print(f"[SYNC DEBUG] Local newer, copying to remote")
                     debug_print(f"_sync_with_remote - location=\"{location_key}\", chart=\"{chart_id}\", direction=\"local_newer\"")
-                    self._copy_chart(chart_id, self.db.cursor, remote_cursor)
+                    copied = self._copy_chart(chart_id, self.db.cursor, remote_cursor)
                 else:
                     debug_print(f"[SYNC DEBUG] Remote newer, copying to local")
                     debug_print(f"_sync_with_remote - location=\"{location_key}\", chart=\"{chart_id}\", direction=\"remote_newer\"")
-                    self._copy_chart(chart_id, remote_cursor, self.db.cursor)
+                    copied = self._copy_chart(chart_id, remote_cursor, self.db.cursor, expected_timestamp=local_timestamp)
+                    if copied:
+                        self.pulled_chart_ids.add(chart_id)
+
+                if copied:
+                    sync_records.append((*copied, chart_id, location_key))
+
+            # Record the versions both sides now share, charts left untouched stay skipped on the next sync
+            if sync_records:
+                self.db.execute_transaction([{
+                    'query': f"UPDATE {self.db.TABLE_CHART_SYNC} SET last_sync = ?, local_hash = ? WHERE chart_id = ? AND sync_location = ?",
+                    'params': sync_records,
+                    'many': True
+                }])
+            debug_print(f"_sync_with_remote - location=\"{location_key}\", charts={len(charts_results)}, updated={len(sync_records)}")
+
+    def _get_remote_versions(self, remote_cursor, chart_ids):
+        """Get (last_modified, metadata_hash) of the given charts in a remote database, in batches of one query each."""
+        remote_versions = {}
+        for start in range(0, len(chart_ids), ChartRepository.QUERY_BATCH_SIZE):
+            batch = chart_ids[start:start + ChartRepository.QUERY_BATCH_SIZE]
+            remote_cursor.execute(
+                f"SELECT chart_id, COALESCE(last_modified, 0), metadata_hash FROM {self.db.TABLE_CHART_METADATA} "
+                f"WHERE chart_id IN ({', '.join('?' * len(batch))})",
+                batch
+            )
+            remote_versions.update((chart_id, (timestamp, hash_val)) for chart_id, timestamp, hash_val in remote_cursor.fetchall())
+
+        return remote_versions
 
     def _discover_new_shared_charts(self, location_key, remote_cursor):
         """Discover charts in remote that aren't in chart_sync and add them"""
@@ -1846,15 +2561,12 @@ class SyncManager:
                     new_charts.append(chart_id)
 
             # Add new charts to sync (no hash needed)
-            operations = []
-            for chart_id in new_charts:
-                operations.append({
+            if new_charts:
+                self.db.execute_transaction([{
                     'query': f"INSERT INTO {self.db.TABLE_CHART_SYNC} (chart_id, sync_location, last_sync) VALUES (?, ?, ?)",
-                    'params': (chart_id, location_key, 0)
-                })
-
-            if operations:
-                self.db.execute_transaction(operations)
+                    'params': [(chart_id, location_key, 0) for chart_id in new_charts],
+                    'many': True
+                }])
                 debug_print(f"Discovered {len(new_charts)} new shared charts from other owners for {location_key}")
                 debug_print(f"_discover_new_shared_charts - location=\"{location_key}\", remote_count={len(remote_charts)}, new_count={len(new_charts)}")
             else:
@@ -1863,56 +2575,85 @@ class SyncManager:
         except Exception as e:
             debug_print(f"Error discovering new charts: {e}")
 
-    def _copy_chart(self, chart_id, from_cursor, to_cursor):
-        """Copy chart from one database to another."""
+    def _copy_chart(self, chart_id, from_cursor, to_cursor, expected_timestamp=None):
+        """Copy chart from one database to another, returns the copied (last_modified, metadata_hash) or None."""
         from_cursor.execute(f"SELECT * FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?", (chart_id,))
         row = from_cursor.fetchone()
         if not row:
-            return
+            return None
 
         from_cursor.execute(f"PRAGMA table_info({self.db.TABLE_CHART_METADATA})")
         from_columns = [col[1] for col in from_cursor.fetchall()]
         chart_data = dict(zip(from_columns, row))
 
-        from_cursor.execute(f"SELECT date, sys_col, value FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?",
-                            (chart_id,))
-        data_points = from_cursor.fetchall()
-
-        # Delete existing data
-        to_cursor.execute(f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", (chart_id,))
-        to_cursor.execute(f"DELETE FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?", (chart_id,))
-
-        # Ensure target has all columns
-        self.db.ensure_remote_columns(to_cursor)
-
-        # Insert metadata
-        to_cursor.execute(f"""
-            INSERT OR REPLACE INTO {self.db.TABLE_CHART_METADATA} 
-            (chart_id, metadata, thumbnail, metadata_hash, last_modified, owner, accepting_changes) 
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            chart_data['chart_id'],
-            chart_data['metadata'],
-            chart_data['thumbnail'],
-            chart_data['metadata_hash'],
-            chart_data.get('last_modified', int(time.time())),
-            chart_data.get('owner', self.db._get_current_user_name()),
-            chart_data.get('accepting_changes', 0)
-        ))
+        data_points = self.chart_repo._fetch_data_points(chart_id, from_cursor)
 
-        # Insert data points
-        if data_points:
-            to_cursor.executemany(f"INSERT OR REPLACE INTO {self.db.TABLE_DATA_POINTS} VALUES (?, ?, ?, ?)",
-                                  [(chart_id, date, sys_col, value) for date, sys_col, value in data_points])
+        # Writes to the local database wait for saves on the UI thread, remote reads above happen outside the lock
+        local_target = to_cursor.connection is self.db.connection
+        with self.db.local_write_lock if local_target else contextlib.nullcontext():
+            # A local save since the sync read its timestamps wins, the next sync pushes it instead
+            if expected_timestamp is not None:
+                to_cursor.execute(f"SELECT COALESCE(MAX(last_modified), 0) FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
+                                  (chart_id,))
+                if to_cursor.fetchone()[0] != expected_timestamp:
+                    return None
 
-        to_cursor.connection.commit()
-
-    def _update_sync_record(self, chart_id, location_key):
-        """Update chart_sync table with latest sync timestamp."""
-        current_time = int(time.time())
+            # Copies are always written as rows, only changed cells unless the target holds the chart packed
+            try:
+                to_cursor.execute(f"SELECT 1 FROM {self.db.TABLE_SERIES_PACKED} WHERE chart_id = ?", (chart_id,))
+                target_packed = to_cursor.fetchone() is not None
+            except sqlite3.OperationalError:
+                target_packed = False  # Database without packed series table
+
+            cell_changes = None
+            if not target_packed:
+                to_cursor.execute(f"SELECT date, sys_col, value FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", (chart_id,))
+                cell_changes = self.chart_repo._get_cell_changes(chart_id, to_cursor.fetchall(), data_points)
+
+            to_cursor.execute(f"DELETE FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?", (chart_id,))
+            if cell_changes is None:
+                to_cursor.execute(f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ?", (chart_id,))
+                if target_packed:
+                    to_cursor.execute(f"DELETE FROM {self.db.TABLE_SERIES_PACKED} WHERE chart_id = ?", (chart_id,))
+
+            # Ensure target has all columns
+            self.db.ensure_remote_columns(to_cursor)
+
+            # Insert metadata
+            last_modified = chart_data.get('last_modified', int(time.time()))
+            to_cursor.execute(f"""
+                INSERT OR REPLACE INTO {self.db.TABLE_CHART_METADATA} 
+                (chart_id, metadata, thumbnail, metadata_hash, last_modified, owner, accepting_changes) 
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                chart_data['chart_id'],
+                chart_data['metadata'],
+                chart_data['thumbnail'],
+                chart_data['metadata_hash'],
+                last_modified,
+                chart_data.get('owner', self.db._get_current_user_name()),
+                chart_data.get('accepting_changes', 0)
+            ))
+
+            # Insert data points
+            if cell_changes is None:
+                upserts = [(chart_id, date, sys_col, value) for date, sys_col, value in data_points]
+            else:
+                upserts, deletes = cell_changes
+                if deletes:
+                    to_cursor.executemany(f"DELETE FROM {self.db.TABLE_DATA_POINTS} WHERE chart_id = ? AND date = ? AND sys_col = ?",
+                                          deletes)
+            if upserts:
+                to_cursor.executemany(f"INSERT OR REPLACE INTO {self.db.TABLE_DATA_POINTS} VALUES (?, ?, ?, ?)", upserts)
+
+            to_cursor.connection.commit()
+        return last_modified, chart_data['metadata_hash']
+
+    def _update_sync_record(self, chart_id, location_key, last_modified, metadata_hash):
+        """Record the chart version both sides share as the location's high-water mark."""
         self.db.execute_with_retry(
-            f"UPDATE {self.db.TABLE_CHART_SYNC} SET last_sync = ? WHERE chart_id = ? AND sync_location = ?",
-            (current_time, chart_id, location_key)
+            f"UPDATE {self.db.TABLE_CHART_SYNC} SET last_sync = ?, local_hash = ? WHERE chart_id = ? AND sync_location = ?",
+            (last_modified, metadata_hash, chart_id, location_key)
         )
         self.db.connection.commit()
 
@@ -1965,7 +2706,7 @@ class SyncManager:
         try:
             self.event_bus.emit('mark_local_db_change')
 
-            with sqlite3.connect(str(db_path)) as remote_conn:
+            with self.db.connect_remote(db_path) as remote_conn:
                 remote_cursor = remote_conn.cursor()
 
                 # Ensure remote has new columns
@@ -2006,8 +2747,8 @@ class SyncManager:
 
                     remote_conn.commit()
 
-                    # Update local sync record (only timestamp, no hash)
-                    self._update_sync_record(chart_id, location_key)
+                    # Update local sync record
+                    self._update_sync_record(chart_id, location_key, last_modified, metadata_hash)
 
         except Exception as e:
             debug_print(f"Error pushing chart {chart_id} to {location_key}: {e}")
@@ -2045,7 +2786,7 @@ class SyncManager:
                     continue
 
                 try:
-                    with sqlite3.connect(str(db_path)) as remote_conn:
+                    with self.db.connect_remote(db_path) as remote_conn:
                         remote_cursor = remote_conn.cursor()
                         self.db.ensure_remote_columns(remote_cursor)
 
@@ -2067,6 +2808,47 @@ class SyncManager:
             debug_print(f"Error in _push_accepting_changes_to_remotes: {e}")
             return False
 
+    def _push_thumbnail_to_remotes(self, chart_id, thumbnail_data):
+        """Update the thumbnail of remote copies that still hold the locally saved chart version"""
+        self.event_bus.emit('mark_local_db_change')
+
+        local_result = self.db.execute_with_retry(
+            f"SELECT metadata_hash FROM {self.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
+            (chart_id,),
+            fetch='one'
+        )
+        if not local_result:
+            return False
+
+        sync_results = self.db.execute_with_retry(
+            f"SELECT sync_location FROM {self.db.TABLE_CHART_SYNC} WHERE chart_id = ?",
+            (chart_id,),
+            fetch='all'
+        )
+        db_locations = self.data_manager.user_preferences.get('db_location', {})
+
+        for (location_key,) in sync_results or []:
+            location_path = db_locations.get(location_key)
+            if not location_path:
+                continue
+
+            db_path = Path(location_path) / f'{self.db.DB_NAME}-{location_key}.db'
+            if not db_path.exists():
+                continue
+
+            try:
+                with self.db.connect_remote(db_path) as remote_conn:
+                    # Matching the hash keeps a newer version saved by someone else untouched
+                    remote_conn.execute(
+                        f"UPDATE {self.db.TABLE_CHART_METADATA} SET thumbnail = ? WHERE chart_id = ? AND metadata_hash = ?",
+                        (thumbnail_data, chart_id, local_result[0])
+                    )
+                    remote_conn.commit()
+            except Exception as e:
+                debug_print(f"Error pushing thumbnail for chart {chart_id} to {location_key}: {e}")
+
+        return True
+
     def _push_username_to_remotes(self, old_username, new_username):
         """Push username changes to all remote databases"""
         self.event_bus.emit('mark_local_db_change')
@@ -2090,7 +2872,7 @@ class SyncManager:
                     continue
 
                 try:
-                    with sqlite3.connect(str(db_path)) as remote_conn:
+                    with self.db.connect_remote(db_path) as remote_conn:
                         remote_cursor = remote_conn.cursor()
                         self.db.ensure_remote_columns(remote_cursor)
 
@@ -2113,6 +2895,95 @@ class SyncManager:
             return False
 
 
+class SyncSignals(QObject):
+    # Delivers finished sync jobs from the worker thread back to the UI thread
+    job_finished = Signal(str, object)
+
+
+class SyncTask(QRunnable):
+    # Runs one queued job on the sync worker's thread
+    def __init__(self, worker, job, function, generation):
+        super().__init__()
+        self.worker = worker
+        self.job = job
+        self.function = function
+        self.generation = generation
+
+    def run(self):
+        self.worker.run_job(self.job, self.function, self.generation)
+
+
+class SyncWorker:
+    # Runs remote sync jobs one at a time off the UI thread, remote folders can be slow network or cloud drives.
+    # Each job opens its own local and remote connections, results are announced as 'sync_job_finished'.
+
+    def __init__(self, db: 'SQLiteDatabase', data_manager, event_bus):
+        self.db = db  # UI thread database, only its file path is shared with jobs
+        self.data_manager = data_manager
+        self.event_bus = event_bus
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(1)  # Jobs run in submission order
+        self.pool.setExpiryTimeout(-1)  # Keep the thread, and with it its pooled remote connections
+        self.signals = SyncSignals()
+        self.signals.job_finished.connect(self._on_job_finished)
+        self.lock = threading.Lock()
+        self.queued_jobs = set()  # Names of jobs waiting to start
+        self.generation = 0  # Bumped by cancel, jobs from an older generation stop at the next chart
+
+    def submit(self, job, function):
+        """Queue function(sync_manager) on the worker, unless the same job is already waiting to start."""
+        with self.lock:
+            if job in self.queued_jobs:
+                return False
+            self.queued_jobs.add(job)
+            generation = self.generation
+
+        self.pool.start(SyncTask(self, job, function, generation))
+        return True
+
+    def cancel(self):
+        """Drop queued jobs and stop the running one at the next chart."""
+        with self.lock:
+            self.generation += 1
+            self.queued_jobs.clear()
+        self.pool.clear()
+
+    def wait_for_done(self):
+        """Block until all jobs finished and deliver their results, used before closing."""
+        self.pool.waitForDone()
+        QApplication.sendPostedEvents()
+
+    def run_job(self, job, function, generation):
+        """Run a job with worker owned connections, called on the worker thread."""
+        with self.lock:
+            self.queued_jobs.discard(job)
+
+        db = SQLiteDatabase(self.data_manager)
+        db.remote_pool = self.db.remote_pool
+        db.local_write_lock = self.db.local_write_lock
+        result = None
+        try:
+            if db.connect_worker(self.db.db_file):
+                tombstone_manager = TombstoneManager(db, self.data_manager)
+                chart_repo = ChartRepository(db, self.data_manager, self.event_bus)
+                sync_manager = SyncManager(db, chart_repo, tombstone_manager, self.data_manager, self.event_bus)
+                sync_manager.cancel_check = lambda: generation != self.generation
+                result = function(sync_manager)
+        except Exception as e:
+            debug_print(f"Sync job '{job}' failed: {e}")
+        finally:
+            db.close()
+
+        try:
+            self.signals.job_finished.emit(job, result)
+        except RuntimeError:
+            pass  # Application closed before the job finished
+
+    def _on_job_finished(self, job, result):
+        debug_print(f"Sync job '{job}' finished: {result}")
+        self.event_bus.emit('sync_job_finished', {'job': job, 'result': result})
+
+
 class DatabaseMonitor:
     def __init__(self, data_manager):
         self.data_manager = data_manager
@@ -2122,9 +2993,13 @@ class DatabaseMonitor:
         self.timer.timeout.connect(self.check_databases)
         self.monitoring_active = False
         self.ignore_next_change = False  # Ignore next change cycle
+        self.awaiting_sync = False  # A sync was triggered by detected changes and has not finished yet
+        self.monitoring_stopped = False  # Set once stopped, e.g. when closing, results then no longer reload charts
+        self.clean_check_states = {}  # location_key -> (remote mtime_ns, size, local timestamps) of last clean check
 
         # Event bus subscriptions
         self.event_bus.subscribe('mark_local_db_change', self.mark_local_db_change)
+        self.event_bus.subscribe('sync_job_finished', self.on_sync_job_finished, has_data=True)
         debug_print(f"[DB Monitor] Initialized with 5s interval")
 
     def start_monitoring(self):
@@ -2136,6 +3011,7 @@ class DatabaseMonitor:
             f"[DB Monitor] Starting monitoring. Found {len(remote_locations)} remote locations: {list(remote_locations.keys())}")
 
         self.ignore_next_change = False
+        self.monitoring_stopped = False
         found_dbs = 0
 
         for location_key, location_path in remote_locations.items():
@@ -2164,7 +3040,9 @@ class DatabaseMonitor:
         debug_print(f"[DB Monitor] Stopping monitoring")
         self.timer.stop()
         self.monitoring_active = False
+        self.monitoring_stopped = True
         self.ignore_next_change = False
+        self.awaiting_sync = False
 
     def mark_local_db_change(self):
         """Mark to ignore next change cycle"""
@@ -2172,26 +3050,43 @@ class DatabaseMonitor:
         self.ignore_next_change = True
 
     def check_databases(self):
-        """Check if any monitored databases have changes in synced charts"""
+        """Queue a check of monitored databases for changes in synced charts on the sync worker"""
         if not self.monitoring_active:
             return
 
+        self.data_manager.sqlite_manager.sync_worker.submit('check_databases', self._find_changed_locations)
+
+    def _find_changed_locations(self, sync_manager):
+        """Return the remote locations whose synced charts differ from local, runs on the sync worker"""
         db_locations = self.data_manager.user_preferences.get('db_location', {})
         remote_locations = {k: v for k, v in db_locations.items() if k != 'local'}
 
-        changes_detected = False
+        changed_locations = []
 
         for location_key, location_path in remote_locations.items():
             if not location_path or not Path(location_path).exists():
                 continue
 
-            db_path = Path(location_path) / f'{self.data_manager.sqlite_manager.db.DB_NAME}-{location_key}.db'
+            db_path = Path(location_path) / f'{sync_manager.db.DB_NAME}-{location_key}.db'
             if not db_path.exists():
                 continue
 
             # Check for timestamp differences
-            if self._has_timestamp_differences(location_key, db_path):
-                changes_detected = True
+            if self._has_timestamp_differences(sync_manager.db, location_key, db_path):
+                changed_locations.append(location_key)
+
+        if not changed_locations:
+            debug_print(f"[DB Monitor] Checked {len(remote_locations)} databases - no chart changes")
+
+        return changed_locations
+
+    def on_sync_job_finished(self, data):
+        """Act on finished checks and syncs, runs on the UI thread"""
+        if self.monitoring_stopped:
+            return
+
+        if data['job'] == 'check_databases' and self.monitoring_active:
+            for location_key in data['result'] or []:
                 debug_print(f"[DB Monitor] Chart changes detected in {location_key}")
 
                 if self.ignore_next_change:
@@ -2199,24 +3094,29 @@ class DatabaseMonitor:
                     self.ignore_next_change = False
                 else:
                     debug_print(f"[DB Monitor] External chart changes detected - triggering sync")
+                    self.awaiting_sync = True
                     self.event_bus.emit('sync_remotes')
-
-                    # After sync, check if current chart metadata has changed
-                    self._check_current_chart_metadata_change()
                     return
 
-        if not changes_detected:
-            debug_print(f"[DB Monitor] Checked {len(remote_locations)} databases - no chart changes")
+        elif data['job'] == 'sync_remotes':
+            # After any sync that pulled the current chart, including the one on boot, check if it changed
+            pulled_chart_ids = (data['result'] or {}).get('pulled_chart_ids', [])
+            current_chart_id = self.data_manager.chart_data.get('chart_file_path')
+            if self.awaiting_sync or current_chart_id in pulled_chart_ids:
+                self.awaiting_sync = False
+                self._check_current_chart_metadata_change()
 
-    def _has_timestamp_differences(self, location_key, db_path):
+    def _has_timestamp_differences(self, db, location_key, db_path):
         """Check if any synced chart has different timestamps between local and remote"""
-        if not self.data_manager.sqlite_manager.db._ensure_connection():
+        if not db._ensure_connection():
             return False
 
         try:
-            # Get charts that are synced to this location
-            synced_results = self.data_manager.sqlite_manager.db.execute_with_retry(
-                f"SELECT chart_id FROM {self.data_manager.sqlite_manager.db.TABLE_CHART_SYNC} WHERE sync_location = ?",
+            # Get (chart_id, last_modified) of charts synced to this location in one query, 0 if not stored locally
+            synced_results = db.execute_with_retry(
+                f"SELECT s.chart_id, CASE WHEN c.chart_id IS NULL THEN 0 ELSE c.last_modified END "
+                f"FROM {db.TABLE_CHART_SYNC} s LEFT JOIN {db.TABLE_CHART_METADATA} c ON c.chart_id = s.chart_id "
+                f"WHERE s.sync_location = ?",
                 (location_key,),
                 fetch='all'
             )
@@ -2224,35 +3124,39 @@ class DatabaseMonitor:
             if not synced_results:
                 return False
 
-            synced_chart_ids = [row[0] for row in synced_results]
+            local_timestamps = dict(synced_results)
 
-            # Connect to remote database
-            with sqlite3.connect(str(db_path)) as remote_conn:
-                remote_cursor = remote_conn.cursor()
-
-                # Check each synced chart for timestamp differences
-                for chart_id in synced_chart_ids:
-                    # Get local timestamp
-                    local_result = self.data_manager.sqlite_manager.db.execute_with_retry(
-                        f"SELECT last_modified FROM {self.data_manager.sqlite_manager.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
-                        (chart_id,),
-                        fetch='one'
-                    )
-                    local_timestamp = local_result[0] if local_result else 0
+            # Nothing to compare if neither the remote file nor the local timestamps changed since the last clean check
+            remote_stat = db_path.stat()
+            check_state = (remote_stat.st_mtime_ns, remote_stat.st_size, local_timestamps)
+            if self.clean_check_states.get(location_key) == check_state:
+                return False
 
-                    # Get remote timestamp
+            # Get remote timestamps in batches of one query each
+            remote_timestamps = {}
+            chart_ids = list(local_timestamps)
+            with db.connect_remote(db_path) as remote_conn:
+                remote_cursor = remote_conn.cursor()
+                for start in range(0, len(chart_ids), ChartRepository.QUERY_BATCH_SIZE):
+                    batch = chart_ids[start:start + ChartRepository.QUERY_BATCH_SIZE]
                     remote_cursor.execute(
-                        f"SELECT last_modified FROM {self.data_manager.sqlite_manager.db.TABLE_CHART_METADATA} WHERE chart_id = ?",
-                        (chart_id,)
+                        f"SELECT chart_id, last_modified FROM {db.TABLE_CHART_METADATA} "
+                        f"WHERE chart_id IN ({', '.join('?' * len(batch))})",
+                        batch
                     )
-                    remote_result = remote_cursor.fetchone()
-                    remote_timestamp = remote_result[0] if remote_result else 0
-
-                    # If timestamps differ, we have changes
-                    if local_timestamp != remote_timestamp:
-                        debug_print(f"[DB Monitor] Timestamp difference for chart {chart_id}: local={local_timestamp}, remote={remote_timestamp}")
-                        return True
-
+                    remote_timestamps.update(remote_cursor.fetchall())
+
+            # If timestamps differ, we have changes
+            for chart_id, local_timestamp in local_timestamps.items():
+                remote_timestamp = remote_timestamps.get(chart_id, 0)
+                if local_timestamp != remote_timestamp:
+                    debug_print(f"[DB Monitor] Timestamp difference for chart {chart_id}: local={local_timestamp}, remote={remote_timestamp}")
+                    self.clean_check_states.pop(location_key, None)
+                    return True
+
+            # Coarse mtimes (network shares, FAT) can hide a write made in the same tick, so only trust settled files
+            if time.time() - remote_stat.st_mtime > 2:
+                self.clean_check_states[location_key] = check_state
             return False
 
         except Exception as e:
@@ -2312,6 +3216,13 @@ class SQLiteManager:
         self.tombstone_manager = TombstoneManager(self.db, data_manager)
         self.chart_repo = ChartRepository(self.db, data_manager, self.event_bus)
         self.sync_manager = SyncManager(self.db, self.chart_repo, self.tombstone_manager, data_manager, self.event_bus)
+        self.sync_worker = SyncWorker(self.db, data_manager, self.event_bus)
+
+        # Idle remote connections of every thread are closed on a timer, not only when a thread connects again
+        self.remote_sweep_timer = QTimer()
+        self.remote_sweep_timer.setInterval(RemoteConnectionPool.IDLE_TIMEOUT * 1000)
+        self.remote_sweep_timer.timeout.connect(self.db.remote_pool.close_idle)
+        self.remote_sweep_timer.start()
 
         # Maintain original properties for compatibility
         self.connection = None
@@ -2327,6 +3238,8 @@ class SQLiteManager:
         self.event_bus.subscribe('delete_chart', self._handle_delete_chart, has_data=True)
         self.event_bus.subscribe('vacuum_database', self.vacuum_database)
         self.event_bus.subscribe('sync_remotes', self.sync_remotes)
+        self.event_bus.subscribe('cancel_sync_jobs', self.cancel_sync_jobs)
+        self.event_bus.subscribe('wait_for_sync', self.wait_for_sync)
         self.event_bus.subscribe('json_import_to_database', self.json_import, has_data=True)
         self.event_bus.subscribe('json_export_from_database', self.json_export, has_data=True)
         self.event_bus.subscribe('get_chart_ids_for_location', self.get_chart_ids_for_location, has_data=True)
@@ -2338,7 +3251,10 @@ class SQLiteManager:
         self.event_bus.subscribe('is_chart_synced', self.is_chart_synced, has_data=True)
         self.event_bus.subscribe('update_username_ownership', self._handle_update_username_ownership, has_data=True)
         self.event_bus.subscribe('get_chart_display_info', self.get_chart_display_info, has_data=True)
+        self.event_bus.subscribe('get_chart_browser_items', self.get_chart_browser_items, has_data=True)
+        self.event_bus.subscribe('get_chart_thumbnails', self.get_chart_thumbnails, has_data=True)
         self.event_bus.subscribe('save_complete_chart', self._handle_save_complete_chart)
+        self.event_bus.subscribe('update_chart_thumbnail', self._handle_update_chart_thumbnail, has_data=True)
 
     # Event handler methods that coordinate between components
     def _handle_save_complete_chart(self):
@@ -2369,6 +3285,15 @@ class SQLiteManager:
             self.sync_manager.push_accepting_changes(toggle_result)
         return toggle_result
 
+    def _handle_update_chart_thumbnail(self, data):
+        """Handle late thumbnail and sync coordination"""
+        update_result = self.chart_repo.update_chart_thumbnail(data)
+        if update_result:
+            if update_result.get('success'):
+                self.event_bus.emit('chart_thumbnail_updated', data['chart_id'])
+            self.sync_manager.push_thumbnail(update_result)
+        return update_result
+
     def _handle_update_username_ownership(self, data):
         """Handle username update and sync coordination"""
         update_result = self.chart_repo.update_username_ownership(data)
@@ -2386,6 +3311,8 @@ class SQLiteManager:
         return result
 
     def close(self):
+        self.remote_sweep_timer.stop()
+        self.db.remote_pool.close_all()
         self.db.close()
         self.connection = None
         self.cursor = None
@@ -2395,7 +3322,21 @@ class SQLiteManager:
         return self.db.vacuum_database(respect_time_limit)
 
     def sync_remotes(self):
-        return self.sync_manager.sync_remotes()
+        # Remote folders can be slow, so the sync runs on the sync worker and reports back as 'sync_job_finished'
+        if not self.db._ensure_connection():
+            return False
+        return self.sync_worker.submit('sync_remotes', self._run_sync_remotes)
+
+    def _run_sync_remotes(self, sync_manager):
+        # Runs on the sync worker, pulled charts let the UI reload the current chart if it changed underneath
+        synced = sync_manager.sync_remotes()
+        return {'synced': synced, 'pulled_chart_ids': sorted(sync_manager.pulled_chart_ids)}
+
+    def cancel_sync_jobs(self):
+        self.sync_worker.cancel()
+
+    def wait_for_sync(self):
+        self.sync_worker.wait_for_done()
 
     def has_chart_changed(self, chart_id):
         return self.chart_repo.has_chart_changed(chart_id)
@@ -2412,6 +3353,12 @@ class SQLiteManager:
     def get_chart_display_info(self, chart_ids):
         return self.chart_repo.get_chart_display_info(chart_ids)
 
+    def get_chart_browser_items(self, location):
+        return self.chart_repo.get_chart_browser_items(location)
+
+    def get_chart_thumbnails(self, chart_ids):
+        return self.chart_repo.get_chart_thumbnails(chart_ids)
+
     def is_chart_synced(self, chart_id):
         return self.chart_repo.is_chart_synced(chart_id)
 
@@ -0,0 +1,40 @@
+# Tests import the application modules from the repository root, without a display
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+class FakeDataManager:
+    # The parts of DataManager the database classes use
+    def __init__(self, config_dir, event_bus):
+        self.config_dir = str(config_dir)
+        self.event_bus = event_bus
+        self.user_preferences = {'user_name': 'tester', 'db_location': {'local': self.config_dir}}
+        self.chart_data = {'chart_file_path': None, 'type': 'Daily'}
+        self.df_raw = None
+        self.sqlite_manager = None
+
+    def get_config_directory(self, as_str=False):
+        return self.config_dir
+
+    def get_default_user_name(self):
+        return 'tester'
+
+
+@pytest.fixture(scope='session')
+def qt_app():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def event_bus():
+    # EventBus is a singleton, every test starts with no subscribers
+    from EventStateManager import EventBus
+    EventBus._instance = None
+    yield EventBus()
+    EventBus._instance = None
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from database import ChartRepository
+
+
+def prepare_data_points_by_row(chart_id, df_data):
+    # The row by row builder _prepare_data_points replaced, kept as the reference
+    rows = []
+    for _, row in df_data.iterrows():
+        date = row['d'].strftime('%Y-%m-%d') if hasattr(row['d'], 'strftime') else str(row['d'])
+
+        for col in row.index:
+            if col != 'd' and not pd.isna(row[col]):
+                rows.append((chart_id, date, col, float(row[col])))
+
+    return rows
+
+
+@pytest.fixture
+def repo():
+    return ChartRepository(None, None, None)
+
+
+FRAMES = {
+    'nan cells': pd.DataFrame({
+        'd': pd.date_range('2024-01-30', periods=5),
+        'm': [1.0, 1.0, np.nan, 2.0, 1.0],
+        'c': [3.0, np.nan, 5.0, np.nan, 0.0],
+        'i': [1, 2, 3, 4, 5],
+    }),
+    'all nan column': pd.DataFrame({
+        'd': pd.date_range('2024-02-27', periods=4),
+        'c': [1.5, 2.5, 3.5, 4.5],
+        'o1': np.nan,
+    }),
+    'times and duplicate dates': pd.DataFrame({
+        'd': pd.to_datetime(['2024-03-01 08:30', '2024-03-01 17:45', '1999-12-31 23:59']),
+        'c': [1.0, 2.0, 3.0],
+    }),
+    'string dates': pd.DataFrame({
+        'd': ['2024-01-01', '2024-01-02'],
+        'c': [1.0, np.nan],
+    }),
+    'empty': pd.DataFrame({'d': pd.to_datetime([]), 'c': pd.Series([], dtype=float)}),
+}
+
+
+@pytest.mark.parametrize('name', FRAMES)
+def test_matches_row_by_row_builder(repo, name):
+    df = FRAMES[name]
+    assert repo._prepare_data_points('chart', df) == prepare_data_points_by_row('chart', df)
+
+
+def test_rows_are_stored_types(repo):
+    rows = repo._prepare_data_points('chart', FRAMES['nan cells'])
+    assert rows[0] == ('chart', '2024-01-30', 'm', 1.0)
+    assert all(type(date) is str and type(sys_col) is str and type(value) is float for _, date, sys_col, value in rows)
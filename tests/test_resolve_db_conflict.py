@@ -0,0 +1,134 @@
+import datetime
+import hashlib
+import json
+import sqlite3
+import time
+import tracemalloc
+
+import pytest
+
+from conftest import FakeDataManager
+from database import SQLiteDatabase, ChartRepository, TombstoneManager, SyncManager
+
+MAIN_DB = 'opencelerator-loc.db'
+CONFLICT_DBS = [f'opencelerator-loc (conflicted copy {n}).db' for n in (1, 2, 3)]
+FILLER_CHARTS = 200  # Identical in every file
+CELLS = 100
+
+# chart_id -> last_modified in main, conflicted copy 1, 2 and 3, None where the file lacks the chart
+VERSIONS = {
+    'main_only': (100, None, None, None),
+    'newer_in_copy': (100, 300, 200, None),
+    'older_in_copy': (300, 100, None, None),
+    'tie': (200, 100, 200, None),
+    'tie_in_copies': (None, 400, 400, 100),
+    'only_in_copy': (None, None, 50, None),
+}
+
+
+def version_rows(chart_id, timestamp, file_index):
+    """Chart and series rows of one version, the values tell which file it came from."""
+    metadata = json.dumps({'chart_file_path': chart_id, 'file': file_index})
+    chart = (chart_id, metadata, b'png', hashlib.md5(metadata.encode()).hexdigest(), timestamp, 'tester', 0)
+    first_date = datetime.date(2000, 1, 1)
+    series = [(chart_id, (first_date + datetime.timedelta(days=day)).isoformat(), 'c', float(file_index * 1000 + day))
+              for day in range(CELLS)]
+    return chart, series
+
+
+def write_database(db, path, charts):
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    db.create_tables_for_remote(cursor)
+    for chart_id, timestamp, file_index in charts:
+        chart, series = version_rows(chart_id, timestamp, file_index)
+        cursor.execute("INSERT INTO chart (chart_id, metadata, thumbnail, metadata_hash, last_modified, owner, "
+                       "accepting_changes) VALUES (?, ?, ?, ?, ?, ?, ?)", chart)
+        cursor.executemany("INSERT INTO series (chart_id, date, sys_col, value) VALUES (?, ?, ?, ?)", series)
+    conn.commit()
+    conn.close()
+
+
+def read_chart(conn, chart_id):
+    chart = conn.execute("SELECT chart_id, metadata, thumbnail, metadata_hash, last_modified, owner, accepting_changes "
+                         "FROM chart WHERE chart_id = ?", (chart_id,)).fetchone()
+    series = conn.execute("SELECT chart_id, date, sys_col, value FROM series WHERE chart_id = ? ORDER BY date",
+                          (chart_id,)).fetchall()
+    return chart, series
+
+
+@pytest.fixture
+def sync_manager(event_bus, tmp_path):
+    local_dir = tmp_path / 'local'
+    local_dir.mkdir()
+    data_manager = FakeDataManager(local_dir, event_bus)
+    db = SQLiteDatabase(data_manager)
+    db.connect(str(local_dir))
+    yield SyncManager(db, ChartRepository(db, data_manager, event_bus), TombstoneManager(db, data_manager),
+                      data_manager, event_bus)
+    db.remote_pool.close_all()
+    db.close()
+
+
+@pytest.fixture
+def remote_dir(sync_manager, tmp_path):
+    """A remote folder with the main database and three conflicted copies of it."""
+    remote_dir = tmp_path / 'remote'
+    remote_dir.mkdir()
+    for file_index, name in enumerate([MAIN_DB] + CONFLICT_DBS):
+        charts = [(chart_id, timestamps[file_index], file_index)
+                  for chart_id, timestamps in VERSIONS.items() if timestamps[file_index] is not None]
+        charts += [(f'filler_{n:03d}', 100, 0) for n in range(FILLER_CHARTS)]
+        write_database(sync_manager.db, remote_dir / name, charts)
+    return remote_dir
+
+
+def test_resolve_db_conflict(sync_manager, remote_dir):
+    tracemalloc.start()
+    start = time.perf_counter()
+    assert sync_manager.resolve_db_conflict(str(remote_dir), 'loc')
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"resolve_db_conflict: {len(CONFLICT_DBS)} conflicted copies of {len(VERSIONS) + FILLER_CHARTS} charts "
+          f"with {CELLS} cells, {elapsed * 1e3:.0f} ms, tracemalloc peak {peak / 2 ** 20:.2f} MB")
+
+    # The conflicted copies are merged and deleted
+    assert sorted(path.name for path in remote_dir.glob('*.db')) == [MAIN_DB]
+
+    conn = sqlite3.connect(remote_dir / MAIN_DB)
+    chart_ids = {row[0] for row in conn.execute("SELECT chart_id FROM chart")}
+    fillers = {f'filler_{n:03d}' for n in range(FILLER_CHARTS)}
+    conflicts = {'conflict_1_newer_in_copy', 'conflict_2_newer_in_copy', 'conflict_older_in_copy', 'conflict_tie',
+                 'conflict_tie_in_copies'}
+    assert chart_ids == set(VERSIONS) | fillers | conflicts
+
+    # The newest version keeps the chart_id, main wins a tie it takes part in, otherwise the first copy does
+    winners = {'main_only': (100, 0), 'newer_in_copy': (300, 1), 'older_in_copy': (300, 0),
+               'tie': (200, 0), 'tie_in_copies': (400, 1), 'only_in_copy': (50, 2)}
+    for chart_id, (timestamp, file_index) in winners.items():
+        assert read_chart(conn, chart_id) == tuple(version_rows(chart_id, timestamp, file_index)), chart_id
+
+    # Older versions are kept under conflict_ ids, numbered when a chart has several
+    older = {'conflict_1_newer_in_copy': ('newer_in_copy', 100, 0), 'conflict_2_newer_in_copy': ('newer_in_copy', 200, 2),
+             'conflict_older_in_copy': ('older_in_copy', 100, 1), 'conflict_tie': ('tie', 100, 1),
+             'conflict_tie_in_copies': ('tie_in_copies', 100, 3)}
+    for conflict_chart_id, (chart_id, timestamp, file_index) in older.items():
+        chart, series = version_rows(chart_id, timestamp, file_index)
+        metadata = json.dumps({'chart_file_path': conflict_chart_id, 'file': file_index})
+        expected_chart = (conflict_chart_id, metadata, b'png', hashlib.md5(metadata.encode()).hexdigest(), timestamp,
+                          'tester', 0)
+        expected_series = [(conflict_chart_id, *row[1:]) for row in series]
+        assert read_chart(conn, conflict_chart_id) == (expected_chart, expected_series), conflict_chart_id
+
+    # Charts that did not differ are untouched
+    for chart_id in sorted(fillers)[::50]:
+        assert read_chart(conn, chart_id) == tuple(version_rows(chart_id, 100, 0)), chart_id
+    assert conn.execute("SELECT count(*) FROM series").fetchone()[0] == len(chart_ids) * CELLS
+    conn.close()
+
+
+def test_resolve_db_conflict_without_main_leaves_files(sync_manager, remote_dir):
+    (remote_dir / MAIN_DB).unlink()
+    assert not sync_manager.resolve_db_conflict(str(remote_dir), 'loc')
+    assert sorted(path.name for path in remote_dir.glob('*.db')) == sorted(CONFLICT_DBS)
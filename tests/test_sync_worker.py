@@ -0,0 +1,145 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from conftest import FakeDataManager
+from database import SQLiteDatabase, SQLiteManager, SyncManager, DatabaseMonitor
+
+REMOTE_LATENCY = 0.3  # Seconds to open a remote connection, like a slow network or cloud drive
+CHART_IDS = ['c0', 'c1', 'c2']
+
+
+@pytest.fixture
+def slow_remotes(monkeypatch):
+    # Every new remote connection waits before sqlite3.connect, as it would on a slow share
+    open_remote = SQLiteDatabase._open_remote
+
+    def open_remote_slowly(self, db_file):
+        time.sleep(REMOTE_LATENCY)
+        return open_remote(self, db_file)
+
+    monkeypatch.setattr(SQLiteDatabase, '_open_remote', open_remote_slowly)
+
+
+@pytest.fixture
+def manager(qt_app, event_bus, slow_remotes, tmp_path):
+    """SQLiteManager whose charts c0 and c1 were changed on the remote 'loc' since the last sync."""
+    local_dir, remote_dir = tmp_path / 'local', tmp_path / 'remote'
+    local_dir.mkdir()
+    remote_dir.mkdir()
+    data_manager = FakeDataManager(local_dir, event_bus)
+    data_manager.user_preferences['db_location']['loc'] = str(remote_dir)
+    manager = SQLiteManager(data_manager)
+    manager.connect(str(local_dir))
+    data_manager.sqlite_manager = manager
+
+    db = manager.db
+    for chart_id in CHART_IDS:
+        db.cursor.execute(f"INSERT INTO {db.TABLE_CHART_METADATA} (chart_id, metadata, metadata_hash, last_modified, owner) "
+                          f"VALUES (?, '{{}}', 'local', 1000, 'tester')", (chart_id,))
+        db.cursor.execute(f"INSERT INTO {db.TABLE_CHART_SYNC} (chart_id, sync_location, last_sync) VALUES (?, 'loc', 0)",
+                          (chart_id,))
+    db.connection.commit()
+    manager.sync_manager.sync_remotes()  # First push, on this thread
+    db.remote_pool.close_all()
+
+    remote = sqlite3.connect(remote_dir / f'{db.DB_NAME}-loc.db')
+    remote.execute(f"UPDATE {db.TABLE_CHART_METADATA} SET last_modified = 2000, metadata_hash = 'remote' "
+                   f"WHERE chart_id IN ('c0', 'c1')")
+    remote.commit()
+    remote.close()
+
+    yield manager
+
+    manager.cancel_sync_jobs()
+    manager.wait_for_sync()
+    manager.close()
+
+
+@pytest.fixture
+def finished_jobs(event_bus):
+    jobs = []
+    event_bus.subscribe('sync_job_finished', jobs.append, has_data=True)
+    return jobs
+
+
+def local_timestamps(manager):
+    db = manager.db
+    return dict(db.cursor.execute(f"SELECT chart_id, last_modified FROM {db.TABLE_CHART_METADATA}").fetchall())
+
+
+def test_sync_remotes_returns_before_the_remote_is_opened(manager, finished_jobs):
+    start = time.perf_counter()
+    assert manager.sync_remotes()
+    elapsed = time.perf_counter() - start
+    assert elapsed < REMOTE_LATENCY / 3
+    assert finished_jobs == []
+
+    manager.wait_for_sync()
+    assert finished_jobs == [{'job': 'sync_remotes', 'result': {'synced': True, 'pulled_chart_ids': ['c0', 'c1']}}]
+    assert local_timestamps(manager) == {'c0': 2000, 'c1': 2000, 'c2': 1000}
+    print(f"sync_remotes returned after {elapsed * 1e3:.1f} ms, the sync took {REMOTE_LATENCY * 1e3:.0f} ms or more")
+
+
+def test_sync_remotes_while_one_is_queued_is_dropped(manager, finished_jobs):
+    release = threading.Event()
+    manager.sync_worker.submit('block', lambda sync_manager: release.wait(5))
+
+    assert manager.sync_remotes()
+    assert not manager.sync_remotes()
+    release.set()
+    manager.wait_for_sync()
+
+    assert [data['job'] for data in finished_jobs] == ['block', 'sync_remotes']
+
+
+def test_cancel_drops_queued_job(manager, finished_jobs):
+    started, release = threading.Event(), threading.Event()
+    manager.sync_worker.submit('block', lambda sync_manager: started.set() or release.wait(5))
+    assert started.wait(5)
+
+    manager.sync_remotes()
+    manager.cancel_sync_jobs()
+    release.set()
+    manager.wait_for_sync()
+
+    assert [data['job'] for data in finished_jobs] == ['block']
+    assert local_timestamps(manager) == {'c0': 1000, 'c1': 1000, 'c2': 1000}
+
+    # Jobs submitted after the cancel belong to the new generation and run
+    manager.sync_remotes()
+    manager.wait_for_sync()
+    assert finished_jobs[-1]['result']['pulled_chart_ids'] == ['c0', 'c1']
+
+
+def test_cancel_stops_running_job_at_next_chart(manager, finished_jobs, monkeypatch):
+    copy_chart = SyncManager._copy_chart
+
+    def copy_then_cancel(self, *args, **kwargs):
+        copied = copy_chart(self, *args, **kwargs)
+        manager.cancel_sync_jobs()
+        return copied
+
+    monkeypatch.setattr(SyncManager, '_copy_chart', copy_then_cancel)
+    manager.sync_remotes()
+    manager.wait_for_sync()
+
+    assert finished_jobs[0]['result']['pulled_chart_ids'] == ['c0']
+    assert local_timestamps(manager) == {'c0': 2000, 'c1': 1000, 'c2': 1000}
+
+
+@pytest.mark.parametrize('current_chart_id, reloaded', [('c1', True), ('c2', False)])
+def test_pulled_current_chart_is_checked_for_reload(manager, monkeypatch, current_chart_id, reloaded):
+    monitor = DatabaseMonitor(manager.data_manager)
+    checks = []
+    monkeypatch.setattr(monitor, '_check_current_chart_metadata_change', lambda: checks.append(current_chart_id))
+    manager.data_manager.chart_data['chart_file_path'] = current_chart_id
+
+    manager.sync_remotes()
+    assert checks == []  # Nothing happens on the UI thread before the job reports back
+    manager.wait_for_sync()
+
+    assert checks == ([current_chart_id] if reloaded else [])